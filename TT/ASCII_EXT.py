@@ -1,3 +1,6 @@
+import codecs
+
+
 def create_cp437_to_unicode_map():
     """Create a mapping of CP437 codes to their Unicode equivalents"""
     # Standard ASCII (0-127) maps directly
@@ -24,4 +27,23 @@ def create_cp437_to_unicode_map():
     for i, char in enumerate(cp437_extended):
         cp437_map[i + 128] = char
         
-    return cp437_map
\ No newline at end of file
+    return cp437_map
+
+def create_cp437_decoding_table():
+    """Create a 256-character decoding table from the CP437 map.
+
+    The table is indexed by byte value so it can be handed straight to
+    codecs.charmap_decode, which decodes a whole chunk in one C-level pass.
+    """
+    cp437_map = create_cp437_to_unicode_map()
+    return ''.join(cp437_map.get(i, chr(i)) for i in range(256))
+
+
+CP437_DECODING_TABLE = create_cp437_decoding_table()
+
+
+def decode_cp437(data):
+    """Decode CP437 bytes to text using the precomputed decoding table."""
+    if not isinstance(data, (bytes, bytearray, memoryview)):
+        data = bytes(data)
+    return codecs.charmap_decode(data, 'strict', CP437_DECODING_TABLE)[0]
@@ -0,0 +1,83 @@
+import re
+
+from link_extract import split_links
+
+# A CSI sequence: ESC [ parameters, then a final letter. A sequence cut off
+# at the end of the text has no final letter and is dropped.
+CSI_REGEX = re.compile(r'\x1b\[([\W\d_]*)([^\W\d_]?)')
+
+
+def ansi_runs(text, color_map, blink_tag="blink"):
+    """Split text into (text, tags) runs by applying its SGR codes.
+
+    Runs start with the "normal" tag. color_map maps SGR colour codes to tag
+    names, and blinking text gets the single shared blink_tag. Escape
+    sequences other than SGR are removed.
+    """
+    color_tags = set(color_map.values())
+    runs = []
+    current_tags = ["normal"]
+    tags = ("normal",)
+    pos = 0
+    for match in CSI_REGEX.finditer(text):
+        start = match.start()
+        if start > pos:
+            runs.append((text[pos:start], tags))
+        pos = match.end()
+        if match.group(2) != 'm':
+            continue
+
+        params = match.group(1)
+        codes = params.split(';')
+        if not params or '0' in codes:
+            current_tags = ["normal"]
+        for code in codes:
+            if not code:
+                continue
+            if code == '1':
+                current_tags = ["bright_" + tag if tag in color_tags else tag
+                                for tag in current_tags]
+            elif code == '5':
+                if blink_tag not in current_tags:
+                    current_tags.append(blink_tag)
+            elif code in color_map:
+                current_tags = [t for t in current_tags if t not in color_tags]
+                current_tags.append(color_map[code])
+        tags = tuple(current_tags)
+    if pos < len(text):
+        runs.append((text[pos:], tags))
+    return runs
+
+
+def merge_runs(runs):
+    """Join neighbouring runs that carry the same tags."""
+    merged = []
+    for text, tags in runs:
+        if merged and merged[-1][1] == tags:
+            merged[-1] = (merged[-1][0] + text, tags)
+        else:
+            merged.append((text, tags))
+    return merged
+
+
+def link_runs(runs):
+    """Split URLs out of runs into their own runs carrying the "hyperlink" tag.
+
+    URLs lose trailing punctuation and "www." links gain an http:// prefix,
+    as they always have when shown in the terminal.
+    """
+    result = []
+    for text, tags in runs:
+        for chars, url in split_links(text):
+            result.append((chars, ("hyperlink",) + tags if url else tags))
+    return result
+
+
+def insert_args(runs):
+    """Flatten runs into the chars, tags, chars, tags... arguments of Text.insert."""
+    args = []
+    for text, tags in merge_runs(runs):
+        if text:
+            args.append(text)
+            args.append(tags)
+    return args
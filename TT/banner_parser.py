@@ -0,0 +1,84 @@
+import re
+from collections import namedtuple
+
+from ansi_render import CSI_REGEX
+
+# Result of parsing a room banner.
+#   topic: the room topic, or "" if the banner has none
+#   users: usernames in the order the banner lists them
+BannerInfo = namedtuple('BannerInfo', ['topic', 'users'])
+
+# "Bob, Alice and Carol are here with you." / "Bob is here with you."
+USER_LIST_REGEX = re.compile(r'\s*\b(?:are|is)\s+here\s+with\s+you', re.IGNORECASE)
+
+# Ends the sentence before the user list ("Welcome!", "Topic: (x) ...").
+# A full stop is left out because names such as "Mr. Smith" contain one.
+SENTENCE_END_REGEX = re.compile(r'[!?:)](?:\s+|$)')
+
+# The banner sentences whose full stop does end a sentence:
+# "...MajorLink channel.", "You are in Lobby.", "Topic: (x).", "Topic: x."
+LEAD_IN_REGEX = re.compile(
+    r'(?:\bchannel|\bYou\s+are\s+in\b[^.]*|Topic:\s*(?:\([^)]*\)|[^.(]*))\.(?:\s+|$)',
+    re.IGNORECASE)
+
+TOPIC_REGEX = re.compile(r'Topic:\s*(?:\(([^)]*)\)|([^.]*))')
+INLINE_TOPIC_REGEX = re.compile(r'Topic:\s*$')
+
+_NOT_USERS = {'topic', 'channel'}
+
+
+def parse_banner(lines):
+    """Extract the topic and user list from the lines of a room banner.
+
+    Works for the MajorLink colon, PBX and classic teleconference banners,
+    which all end the user list with "are here with you" (or "is here with
+    you" for a single user). The list is split on commas and its final
+    "and" in one pass, so names containing spaces or @domains are kept
+    whole.
+    """
+    text = " ".join(CSI_REGEX.sub('', line).strip() for line in lines)
+    topic = ""
+    topic_match = TOPIC_REGEX.search(text)
+    if topic_match:
+        topic = (topic_match.group(1) if topic_match.group(1) is not None
+                 else topic_match.group(2)).strip()
+
+    marker = USER_LIST_REGEX.search(text)
+    if not marker:
+        return BannerInfo(topic, [])
+
+    prefix = text[:marker.start()]
+    start = 0
+    for regex in (SENTENCE_END_REGEX, LEAD_IN_REGEX):
+        for match in regex.finditer(prefix):
+            start = max(start, match.end())
+    pieces = _split_user_list(prefix[start:])
+
+    if pieces and INLINE_TOPIC_REGEX.search(prefix[:start]):
+        # "Topic: Music talk Bob and Alice are here with you" - the topic
+        # runs into the list, so only the last word of it is a user
+        words = pieces[0].rsplit(None, 1)
+        topic = words[0] if len(words) > 1 else ""
+        pieces[0] = words[-1]
+
+    users = []
+    for piece in pieces:
+        name = piece.strip(' .,;"')
+        if len(name) > 1 and name.lower() not in _NOT_USERS and name not in users:
+            users.append(name)
+    return BannerInfo(topic, users)
+
+
+def _split_user_list(section):
+    """Split "A, B, and C" / "A, B and C" / "A and B" / "A" into names."""
+    items = section.split(',')
+    last = items.pop().strip()
+    if last.lower().startswith('and '):
+        items.append(last[4:])
+    else:
+        head, sep, tail = last.rpartition(' and ')
+        if sep:
+            items.extend((head, tail))
+        else:
+            items.append(last)
+    return [item.strip() for item in items if item.strip()]
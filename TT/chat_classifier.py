@@ -0,0 +1,108 @@
+import re
+from collections import namedtuple
+
+# Result of classifying a chat line.
+#   kind:      "whisper", "direct", "page", "public_direct" or "regular"
+#   msg_type:  name of the pattern that matched (e.g. "colon_whisper")
+#   recipient: only set for public_direct messages
+#   location:  only set for page notifications
+ChatMessage = namedtuple(
+    'ChatMessage', ['kind', 'msg_type', 'sender', 'recipient', 'body', 'location']
+)
+
+# System messages and noise that are never logged as chat
+SKIP_PATTERNS = [
+    r"You are in", r"Topic:", r"Just press", r"Just type", r"assistance",
+    r"are here with you", r"is here with you", r"^\s*$",
+    r"^\s*:(?!\[).*$",  # Only skip colon lines that DON'T start with :[
+    r"^\s*\(.*\)\s*$", r"\[Type your (?:User-ID|Password)[^]]*:\]",
+    r"Type your (?:User-ID|Password)[^]]*:",
+    r"^\[?(?:Enter|Type)(?: your)? [Pp]assword[^]]*:\]\s*$",
+    r"^\[?(?:Enter|Type)(?: your)? username[^]]*:\]\s*$",
+    r"Action listing for:", r"^>", r"^\*", r"Welcome to", r"Connected to", r"^The "
+]
+
+# All skip patterns folded into one alternation so a line is searched once
+SKIP_REGEX = re.compile('|'.join(f'(?:{p})' for p in SKIP_PATTERNS), re.IGNORECASE)
+
+TIMESTAMP_REGEX = re.compile(r'^\[\d{4}-\d{2}-\d{2}\s+\d{2}:\d{2}:\d{2}\]')
+
+# Message patterns grouped by the first character they can match. Each family
+# is tried in order before the generic patterns, which matches the order the
+# patterns were originally tried in one flat list.
+_CLASSIC_PATTERNS = [
+    ('classic_whisper', r'^\[([^@\]]+(?:@[^\]]+)?)\s*\(whispered(?:\s+to\s+you)?\):\]\s*(.+)$'),
+    ('classic_direct_to_you', r'^\[([^@\]]+(?:@[^\]]+)?)\s*\(to\s+you\):\]\s*(.+)$'),
+    ('classic_public_direct', r'^\[([^@\]]+(?:@[^\]]+)?)\s*\(to\s+([^@\]]+(?:@[^\]]+)?)\):\]\s*(.+)$'),
+    ('classic_regular', r'^\[([^@\]]+(?:@[^\]]+)?):\]\s*(.+)$'),
+]
+
+_COLON_PATTERNS = [
+    ('colon_whisper', r'^:\s*\[([^@\]]+(?:@[^\]]+)?)\]\s*\(whispered(?:\s+to\s+you)?\):\s*(.+)$'),
+    ('colon_direct_to_you', r'^:\s*\[([^@\]]+(?:@[^\]]+)?)\]\s*\(to\s+you\):\s*(.+)$'),
+    ('colon_public_direct', r'^:\s*\[([^@\]]+(?:@[^\]]+)?)\]\s*\(to\s+([^@\]]+(?:@[^\]]+)?)\):\s*(.+)$'),
+    ('colon_regular', r'^:\s*\[([^@\]]+(?:@[^\]]+)?)\]:\s*(.+)$'),
+]
+
+# MajorLink style
+_ALT_PATTERNS = [
+    ('alt_whisper', r'^From\s+([^@\(]+(?:@[^\(]+)?)\s*\(whispered\):\s*(.+)$'),
+    ('alt_direct_to_you', r'^From\s+([^@\(]+(?:@[^\(]+)?)\s*\(to\s+you\):\s*(.+)$'),
+    ('alt_public_direct', r'^From\s+([^@\(]+(?:@[^\(]+)?)\s*\(to\s+([^@\)]+(?:@[^\)]+)?)\):\s*(.+)$'),
+    ('alt_regular', r'^From\s+([^@:]+(?:@[^:]+)?):(?:\s*)(.+)$'),
+]
+
+# PBX-style formats and page notifications; these can start with any
+# character other than whitespace or "@"
+_GENERIC_PATTERNS = [
+    ('pbx_whisper', r'^([^@\s]+(?:@[^\s]+)?)\s+whispers:(?:\s*)(.+)$'),
+    ('pbx_direct', r'^([^@\s]+(?:@[^\s]+)?)\s+says(?:\s+to\s+([^@\s:]+(?:@[^\s:]+)?)):(?:\s*)(.+)$'),
+    ('pbx_regular', r'^([^@\s]+(?:@[^\s]+)?)\s+says:(?:\s*)(.+)$'),
+    ('page_notification', r'([^@\s]+(?:@[^\s]+)?)\s+is\s+paging\s+you\s+from\s+([^:]+):(?:\s*)(.+)$'),
+]
+
+
+def _compile(patterns):
+    return [(msg_type, re.compile(pattern)) for msg_type, pattern in patterns]
+
+
+_GENERIC = _compile(_GENERIC_PATTERNS)
+_DISPATCH = {
+    '[': _compile(_CLASSIC_PATTERNS) + _GENERIC,
+    ':': _compile(_COLON_PATTERNS) + _GENERIC,
+    'F': _compile(_ALT_PATTERNS) + _GENERIC,
+    '@': [],
+}
+
+
+def is_noise(line):
+    """Return True if the line is a system message or noise, not chat."""
+    return SKIP_REGEX.search(line) is not None
+
+
+def has_timestamp(line):
+    """Return True if the line already starts with a [YYYY-mm-dd HH:MM:SS] stamp."""
+    return TIMESTAMP_REGEX.match(line) is not None
+
+
+def classify_message(line):
+    """Classify a clean chat line, returning a ChatMessage or None if no pattern matches."""
+    if not line:
+        return None
+    for msg_type, regex in _DISPATCH.get(line[0], _GENERIC):
+        match = regex.match(line)
+        if match:
+            return _build_message(msg_type, match)
+    return None
+
+
+def _build_message(msg_type, match):
+    sender = match.group(1).strip()
+    if 'whisper' in msg_type or 'direct_to_you' in msg_type:
+        kind = "whisper" if "whisper" in msg_type else "direct"
+        return ChatMessage(kind, msg_type, sender, None, match.group(2), None)
+    if msg_type == 'page_notification':
+        return ChatMessage("page", msg_type, sender, None, match.group(3), match.group(2).strip())
+    if 'public_direct' in msg_type or msg_type == 'pbx_direct':
+        return ChatMessage("public_direct", msg_type, sender, match.group(2).strip(), match.group(3), None)
+    return ChatMessage("regular", msg_type, sender, None, match.group(2), None)
@@ -0,0 +1,394 @@
+import json
+import os
+import re
+import sqlite3
+import time
+
+from debug_log import get_logger
+
+log = get_logger("persistence")
+
+# Messages are stored with a leading "[YYYY-mm-dd HH:MM:SS] " stamp when the
+# client added one; it gives migrated entries their original ordering.
+STAMP_REGEX = re.compile(r'^\[(\d{4}-\d{2}-\d{2}\s+\d{2}:\d{2}:\d{2})\]')
+
+
+# Shapes of the lines written by parse_and_save_chatlog_message, used to
+# recover kind/recipient for messages imported without them
+FORMATTED_REGEX = re.compile(
+    r'^(?:\[[^\]]*\]\s*)?(?:(?P<page>Page from)|From)\s+.*?'
+    r'(?:\((?P<tag>whisper|direct|to\s+(?P<recipient>[^)]+))\))?:\s'
+)
+
+
+def parse_stamp(message):
+    """Return the epoch time of a message's leading timestamp, or 0.0 if it has none."""
+    match = STAMP_REGEX.match(message)
+    if not match:
+        return 0.0
+    try:
+        return time.mktime(time.strptime(match.group(1), "%Y-%m-%d %H:%M:%S"))
+    except (ValueError, OverflowError):
+        return 0.0
+
+
+def infer_kind(message):
+    """Return (kind, recipient) for a formatted chatlog line."""
+    match = FORMATTED_REGEX.match(message)
+    if not match:
+        return None, None
+    if match.group('page'):
+        return "page", None
+    tag = match.group('tag')
+    if tag in ("whisper", "direct"):
+        return tag, None
+    if match.group('recipient'):
+        return "public_direct", match.group('recipient').strip()
+    return "regular", None
+
+
+def fts_query(text):
+    """Turn free text into an FTS5 query that matches all of its words."""
+    return ' '.join('"{}"'.format(word.replace('"', '""')) for word in text.split())
+
+
+class ChatlogStore:
+    """Append-only chatlog kept in SQLite with an index on username.
+
+    Each saved message is a single INSERT, so the cost of logging a line does
+    not grow with the size of the history. A legacy chatlog.json is imported
+    once on first open and renamed to chatlog.json.bak.
+
+    Messages carry sender, recipient, kind and timestamp columns, all indexed,
+    and message bodies are indexed with FTS5 for search() when the SQLite build
+    has it (falling back to LIKE otherwise).
+
+    Retention is bounded by max_bytes (total message bytes), max_messages_per_user
+    and max_age_days; a limit of 0 or None disables it. The oldest messages are
+    evicted first. Total bytes and per-user counts are tracked incrementally.
+    """
+
+    # How often (seconds) append() checks the age limit
+    AGE_CHECK_INTERVAL = 60.0
+
+    def __init__(self, path="chatlog.db", legacy_path="chatlog.json",
+                 max_bytes=None, max_messages_per_user=None, max_age_days=None):
+        self.path = path
+        self.max_bytes = max_bytes
+        self.max_messages_per_user = max_messages_per_user
+        self.max_age_days = max_age_days
+        self.total_bytes = 0
+        self.user_counts = {}
+        self._last_age_check = 0.0
+        self.conn = sqlite3.connect(path, check_same_thread=False)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self.conn.executescript("""
+            CREATE TABLE IF NOT EXISTS messages (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                username TEXT NOT NULL,
+                message TEXT NOT NULL,
+                created REAL NOT NULL,
+                size INTEGER NOT NULL,
+                recipient TEXT,
+                kind TEXT
+            );
+            CREATE TABLE IF NOT EXISTS meta (
+                key TEXT PRIMARY KEY,
+                value TEXT
+            );
+        """)
+        self._upgrade_schema()
+        self.conn.executescript("""
+            CREATE INDEX IF NOT EXISTS idx_messages_username ON messages(username, created);
+            CREATE INDEX IF NOT EXISTS idx_messages_created ON messages(created);
+            CREATE INDEX IF NOT EXISTS idx_messages_recipient ON messages(recipient, created);
+            CREATE INDEX IF NOT EXISTS idx_messages_kind ON messages(kind, created);
+        """)
+        self.has_fts = self._create_fts()
+        self.conn.commit()
+        if legacy_path:
+            self.migrate_legacy(legacy_path)
+        self._load_totals()
+        self.enforce_limits()
+
+    def migrate_legacy(self, legacy_path):
+        """Import a chatlog.json once, then set it aside."""
+        if not os.path.exists(legacy_path) or self._get_meta("legacy_migrated"):
+            return
+        try:
+            rows = self._read_json(legacy_path)
+        except (OSError, ValueError) as e:
+            log.error("Error reading legacy chatlog %s: %s", legacy_path, e)
+            return
+        # The rows and the migrated flag commit together, so a crash part way
+        # through can never import the legacy log twice
+        with self.conn:
+            self._insert_rows(rows)
+            self._set_meta("legacy_migrated", str(time.time()))
+        self._load_totals()
+        count = len(rows)
+        log.debug("Migrated %s chatlog messages from %s", count, legacy_path)
+
+        try:
+            os.replace(legacy_path, legacy_path + ".bak")
+        except OSError as e:
+            log.error("Could not rename legacy chatlog %s: %s", legacy_path, e)
+
+    def import_json(self, path):
+        """Import a JSON chatlog ({username: [messages]}) and return the number of messages added."""
+        rows = self._read_json(path)
+        with self.conn:
+            self._insert_rows(rows)
+        self._load_totals()
+        return len(rows)
+
+    def _read_json(self, path):
+        """Read a JSON chatlog into rows ready for _insert_rows."""
+        with open(path, "r") as file:
+            chatlog = json.load(file)
+
+        rows = []
+        for username, messages in chatlog.items():
+            for message in messages:
+                kind, recipient = infer_kind(message)
+                rows.append((username, message, parse_stamp(message),
+                             len(message.encode('utf-8')), recipient, kind))
+        return rows
+
+    def _insert_rows(self, rows):
+        self.conn.executemany(
+            "INSERT INTO messages (username, message, created, size, recipient, kind) "
+            "VALUES (?, ?, ?, ?, ?, ?)", rows)
+
+    def append(self, username, message, created=None, kind=None, recipient=None):
+        """Append one message for username, evicting old messages past the limits."""
+        if created is None:
+            created = time.time()
+        size = len(message.encode('utf-8'))
+        with self.conn:
+            self.conn.execute(
+                "INSERT INTO messages (username, message, created, size, recipient, kind) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                (username, message, created, size, recipient, kind))
+            self.total_bytes += size
+            self.user_counts[username] = self.user_counts.get(username, 0) + 1
+
+            if self.max_messages_per_user and self.user_counts[username] > self.max_messages_per_user:
+                self._evict_user_excess(username)
+            if self.max_bytes and self.total_bytes > self.max_bytes:
+                self._evict_to_size()
+            if self.max_age_days and time.time() - self._last_age_check >= self.AGE_CHECK_INTERVAL:
+                self._evict_expired()
+
+    def set_limits(self, max_bytes=None, max_messages_per_user=None, max_age_days=None):
+        """Change the retention limits and apply them immediately."""
+        self.max_bytes = max_bytes
+        self.max_messages_per_user = max_messages_per_user
+        self.max_age_days = max_age_days
+        self.enforce_limits()
+
+    def enforce_limits(self):
+        """Evict messages until every configured limit is met."""
+        with self.conn:
+            if self.max_age_days:
+                self._evict_expired()
+            if self.max_messages_per_user:
+                for username, count in list(self.user_counts.items()):
+                    if count > self.max_messages_per_user:
+                        self._evict_user_excess(username)
+            if self.max_bytes and self.total_bytes > self.max_bytes:
+                self._evict_to_size()
+
+    def usernames(self):
+        """Return usernames in the order they first appeared in the log."""
+        rows = self.conn.execute(
+            "SELECT username FROM messages GROUP BY username ORDER BY MIN(id)")
+        return [row[0] for row in rows]
+
+    def messages(self, username=None):
+        """Return (username, message) pairs in chronological order, optionally for one user."""
+        if username is None:
+            rows = self.conn.execute(
+                "SELECT username, message FROM messages ORDER BY created, id")
+        else:
+            rows = self.conn.execute(
+                "SELECT username, message FROM messages WHERE username = ? ORDER BY created, id",
+                (username,))
+        return rows.fetchall()
+
+    def page(self, username=None, before=None, limit=200):
+        """Return up to limit (created, id, username, message) rows older than before, oldest first.
+
+        before is the (created, id) of the oldest row already shown, or None
+        for the newest page. Rows come straight off the created index, so a
+        page costs the same however large the log is.
+        """
+        clauses = []
+        params = []
+        if username is not None:
+            clauses.append("username = ?")
+            params.append(username)
+        if before is not None:
+            # created <= ? lets SQLite seek the index; the OR breaks ties on id
+            clauses.append("created <= ? AND (created < ? OR id < ?)")
+            params.extend((before[0], before[0], before[1]))
+        where = f"WHERE {' AND '.join(clauses)} " if clauses else ""
+        params.append(limit)
+        rows = self.conn.execute(
+            f"SELECT created, id, username, message FROM messages {where}"
+            "ORDER BY created DESC, id DESC LIMIT ?", params).fetchall()
+        rows.reverse()
+        return rows
+
+    def search(self, text, username=None, kind=None, limit=500):
+        """Return the newest (username, message) pairs matching all words of text, oldest first.
+
+        With FTS5 the index is walked newest rowid first and stops after limit
+        matches, so common words stay fast on large logs.
+        """
+        if not text.split():
+            return []
+        clauses = []
+        params = []
+        if self.has_fts:
+            source = "messages_fts f JOIN messages m ON m.id = f.rowid"
+            clauses.append("messages_fts MATCH ?")
+            params.append(fts_query(text))
+            order = "f.rowid DESC"
+        else:
+            source = "messages m"
+            for word in text.split():
+                clauses.append("m.message LIKE ? ESCAPE '\\'")
+                escaped = word.replace('\\', '\\\\').replace('%', '\\%').replace('_', '\\_')
+                params.append(f"%{escaped}%")
+            order = "m.id DESC"
+        if username is not None:
+            clauses.append("m.username = ?")
+            params.append(username)
+        if kind is not None:
+            clauses.append("m.kind = ?")
+            params.append(kind)
+        params.append(limit)
+        rows = self.conn.execute(
+            f"SELECT m.created, m.id, m.username, m.message FROM {source} "
+            f"WHERE {' AND '.join(clauses)} ORDER BY {order} LIMIT ?", params).fetchall()
+        rows.sort()
+        return [(username, message) for _, _, username, message in rows]
+
+    def delete_user(self, username):
+        """Remove every message logged for username."""
+        with self.conn:
+            row = self.conn.execute(
+                "SELECT COALESCE(SUM(size), 0) FROM messages WHERE username = ?", (username,)).fetchone()
+            self.conn.execute("DELETE FROM messages WHERE username = ?", (username,))
+        self.total_bytes -= row[0]
+        self.user_counts.pop(username, None)
+
+    def close(self):
+        self.conn.close()
+
+    def _upgrade_schema(self):
+        """Add the recipient/kind columns to databases created before they existed."""
+        columns = {row[1] for row in self.conn.execute("PRAGMA table_info(messages)")}
+        if "kind" in columns:
+            return
+        self.conn.execute("ALTER TABLE messages ADD COLUMN recipient TEXT")
+        self.conn.execute("ALTER TABLE messages ADD COLUMN kind TEXT")
+        rows = self.conn.execute("SELECT id, message FROM messages").fetchall()
+        self.conn.executemany(
+            "UPDATE messages SET kind = ?, recipient = ? WHERE id = ?",
+            [infer_kind(message) + (row_id,) for row_id, message in rows])
+
+    def _create_fts(self):
+        """Create the FTS5 index and its sync triggers; return False if FTS5 is unavailable."""
+        exists = self.conn.execute(
+            "SELECT 1 FROM sqlite_master WHERE name = 'messages_fts'").fetchone()
+        try:
+            self.conn.executescript("""
+                CREATE VIRTUAL TABLE IF NOT EXISTS messages_fts
+                    USING fts5(message, content='messages', content_rowid='id');
+                CREATE TRIGGER IF NOT EXISTS messages_fts_insert AFTER INSERT ON messages BEGIN
+                    INSERT INTO messages_fts(rowid, message) VALUES (new.id, new.message);
+                END;
+                CREATE TRIGGER IF NOT EXISTS messages_fts_delete AFTER DELETE ON messages BEGIN
+                    INSERT INTO messages_fts(messages_fts, rowid, message)
+                        VALUES ('delete', old.id, old.message);
+                END;
+                CREATE TRIGGER IF NOT EXISTS messages_fts_update AFTER UPDATE OF message ON messages BEGIN
+                    INSERT INTO messages_fts(messages_fts, rowid, message)
+                        VALUES ('delete', old.id, old.message);
+                    INSERT INTO messages_fts(rowid, message) VALUES (new.id, new.message);
+                END;
+            """)
+        except sqlite3.OperationalError as e:
+            log.info("FTS5 unavailable, chatlog search will use LIKE: %s", e)
+            return False
+        if not exists:
+            # Index messages written before the FTS table existed
+            self.conn.execute("INSERT INTO messages_fts(messages_fts) VALUES ('rebuild')")
+        return True
+
+    def _load_totals(self):
+        rows = self.conn.execute(
+            "SELECT username, COUNT(*), SUM(size) FROM messages GROUP BY username")
+        self.user_counts = {}
+        self.total_bytes = 0
+        for username, count, size in rows:
+            self.user_counts[username] = count
+            self.total_bytes += size
+
+    def _delete_rows(self, rows):
+        """Delete (id, username, size) rows and update the running totals."""
+        self.conn.executemany("DELETE FROM messages WHERE id = ?", [(row[0],) for row in rows])
+        for _, username, size in rows:
+            self.total_bytes -= size
+            count = self.user_counts.get(username, 0) - 1
+            if count > 0:
+                self.user_counts[username] = count
+            else:
+                self.user_counts.pop(username, None)
+
+    def _evict_user_excess(self, username):
+        excess = self.user_counts.get(username, 0) - self.max_messages_per_user
+        if excess <= 0:
+            return
+        rows = self.conn.execute(
+            "SELECT id, username, size FROM messages WHERE username = ? "
+            "ORDER BY created, id LIMIT ?", (username, excess)).fetchall()
+        self._delete_rows(rows)
+
+    def _evict_to_size(self, batch_size=500):
+        while self.total_bytes > self.max_bytes:
+            rows = self.conn.execute(
+                "SELECT id, username, size FROM messages ORDER BY created, id LIMIT ?",
+                (batch_size,)).fetchall()
+            if not rows:
+                self.total_bytes = 0
+                return
+            victims = []
+            freed = 0
+            for row in rows:
+                victims.append(row)
+                freed += row[2]
+                if self.total_bytes - freed <= self.max_bytes:
+                    break
+            self._delete_rows(victims)
+
+    def _evict_expired(self):
+        self._last_age_check = time.time()
+        cutoff = self._last_age_check - self.max_age_days * 86400
+        # Messages without a timestamp (created == 0) are never aged out
+        rows = self.conn.execute(
+            "SELECT id, username, size FROM messages WHERE created > 0 AND created < ?",
+            (cutoff,)).fetchall()
+        if rows:
+            self._delete_rows(rows)
+
+    def _get_meta(self, key):
+        row = self.conn.execute("SELECT value FROM meta WHERE key = ?", (key,)).fetchone()
+        return row[0] if row else None
+
+    def _set_meta(self, key, value):
+        self.conn.execute(
+            "INSERT OR REPLACE INTO meta (key, value) VALUES (?, ?)", (key, value))
@@ -0,0 +1,72 @@
+import atexit
+import logging
+import logging.handlers
+import queue
+import sys
+
+# Every logger is a child of "tt", one per subsystem
+ROOT_LOGGER = "tt"
+SUBSYSTEMS = ("net", "parse", "render", "media", "persistence")
+
+CONSOLE_FORMAT = "[%(levelname)s] %(name)s: %(message)s"
+FILE_FORMAT = "%(asctime)s [%(levelname)s] %(name)s: %(message)s"
+
+_listener = None
+
+
+def get_logger(subsystem):
+    """Return the logger for a subsystem, e.g. get_logger("net")."""
+    return logging.getLogger(f"{ROOT_LOGGER}.{subsystem}")
+
+
+def configure(levels=None, default_level="INFO", log_file=None,
+              max_bytes=1024 * 1024, backup_count=3):
+    """Set per-subsystem levels and start writing log records on a background thread.
+
+    levels maps a subsystem name to a level name ("DEBUG", "INFO", ...);
+    subsystems not listed use default_level. Records are handed to a
+    QueueListener thread, so the caller never waits on the console or
+    disk. When log_file is set, records are also written to a rotating
+    file of max_bytes with backup_count old copies.
+    """
+    global _listener
+    shutdown()
+    levels = levels or {}
+    for subsystem in SUBSYSTEMS:
+        set_level(subsystem, levels.get(subsystem, default_level))
+
+    console = logging.StreamHandler(sys.stdout)
+    console.setFormatter(logging.Formatter(CONSOLE_FORMAT))
+    handlers = [console]
+    if log_file:
+        try:
+            file_handler = logging.handlers.RotatingFileHandler(
+                log_file, maxBytes=max_bytes, backupCount=backup_count, encoding="utf-8")
+            file_handler.setFormatter(logging.Formatter(FILE_FORMAT))
+            handlers.append(file_handler)
+        except OSError as e:
+            print(f"Could not open log file {log_file}: {e}")
+
+    records = queue.SimpleQueue()
+    root = logging.getLogger(ROOT_LOGGER)
+    root.handlers = [logging.handlers.QueueHandler(records)]
+    root.propagate = False
+    _listener = logging.handlers.QueueListener(records, *handlers)
+    _listener.start()
+
+
+def set_level(subsystem, level):
+    """Change the level of one subsystem at runtime."""
+    get_logger(subsystem).setLevel(level.upper() if isinstance(level, str) else level)
+
+
+def shutdown():
+    """Write out queued records and stop the background thread."""
+    global _listener
+    if _listener:
+        _listener.stop()
+        _listener = None
+
+
+# Flush whatever is still queued when the interpreter exits
+atexit.register(shutdown)
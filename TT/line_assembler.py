@@ -0,0 +1,70 @@
+class LineAssembler:
+    """Split a stream of decoded text chunks into complete lines.
+
+    Only the newly arrived chunk is scanned on each feed; the unterminated
+    tail is kept as a list of pieces so a long newline-free stream is not
+    rescanned or re-copied for every chunk. A "\\r\\n" pair split across two
+    chunks is treated as a single line break, and a partial line longer than
+    max_line_length is emitted as a line of its own.
+    """
+
+    def __init__(self, max_line_length=65536):
+        self.max_line_length = max_line_length
+        self._pieces = []
+        self._length = 0
+        self._pending_cr = False
+
+    def feed(self, data):
+        """Add a chunk of text and return the list of completed lines."""
+        if not data:
+            return []
+
+        # The previous chunk ended in "\r" which was already treated as a
+        # line break, so the "\n" completing that "\r\n" must be dropped.
+        if self._pending_cr and data[0] == '\n':
+            data = data[1:]
+        self._pending_cr = data.endswith('\r')
+
+        parts = data.replace('\r\n', '\n').replace('\r', '\n').split('\n')
+        lines = []
+        if len(parts) > 1:
+            if self._pieces:
+                self._pieces.append(parts[0])
+                lines.append(''.join(self._pieces))
+                self._pieces = []
+                self._length = 0
+            else:
+                lines.append(parts[0])
+            lines.extend(parts[1:-1])
+
+        tail = parts[-1]
+        if tail:
+            self._pieces.append(tail)
+            self._length += len(tail)
+            if self._length > self.max_line_length:
+                lines.extend(self._flush_overlong())
+        return lines
+
+    def _flush_overlong(self):
+        """Emit max_line_length sized lines until the partial line fits the cap."""
+        buffered = ''.join(self._pieces)
+        limit = self.max_line_length
+        cut = len(buffered) - len(buffered) % limit
+        if cut == len(buffered):
+            cut -= limit
+        lines = [buffered[i:i + limit] for i in range(0, cut, limit)]
+        rest = buffered[cut:]
+        self._pieces = [rest] if rest else []
+        self._length = len(rest)
+        return lines
+
+    @property
+    def partial(self):
+        """The buffered, not yet terminated, line."""
+        return ''.join(self._pieces)
+
+    def reset(self):
+        """Discard any buffered partial line."""
+        self._pieces = []
+        self._length = 0
+        self._pending_cr = False
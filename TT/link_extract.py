@@ -0,0 +1,92 @@
+import re
+from functools import lru_cache
+
+URL_REGEX = re.compile(r'(https?://[^\s<>"\']+|www\.[^\s<>"\']+)')
+
+# Characters that usually end a sentence rather than a URL
+TRAILING_PUNCTUATION = '.,;:!?)]}\'"'
+_CLOSERS = {')': '(', ']': '[', '}': '{'}
+
+
+def may_contain_url(text):
+    """Cheap check that lets callers skip the regex for text without links."""
+    return 'http' in text or 'www.' in text
+
+
+def strip_trailing(url):
+    """Strip trailing punctuation from a matched URL.
+
+    A closing bracket is kept when the URL opened it itself, so links like
+    https://en.wikipedia.org/wiki/Tk_(software) survive intact.
+    """
+    while url and url[-1] in TRAILING_PUNCTUATION:
+        closer = url[-1]
+        opener = _CLOSERS.get(closer)
+        if opener and url.count(opener) >= url.count(closer):
+            break
+        url = url[:-1]
+    return url
+
+
+def is_link(stripped):
+    """Return False for a stripped match with nothing after its scheme or "www"."""
+    return stripped not in ('', 'www') and not stripped.endswith('://')
+
+
+def normalize_url(url):
+    """Strip trailing punctuation from a matched URL and give www. links a scheme."""
+    url = strip_trailing(url)
+    if url.startswith('www.'):
+        url = 'http://' + url
+    return url
+
+
+@lru_cache(maxsize=1024)
+def split_links(text):
+    """Split text into (chars, url) pieces, url being None for plain text.
+
+    Link pieces carry the normalized URL in place of the matched text, as
+    the terminal and chat views have always displayed them; punctuation
+    stripped from the end of a match stays in the text. Results are cached
+    because the same lines are often rendered in several views.
+    """
+    if not may_contain_url(text):
+        return ((text, None),) if text else ()
+    pieces = []
+    last_end = 0
+    for match in URL_REGEX.finditer(text):
+        start = match.start()
+        if start > last_end:
+            pieces.append((text[last_end:start], None))
+        stripped = strip_trailing(match.group())
+        if not is_link(stripped):
+            # Nothing left but the scheme or a bare "www."
+            pieces.append((match.group(), None))
+            last_end = match.end()
+            continue
+        url = normalize_url(stripped)
+        pieces.append((url, url))
+        last_end = start + len(stripped)
+    if last_end < len(text):
+        pieces.append((text[last_end:], None))
+    return tuple(pieces)
+
+
+def link_spans(text):
+    """Return the (start, end) offsets of the links in text, leaving the text itself alone.
+
+    Used where text must keep its width, such as rows of the full-screen grid.
+    """
+    if not may_contain_url(text):
+        return []
+    spans = []
+    for match in URL_REGEX.finditer(text):
+        stripped = strip_trailing(match.group())
+        if is_link(stripped):
+            spans.append((match.start(), match.start() + len(stripped)))
+    return spans
+
+
+def extract_urls(text):
+    """Return the normalized URLs found in text, in order."""
+    return [url for _, url in split_links(text) if url]
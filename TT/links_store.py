@@ -0,0 +1,189 @@
+import bisect
+import json
+import os
+import time
+from collections import OrderedDict
+
+from debug_log import get_logger
+
+log = get_logger("persistence")
+
+# Labels older versions stored in place of a sender for links seen while
+# rendering or clicking; they are not usernames and are dropped on load
+PSEUDO_SENDERS = {"Unknown", "terminal_click", "directed_message", "mini_terminal",
+                  "mini_terminal_click"}
+
+
+class LinksStore:
+    """Hyperlink history keyed by URL, persisted as an append-only JSON-lines journal.
+
+    Each URL has one record with first_seen, last_seen, count and senders.
+    Records live in memory; changed records are appended to the journal by
+    flush(), and the last line written for a URL wins when the journal is
+    loaded. The journal is rewritten compactly once it holds more than
+    compact_ratio lines per record. A legacy hyperlinks.json list is folded
+    into records on first load and renamed to hyperlinks.json.bak.
+
+    count is the number of distinct messages the URL appeared in: the last
+    recent_messages (url, message) pairs are remembered, so the same message
+    parsed or rendered again is not counted twice.
+
+    URLs are also kept in a list sorted by (last_seen, url), updated as
+    sightings are recorded, so page() returns the newest links without
+    sorting the whole history.
+    """
+
+    def __init__(self, path="hyperlinks.jsonl", legacy_path="hyperlinks.json", compact_ratio=4,
+                 recent_messages=512):
+        self.path = path
+        self.compact_ratio = compact_ratio
+        self._recent_limit = recent_messages
+        self._recent_messages = OrderedDict()
+        self.links = {}
+        self._order = []
+        self.dirty = set()
+        self.journal_lines = 0
+        self.load()
+        if legacy_path and not os.path.exists(path):
+            self.migrate_legacy(legacy_path)
+
+    def load(self):
+        """Load records from the journal."""
+        self.links = {}
+        self.journal_lines = 0
+        if not os.path.exists(self.path):
+            return
+        try:
+            with open(self.path, "r", encoding="utf-8") as file:
+                for line in file:
+                    line = line.strip()
+                    if not line:
+                        continue
+                    self.journal_lines += 1
+                    try:
+                        record = json.loads(line)
+                    except ValueError:
+                        # A torn final line from an interrupted write
+                        continue
+                    if record.get("url"):
+                        record["senders"] = [sender for sender in record.get("senders", [])
+                                             if sender not in PSEUDO_SENDERS]
+                        self.links[record["url"]] = record
+        except OSError as e:
+            log.error("Error loading links history: %s", e)
+        self._order = sorted((record["last_seen"], url) for url, record in self.links.items())
+
+    def migrate_legacy(self, legacy_path):
+        """Fold a hyperlinks.json list of {url, sender, timestamp} entries into records."""
+        if not os.path.exists(legacy_path):
+            return
+        try:
+            with open(legacy_path, "r") as file:
+                entries = json.load(file)
+        except (OSError, ValueError) as e:
+            log.error("Error reading legacy links history %s: %s", legacy_path, e)
+            return
+
+        for entry in entries:
+            url = entry.get("url", "")
+            if url and url != "http://":
+                self.record(url, entry.get("sender"), entry.get("timestamp", ""))
+        self.compact()
+        log.debug("Migrated %s links into %s records from %s", len(entries), len(self.links), legacy_path)
+
+        try:
+            os.replace(legacy_path, legacy_path + ".bak")
+        except OSError as e:
+            log.error("Could not rename legacy links history %s: %s", legacy_path, e)
+
+    def record(self, url, sender=None, timestamp=None, message=None):
+        """Count a sighting of url from sender; return True if the URL is new.
+
+        When message is given and the same (url, message) pair was recorded
+        recently, nothing changes. sender is only kept when it is a username.
+        """
+        if message is not None:
+            key = (url, message)
+            if key in self._recent_messages:
+                self._recent_messages.move_to_end(key)
+                return False
+            self._recent_messages[key] = True
+            if len(self._recent_messages) > self._recent_limit:
+                self._recent_messages.popitem(last=False)
+        if timestamp is None:
+            timestamp = time.strftime("[%Y-%m-%d %H:%M:%S]")
+        record = self.links.get(url)
+        is_new = record is None
+        if is_new:
+            record = {"url": url, "first_seen": timestamp, "last_seen": timestamp,
+                      "count": 0, "senders": []}
+            self.links[url] = record
+            bisect.insort(self._order, (timestamp, url))
+        record["count"] += 1
+        if timestamp > record["last_seen"]:
+            del self._order[bisect.bisect_left(self._order, (record["last_seen"], url))]
+            record["last_seen"] = timestamp
+            bisect.insort(self._order, (timestamp, url))
+        if sender and sender not in PSEUDO_SENDERS and sender not in record["senders"]:
+            record["senders"].append(sender)
+        self.dirty.add(url)
+        return is_new
+
+    def ensure(self, url, sender=None):
+        """Record url only if it has never been seen; return True if it was added.
+
+        Used by render paths that may show the same text more than once.
+        """
+        if url in self.links:
+            return False
+        return self.record(url, sender)
+
+    def recent(self):
+        """Return records ordered by most recent sighting first."""
+        return self.page(0, len(self._order))
+
+    def page(self, offset=0, limit=50):
+        """Return limit records, most recent sighting first, skipping the offset newest."""
+        end = len(self._order) - offset
+        start = max(0, end - limit)
+        if end <= start:
+            return []
+        return [self.links[url] for _, url in reversed(self._order[start:end])]
+
+    def flush(self):
+        """Append changed records to the journal, compacting it when it has grown too long."""
+        if not self.dirty:
+            return
+        if self.journal_lines + len(self.dirty) > self.compact_ratio * max(len(self.links), 16):
+            self.compact()
+            return
+        try:
+            with open(self.path, "a", encoding="utf-8") as file:
+                for url in self.dirty:
+                    record = self.links.get(url)
+                    if record:
+                        file.write(json.dumps(record) + "\n")
+                        self.journal_lines += 1
+            self.dirty.clear()
+        except OSError as e:
+            log.error("Error saving links history: %s", e)
+
+    def compact(self):
+        """Rewrite the journal with exactly one line per record."""
+        temp_path = self.path + ".tmp"
+        try:
+            with open(temp_path, "w", encoding="utf-8") as file:
+                for record in self.links.values():
+                    file.write(json.dumps(record) + "\n")
+            os.replace(temp_path, self.path)
+            self.journal_lines = len(self.links)
+            self.dirty.clear()
+        except OSError as e:
+            log.error("Error compacting links history: %s", e)
+
+    def clear(self):
+        """Forget every stored link."""
+        self.links = {}
+        self._order = []
+        self._recent_messages.clear()
+        self.compact()
@@ -7,6 +7,7 @@ import time
 import queue
 import re
 import json
+import collections
 import os
 import webbrowser
 import sys
@@ -44,9 +45,22 @@ import requests
 from io import BytesIO
 import winsound  # Import winsound for playing sound effects on Windows
 from tkinter import simpledialog  # Import simpledialog for input dialogs
-import random
-from ASCII_EXT import create_cp437_to_unicode_map  # Import the function from ASCII_EXT.py
+import zlib
+from ASCII_EXT import create_cp437_to_unicode_map, decode_cp437  # Import the functions from ASCII_EXT.py
 from init_config import init_config_files, verify_sound_files  # Add this line
+from throughput import LatencyCounter, ThroughputCounter
+from line_assembler import LineAssembler
+from chat_classifier import classify_message, has_timestamp, is_noise
+from chatlog_store import ChatlogStore
+from links_store import LinksStore
+from ansi_render import CSI_REGEX, ansi_runs, insert_args, link_runs
+from vt_screen import VTScreen, color_hex
+from link_extract import extract_urls, link_spans, split_links
+from outbound_queue import OutboundQueue
+from state_store import StateStore
+from banner_parser import parse_banner
+from presence import PresenceIndex
+import debug_log
 import traceback
   # Add VLC for audio stream playback
 try:
@@ -68,6 +82,22 @@ try:
 except ImportError:
     enchant = None
 
+net_log = debug_log.get_logger("net")
+parse_log = debug_log.get_logger("parse")
+render_log = debug_log.get_logger("render")
+media_log = debug_log.get_logger("media")
+persistence_log = debug_log.get_logger("persistence")
+
+# Pastel member bubble colours; each username always maps to the same entry
+# Most Tk tags the full-screen grid keeps, one per cell attribute in use;
+# the least recently used is deleted to make room for a new one
+VT_TAG_LIMIT = 512
+
+MEMBER_PALETTE = [
+    "#f4a6a6", "#f4c7a6", "#f4e7a6", "#d4f4a6", "#a6f4b5", "#a6f4e1",
+    "#a6dcf4", "#a6b8f4", "#c3a6f4", "#e6a6f4", "#f4a6d2", "#c8c8c8",
+]
+
 
 ###############################################################################
 #                         Teleconference Terminal
@@ -103,7 +133,7 @@ class BBSTerminalApp:
             self.auto_logon_port = self.port.get()
             self.auto_logon_attempts = 0
         
-            print("[DEBUG] Auto-logon: Starting auto-reconnect sequence (waiting 5 seconds)")
+            net_log.debug("Auto-logon: Starting auto-reconnect sequence (waiting 5 seconds)")
             # First attempt after 5 seconds
             self.master.after(5000, self.attempt_auto_reconnect)
 
@@ -116,10 +146,10 @@ class BBSTerminalApp:
         
         # Cap at 999 attempts
         if self.auto_logon_attempts > 999:
-            print("[DEBUG] Auto-logon: Maximum attempts reached (999)")
+            net_log.debug("Auto-logon: Maximum attempts reached (999)")
             return
         
-        print(f"[DEBUG] Auto-logon: Reconnect attempt {self.auto_logon_attempts}")
+        net_log.debug("Auto-logon: Reconnect attempt %s", self.auto_logon_attempts)
         
         # Attempt to connect using the existing connection mechanism
         self.host.set(self.auto_logon_host)
@@ -142,7 +172,7 @@ class BBSTerminalApp:
         if not self.connected and self.auto_logon_enabled.get():
             self.master.after(3000, self.attempt_auto_reconnect)
         else:
-            print("[DEBUG] Auto-logon: Connection established or disabled, stopping reconnection attempts")
+            net_log.debug("Auto-logon: Connection established or disabled, stopping reconnection attempts")
             self.auto_logon_attempts = 0
 
     def check_auto_login(self):
@@ -150,7 +180,7 @@ class BBSTerminalApp:
             if not self.connected or not self.auto_logon_enabled.get():
                 return
         
-            print("[DEBUG] Auto-logon: Connected, starting auto-login sequence")
+            net_log.debug("Auto-logon: Connected, starting auto-login sequence")
             self.execute_auto_login_sequence()
 
     def execute_auto_login_sequence(self):
@@ -162,16 +192,16 @@ class BBSTerminalApp:
             username = self.load_username()
             password = self.load_password()
         
-            print("[DEBUG] Auto-logon: Sending username")
+            net_log.debug("Auto-logon: Sending username")
             # Send username
             self.master.after(0, lambda: self.send_custom_message(username))
         
             # Send password after 1 second
-            print("[DEBUG] Auto-logon: Sending password in 1 second")
+            net_log.debug("Auto-logon: Sending password in 1 second")
             self.master.after(1000, lambda: self.send_custom_message(password))
         
             # Send enter keystroke after another 1 second
-            print("[DEBUG] Auto-logon: Sending enter keystroke in 2 seconds")
+            net_log.debug("Auto-logon: Sending enter keystroke in 2 seconds")
             self.master.after(2000, lambda: self.send_custom_message("\r\n"))
 
 
@@ -192,13 +222,13 @@ class BBSTerminalApp:
         # Add panel width setting
         self.panel_width = 130  # Fixed width for side panels
 
-        print(f"[DEBUG] Chat sound path: {self.chat_sound_file}")
-        print(f"[DEBUG] Directed sound path: {self.directed_sound_file}")
+        media_log.debug("Chat sound path: %s", self.chat_sound_file)
+        media_log.debug("Directed sound path: %s", self.directed_sound_file)
         
 
         # Initialize forgotten users tracking
         self.forgotten_users = set()
-        print("[DEBUG] Forgotten users set initialized")
+        parse_log.debug("Forgotten users set initialized")
 
         # Add at the start of __init__
         self.show_preview_frame = tk.BooleanVar(value=True)  # Default to visible
@@ -265,8 +295,8 @@ class BBSTerminalApp:
         self.stop_event = threading.Event()  # signals background thread to stop
         self.connected = False
 
-        # Buffer for partial lines
-        self.partial_line = ""
+        # Streaming assembler for incoming lines
+        self.line_assembler = LineAssembler()
 
         # Keep-Alive
         self.keep_alive_stop_event = threading.Event()
@@ -292,12 +322,42 @@ class BBSTerminalApp:
         self.triggers = self.load_triggers()
         self.triggers_window = None
         self.chatlog_window = None
+        # Paged chatlog view: cursor is (created, id) of the oldest message shown
+        self.chatlog_page_size = 200
+        self.chatlog_page_user = None
+        self.chatlog_page_cursor = None
+        self.chatlog_page_loading = False
+
+        # Hyperlink history, flushed to disk in batches
+        self.links_store = LinksStore()
+        self.links_flush_pending = False
+
+        # Links panel rows currently shown, newest first: url -> row tag
+        self.links_rows = collections.OrderedDict()
+        self.links_row_counter = 0
+        self.links_page_size = 100
+        self.links_visible_limit = self.links_page_size
+        self.links_pending_urls = set()
+        self.links_update_scheduled = False
 
         self.last_message_info = None  # will hold (sender, recipient) of the last parsed message
 
+        # Member state files are written atomically by a background thread,
+        # at most once every few seconds
+        self.state_store = StateStore(flush_interval=5.0)
+
         # Chat members
         self.chat_members = self.load_chat_members_file()
-        self.last_seen = self.load_last_seen_file()
+        self.member_buttons = {}  # username -> bubble button in the members panel
+        self.member_order = []    # usernames as currently shown, in display order
+
+        # Who is present and who is talking, saved to presence.json
+        self.presence = PresenceIndex()
+        self.presence.load(self.state_store.load("presence.json", {}))
+        if not self.presence.records:
+            # Carry over the timestamps older versions kept in last_seen.json
+            self.presence.merge_last_seen(self.state_store.load("last_seen.json", {}))
+        self.presence_save_pending = False
 
         self.user_list_buffer = []
         self.collecting_users = False
@@ -321,6 +381,56 @@ class BBSTerminalApp:
         
         # Add settings persistence
         self.saved_settings = self.load_saved_settings()
+
+        # Per-subsystem log levels, e.g. {"net": "DEBUG"}; anything not listed
+        # logs at INFO. debug_log_file adds a rotating log file.
+        self.debug_levels = self.saved_settings.get('debug_levels', {})
+        self.debug_log_file = self.saved_settings.get('debug_log_file', "")
+        debug_log.configure(self.debug_levels, log_file=self.debug_log_file or None)
+
+        # Binary receive reads raw bytes and decodes them once with the CP437 map;
+        # set "binary_receive": false in settings.json for the legacy str pipeline
+        self.binary_receive = self.saved_settings.get('binary_receive', True)
+        self.decode_stats = ThroughputCounter("CP437 decode")
+
+        # Terminal output is queued by append_terminal_text and rendered once per tick
+        self.render_pending = []
+        self.render_scheduled = False
+        self.render_budget = 0.05  # seconds of incoming data handled per tick
+
+        # The telnet thread wakes the UI with a <<TelnetData>> event when the
+        # queue goes from empty to non-empty; a slow poll is kept only as a
+        # safety net in case a wakeup is ever lost
+        self.incoming_signaled = threading.Event()
+        self.incoming_posted_at = 0.0
+        self.incoming_backlog_scheduled = False
+        self.poll_fallback_interval = 1000
+
+        # Telnet read loop: adaptive read size and a watchdog period in seconds
+        self.read_min_size = 4096
+        self.read_max_size = 65536
+        self.read_idle_timeout = 30
+        self.wakeup_latency = LatencyCounter("Incoming data latency")
+
+        # Terminal scrollback limit in lines (0 = unlimited); trimmed output can
+        # optionally be appended to scrollback.log
+        self.scrollback_lines = self.saved_settings.get('scrollback_lines', 5000)
+        self.scrollback_spill = self.saved_settings.get('scrollback_spill', False)
+
+        # Chatlog retention limits; 0 disables a limit
+        self.chatlog_max_bytes = self.saved_settings.get('chatlog_max_bytes', 1024 * 1024 * 1024)
+        self.chatlog_max_messages_per_user = self.saved_settings.get('chatlog_max_messages_per_user', 0)
+        self.chatlog_max_age_days = self.saved_settings.get('chatlog_max_age_days', 0)
+        self.chatlog_store = ChatlogStore(
+            max_bytes=self.chatlog_max_bytes,
+            max_messages_per_user=self.chatlog_max_messages_per_user,
+            max_age_days=self.chatlog_max_age_days)
+
+        # Everything sent to the BBS goes through one ordered queue;
+        # send_rate_limits maps a command word to the minimum seconds between
+        # two sends of it, to stay clear of flood kicks
+        self.send_rate_limits = self.saved_settings.get('send_rate_limits', {"/f": 0.3})
+        self.outbound = OutboundQueue(self.loop, self.send_rate_limits)
         
         # Create StringVar with max length for input
         self.input_var = tk.StringVar()
@@ -328,7 +438,7 @@ class BBSTerminalApp:
 
         # Add blink state tracking
         self.blink_state = False
-        self.blink_tags = set()
+        self.blink_timer_running = False
 
         self.paned = None  # Initialize paned attribute
 
@@ -352,7 +462,7 @@ class BBSTerminalApp:
             if enchant:
                 self.spell = enchant.Dict("en_US")
         except Exception as e:
-            print("Error initializing spell checker:", e)
+            parse_log.error("Error initializing spell checker: %s", e)
             self.spell = None
 
         # Add page notifications pattern
@@ -396,11 +506,20 @@ class BBSTerminalApp:
         # Add new variable for Bannerless Mode visibility
         self.bannerless_mode = tk.BooleanVar(value=False)
 
+        # Full-screen ANSI mode renders output through a VT100 screen model
+        self.full_screen_ansi = tk.BooleanVar(value=self.saved_settings.get('full_screen_ansi', False))
+        self.vt_screen = VTScreen(self.cols, self.rows)
+        self.vt_tags = collections.OrderedDict()  # cell attribute -> Tk tags, least recently used first
+        self.vt_tag_counter = 0
+
         # 1.BUILD UI
         self.build_ui()
+        if self.full_screen_ansi.get():
+            self.toggle_full_screen_ansi()
 
-        # Periodically check for incoming telnet data
-        self.master.after(100, self.process_incoming_messages)
+        # Handle incoming telnet data when the telnet thread signals it
+        self.master.bind("<<TelnetData>>", lambda event: self.process_incoming_messages())
+        self.master.after(self.poll_fallback_interval, self.poll_incoming_messages)
 
         # Start the periodic task to refresh chat members
         self.master.after(5000, self.refresh_chat_members)
@@ -629,6 +748,15 @@ class BBSTerminalApp:
         )
         preview_toggle_check.grid(row=0, column=8, padx=5, pady=5, sticky=tk.W)
 
+        # Add Full-screen ANSI checkbox
+        full_screen_ansi_check = ttk.Checkbutton(
+            checkbox_frame,
+            text="Full-screen ANSI",
+            variable=self.full_screen_ansi,
+            command=self.toggle_full_screen_ansi
+        )
+        full_screen_ansi_check.grid(row=0, column=9, padx=5, pady=5, sticky=tk.W)
+
 
         # Add the Keep Alive checkbox
         keep_alive_frame = ttk.Frame(self.conn_frame)
@@ -719,6 +847,8 @@ class BBSTerminalApp:
         self.terminal_display.configure(yscrollcommand=self.on_scroll_change)
         self.define_ansi_tags()
         self.terminal_display.tag_configure("hyperlink", foreground="blue", underline=True)
+        # Blinking links must still blink, so blink stays above hyperlink
+        self.terminal_display.tag_raise("blink")
         self.terminal_display.tag_bind("hyperlink", "<Button-1>", self.open_hyperlink)
         self.terminal_display.tag_bind("hyperlink", "<Enter>", self.show_thumbnail_preview)
         self.terminal_display.tag_bind("hyperlink", "<Leave>", self.hide_thumbnail_preview)
@@ -863,7 +993,7 @@ class BBSTerminalApp:
                 self.paned_container.sashpos(0, main_width)  # Between main and members
                 self.paned_container.sashpos(1, main_width + self.panel_width)  # Between members and actions
         except Exception as e:
-            print(f"Error maintaining panel widths: {e}")
+            render_log.error("Error maintaining panel widths: %s", e)
 
     def start_keep_alive(self):
         """Start the keep-alive coroutine if enabled."""
@@ -900,7 +1030,7 @@ class BBSTerminalApp:
                 
             # If still not found, exit
             if not start_index:
-                print("No URL found at cursor position")
+                media_log.info("No URL found at cursor position")
                 return
                 
             # Search for whitespace after the URL
@@ -914,7 +1044,7 @@ class BBSTerminalApp:
             url = self.terminal_display.get(start_index, end_index).strip()
             
             # Store the URL in history
-            self.store_hyperlink(url, "terminal_click")
+            self.note_hyperlink(url)
             
             # Handle audio streams and other URLs appropriately
             if (url.lower().endswith(('.mp3', '.m3u', '.pls', '.aac', '.ogg')) or 
@@ -926,38 +1056,21 @@ class BBSTerminalApp:
             else:
                 webbrowser.open(url)
         except Exception as e:
-            print(f"Error opening hyperlink: {e}")
+            media_log.error("Error opening hyperlink: %s", e)
             traceback.print_exc()
 
     def insert_directed_message_with_hyperlinks(self, text, tag):
         """Insert directed message text with hyperlinks detected and tagged."""
-        url_pattern = re.compile(r'(https?://[^\s<>"\']+|www\.[^\s<>"\']+)')
-        last_end = 0
-        
-        for match in url_pattern.finditer(text):
-            start, end = match.span()
-            
-            # Insert non-URL text before the hyperlink
-            if start > last_end:
-                self.directed_msg_display.insert(tk.END, text[last_end:start], tag)
-            
-            # Clean the URL to remove trailing punctuation
-            url = text[start:end].rstrip('.,;:)]}\'"')
-            if url.startswith('www.'):
-                url = 'http://' + url
-            
+        for chars, url in split_links(text):
+            if not url:
+                self.directed_msg_display.insert(tk.END, chars, tag)
+                continue
             # Insert URL with hyperlink tag
             self.directed_msg_display.insert(tk.END, url, ("hyperlink",))
             
             # Store URL for history/debugging
-            print(f"[DEBUG] Directed message hyperlink found: {url}")
-            self.store_hyperlink(url, "directed_message")
-            
-            last_end = end
-        
-        # Insert any remaining text after the last URL
-        if last_end < len(text):
-            self.directed_msg_display.insert(tk.END, text[last_end:], tag)
+            parse_log.debug("Directed message hyperlink found: %s", url)
+            self.note_hyperlink(url)
 
     # 1.8️⃣ FAVORITES
     def show_favorites_window(self):
@@ -1032,25 +1145,23 @@ class BBSTerminalApp:
         """Send the username to the BBS."""
         if self.connected and self.writer:
             message = self.username.get() + "\r\n"
-            self.writer.write(message)
+            self.outbound.send(message)
             try:
-                self.loop.call_soon_threadsafe(self.writer.drain)
                 if self.remember_username.get():
                     self.save_username()
             except Exception as e:
-                print(f"Error sending username: {e}")
+                net_log.error("Error sending username: %s", e)
 
     def send_password(self):
         """Send the password to the BBS."""
         if self.connected and self.writer:
             message = self.password.get() + "\r\n"
-            self.writer.write(message)
+            self.outbound.send(message)
             try:
-                self.loop.call_soon_threadsafe(self.writer.drain)
                 if self.remember_password.get():
                     self.save_password()
             except Exception as e:
-                print(f"Error sending password: {e}")
+                net_log.error("Error sending password: %s", e)
 
     def exit_mini_mode(self):
         """Return from mini mode to normal mode."""
@@ -1103,7 +1214,7 @@ class BBSTerminalApp:
             
             # If animation ID has changed, abort this update
             if not hasattr(self, 'animation_id') or self.animation_id != anim_id:
-                print(f"[DEBUG] Aborting image load - newer image requested")
+                media_log.debug("Aborting image load - newer image requested")
                 return
                 
             # Create a BytesIO object from the response content
@@ -1117,7 +1228,7 @@ class BBSTerminalApp:
             max_size = (180, 130)  # Slightly smaller than frame to account for padding
             
             if is_animated_gif:
-                print(f"[DEBUG] Processing animated GIF for latest image frame with {getattr(img, 'n_frames', '?')} frames")
+                media_log.debug("Processing animated GIF for latest image frame with %s frames", getattr(img, 'n_frames', '?'))
                 
                 # Extract all frames
                 frames = []
@@ -1132,11 +1243,11 @@ class BBSTerminalApp:
                         frame_copy.thumbnail(max_size)
                         frames.append(ImageTk.PhotoImage(frame_copy))
                     
-                    print(f"[DEBUG] Extracted {len(frames)} frames for latest image")
+                    media_log.debug("Extracted %s frames for latest image", len(frames))
                     
                     # Check animation ID again before updating UI
                     if not hasattr(self, 'animation_id') or self.animation_id != anim_id:
-                        print(f"[DEBUG] Aborting animation - newer image requested")
+                        media_log.debug("Aborting animation - newer image requested")
                         return
                     
                     # Store frames as an instance attribute to prevent garbage collection
@@ -1154,7 +1265,7 @@ class BBSTerminalApp:
                     return
                     
                 except Exception as e:
-                    print(f"[DEBUG] Error extracting GIF frames: {e}")
+                    media_log.debug("Error extracting GIF frames: %s", e)
                     # Fall back to static image if extraction fails
             
             # For static images or fallback
@@ -1163,7 +1274,7 @@ class BBSTerminalApp:
             
             # Final animation ID check before updating UI
             if not hasattr(self, 'animation_id') or self.animation_id != anim_id:
-                print(f"[DEBUG] Aborting static image display - newer image requested")
+                media_log.debug("Aborting static image display - newer image requested")
                 return
                 
             # Update the label on the main thread
@@ -1176,7 +1287,7 @@ class BBSTerminalApp:
             self.master.after(0, update_label)
             
         except Exception as e:
-            print(f"Error updating latest image frame: {e}")
+            media_log.error("Error updating latest image frame: %s", e)
             def update_error():
                 if hasattr(self, 'latest_image_label') and self.latest_image_label.winfo_exists():
                     self.latest_image_label.configure(image="", text=f"Error: {str(e)[:50]}")
@@ -1303,8 +1414,8 @@ class BBSTerminalApp:
                 self.master.after(500, self.request_actions_after_banner)
             return
 
-        print("[DEBUG] Processing forget list against current chat members")
-        print(f"[DEBUG] Current forgotten_users set: {self.forgotten_users}")
+        parse_log.debug("Processing forget list against current chat members")
+        parse_log.debug("Current forgotten_users set: %s", self.forgotten_users)
         
         # Create a set of lowercase usernames for case-insensitive comparison
         # Strip domain parts (@example.com) for more flexible matching
@@ -1335,18 +1446,18 @@ class BBSTerminalApp:
                 absent_users.append(username)
         
         if absent_users:
-            print(f"[DEBUG] Skipping forget commands for absent users: {absent_users}")
+            parse_log.debug("Skipping forget commands for absent users: %s", absent_users)
         
         if already_forgotten:
-            print(f"[DEBUG] Skipping forget commands for already forgotten users: {already_forgotten}")
+            parse_log.debug("Skipping forget commands for already forgotten users: %s", already_forgotten)
         
         if not present_users:
-            print("[DEBUG] No new users to forget in current room")
+            parse_log.debug("No new users to forget in current room")
             if request_actions:
                 self.master.after(500, self.request_actions_after_banner)
             return
             
-        print(f"[DEBUG] Will send forget commands for present users: {present_users}")
+        parse_log.debug("Will send forget commands for present users: %s", present_users)
         
         # Create a sequence of commands with delays, but only for present users
         def send_forgets():
@@ -1364,21 +1475,14 @@ class BBSTerminalApp:
         if not self.connected or not self.writer:
             return
             
-        print(f"[DEBUG] Sending forget command for: {username}")
+        net_log.debug("Sending forget command for: %s", username)
         forget_cmd = f"/F {username}\r\n"
         
         # Mark this user as forgotten in this session
         self.forgotten_users.add(username)
         
-        async def send():
-            try:
-                self.writer.write(forget_cmd)
-                await self.writer.drain()
-            except Exception as e:
-                print(f"[ERROR] Failed to send forget command: {e}")
-        
-        # Run the async function in the event loop
-        asyncio.run_coroutine_threadsafe(send(), self.loop)
+        # The outbound queue spaces /F commands out by their rate limit
+        self.outbound.send(forget_cmd)
     
      
 
@@ -1490,6 +1594,17 @@ class BBSTerminalApp:
             borderwidth=2,
             font=("Arial VGA 437", 9))
 
+        # Member bubbles share one style (plus a hover style) per palette colour
+        for index, color in enumerate(MEMBER_PALETTE):
+            for style_name, background in ((f"Member{index}.TButton", color),
+                                           (f"MemberHover{index}.TButton", self.darken_color(color))):
+                style.configure(style_name,
+                    padding=(10, 5),
+                    relief="raised",
+                    background=background,
+                    borderwidth=2,
+                    font=("Arial VGA 437", 9, "bold"))
+
         # Add audio player styles
         style.configure("Audio.TButton",
             font=("Arial", 14),
@@ -1656,13 +1771,25 @@ class BBSTerminalApp:
         messages_frame.columnconfigure(0, weight=1)
         messages_frame.rowconfigure(1, weight=1)
         
-        ttk.Label(messages_frame, text="Messages").grid(row=0, column=0, sticky="w")
+        # Header with a full-text search box
+        messages_header = ttk.Frame(messages_frame)
+        messages_header.grid(row=0, column=0, columnspan=2, sticky="ew")
+        messages_header.columnconfigure(2, weight=1)
+        ttk.Label(messages_header, text="Messages").grid(row=0, column=0, sticky="w")
+        ttk.Label(messages_header, text="Search:").grid(row=0, column=1, sticky="e", padx=(10, 2))
+        self.chatlog_search_var = tk.StringVar()
+        search_entry = ttk.Entry(messages_header, textvariable=self.chatlog_search_var)
+        search_entry.grid(row=0, column=2, sticky="ew")
+        search_entry.bind("<Return>", self.search_chatlog)
+        ttk.Button(messages_header, text="Search", command=self.search_chatlog).grid(row=0, column=3, padx=2)
+        ttk.Button(messages_header, text="Clear", command=self.clear_chatlog_search).grid(row=0, column=4, padx=2)
+
         self.chatlog_display = tk.Text(messages_frame, wrap=tk.WORD, state=tk.DISABLED,
                                  **chatlog_font_settings)
         self.chatlog_display.grid(row=1, column=0, sticky="nsew")
-        messages_scrollbar = ttk.Scrollbar(messages_frame, command=self.chatlog_display.yview)
-        messages_scrollbar.grid(row=1, column=1, sticky="ns")
-        self.chatlog_display.configure(yscrollcommand=messages_scrollbar.set)
+        self.chatlog_scrollbar = ttk.Scrollbar(messages_frame, command=self.chatlog_display.yview)
+        self.chatlog_scrollbar.grid(row=1, column=1, sticky="ns")
+        self.chatlog_display.configure(yscrollcommand=self.on_chatlog_scroll)
         
         paned.add(messages_frame)
 
@@ -1676,9 +1803,9 @@ class BBSTerminalApp:
         self.links_display = tk.Text(links_frame, wrap=tk.WORD, state=tk.DISABLED,
                                **chatlog_font_settings)
         self.links_display.grid(row=1, column=0, sticky="nsew")
-        links_scrollbar = ttk.Scrollbar(links_frame, command=self.links_display.yview)
-        links_scrollbar.grid(row=1, column=1, sticky="ns")
-        self.links_display.configure(yscrollcommand=links_scrollbar.set)
+        self.links_scrollbar = ttk.Scrollbar(links_frame, command=self.links_display.yview)
+        self.links_scrollbar.grid(row=1, column=1, sticky="ns")
+        self.links_display.configure(yscrollcommand=self.on_links_scroll)
         
         self.links_display.tag_configure("hyperlink", foreground="blue", underline=True)
         self.links_display.tag_bind("hyperlink", "<Button-1>", self.open_chatlog_hyperlink)
@@ -1811,7 +1938,7 @@ class BBSTerminalApp:
                 self._handle_website_preview(url, label)
 
         except Exception as e:
-            print(f"Image preview error: {str(e)}")
+            media_log.error("Image preview error: %s", str(e))
             traceback.print_exc()  # Add this to get more details
             def update_label_error():
                 if label.winfo_exists():
@@ -1853,7 +1980,7 @@ class BBSTerminalApp:
                         frame_copy.thumbnail(max_size)
                         frames.append(ImageTk.PhotoImage(frame_copy))
                 except Exception as e:
-                    print(f"Error extracting GIF frames: {e}")
+                    media_log.error("Error extracting GIF frames: %s", e)
                 
                 # Store frames with preview-specific ID
                 preview_frames_attr = f"_preview_frames_{preview_id}"
@@ -1876,7 +2003,7 @@ class BBSTerminalApp:
                 self.master.after(0, update_label)
 
         except Exception as e:
-            print(f"Error handling image preview: {e}")
+            media_log.error("Error handling image preview: %s", e)
             def update_label_error():
                 if label.winfo_exists():
                     label.config(text=f"Error: {str(e)[:50]}")
@@ -1955,12 +2082,9 @@ class BBSTerminalApp:
         self.terminal_display.tag_configure("bright_cyan", foreground="#88ffff")
         self.terminal_display.tag_configure("bright_white", foreground="white")
 
-        # Add blink tag
+        # Add blink tag; all blinking text shares it and blink_timer toggles it
+        # while any blinking text is on screen
         self.terminal_display.tag_configure("blink", background="")
-        self.blink_tags = set()
-        
-        # Start blink timer
-        self.blink_timer()
 
         # Create a list of all defined tags for proper raising
         all_tags = ["normal", "black", "red", "green", "yellow", "blue", "bright_blue", 
@@ -1974,104 +2098,63 @@ class BBSTerminalApp:
                 try:
                     self.terminal_display.tag_raise(tag)
                 except Exception as e:
-                    print(f"Warning: Could not raise tag {tag}: {e}")
+                    render_log.warning("Could not raise tag %s: %s", tag, e)
 
         # Put important tags on top
         for tag in ["bright_blue", "red", "yellow"]:
             self.terminal_display.tag_raise(tag)
+        # Blink must override the colour tags while hidden
+        self.terminal_display.tag_raise("blink")
 
-    def parse_ansi_and_insert(self, text_data):
-        """Parse ANSI escape sequences with improved error handling."""
-        if not text_data:
-            return
+    def parse_ansi_and_insert(self, texts):
+        """Parse ANSI escape sequences in each text and insert them all in a single Tk call.
+
+        Each text starts from the "normal" tag. The caller is responsible for
+        putting the widget in the NORMAL state. Returns the insert arguments so
+        the mini terminal can render the same runs, or None if parsing failed.
+        """
+        if not texts:
+            return None
         try:
-            self.terminal_display.configure(state=tk.NORMAL)
-            i = 0
-            current_tags = ["normal"]
-            buffer = ""
-            while i < len(text_data):
-                try:
-                    char = text_data[i]
-                    if char == '\x1b' and i+1 < len(text_data) and text_data[i+1] == '[':
-                        if buffer:
-                            self.insert_with_hyperlinks(buffer, tuple(current_tags))
-                            buffer = ""
-                        seq_start = i
-                        i += 2
-                        params = ""
-                        while i < len(text_data) and not text_data[i].isalpha():
-                            params += text_data[i]
-                            i += 1
-                        if i < len(text_data):
-                            command = text_data[i]
-                            i += 1
-                            if command == 'm':
-                                codes = params.split(';')
-                                if not params or '0' in codes:
-                                    current_tags = ["normal"]
-                                for code in codes:
-                                    if not code:
-                                        continue
-                                    if code == '1':
-                                        current_tags = ["bright_" + tag if tag in self.color_map.values() else tag
-                                                        for tag in current_tags]
-                                    elif code == '5':
-                                        blink_tag = f"blink_{len(self.blink_tags)}"
-                                        self.terminal_display.tag_configure(blink_tag, background="")
-                                        self.blink_tags.add(blink_tag)
-                                        current_tags.append(blink_tag)
-                                    elif code in self.color_map:
-                                        current_tags = [t for t in current_tags if t not in self.color_map.values()]
-                                        current_tags.append(self.color_map[code])
-                    else:
-                        buffer += char
-                        i += 1
-                except Exception as inner_e:
-                    print(f"[ERROR] Error processing char at {i}: {inner_e}")
-                    i += 1
-            if buffer:
-                self.insert_with_hyperlinks(buffer, tuple(current_tags))
+            args = []
+            for text in texts:
+                args.extend(insert_args(link_runs(ansi_runs(text, self.color_map))))
+            if args:
+                self.terminal_display.insert(tk.END, *args)
+                if not self.blink_timer_running and any("blink" in tags for tags in args[1::2]):
+                    self.start_blink_timer()
+            return args
         except Exception as e:
-            print(f"[ERROR] Error in ANSI parsing: {e}")
+            render_log.error("Error in ANSI parsing: %s", e)
             traceback.print_exc()
             try:
-                self.terminal_display.insert(tk.END, text_data)
-            except:
-                pass
-        finally:
-            try:
-                self.terminal_display.configure(state=tk.DISABLED)
-            except:
-                pass
-            try:
-                self.terminal_display.tag_raise("hyperlink")
+                self.terminal_display.insert(tk.END, "".join(texts))
             except:
                 pass
+            return None
 
 
     def send_username(self):
         """Send the username to the BBS."""
         if self.connected and self.writer:
             message = self.username.get() + "\r\n"
-            self.writer.write(message)
+            self.outbound.send(message)
             try:
-                self.loop.call_soon_threadsafe(self.writer.drain)
                 if self.remember_username.get():
                     self.save_username()
             except Exception as e:
-                print(f"Error sending username: {e}")
+                net_log.error("Error sending username: %s", e)
 
     def send_password(self):
         """Send the password to the BBS."""
         if self.connected and self.writer:
             message = self.password.get() + "\r\n"
-            self.writer.write(message)
+            self.outbound.send(message)
             try:
-                self.loop.call_soon_threadsafe(self.writer.drain)
                 if self.remember_password.get():
                     self.save_password()
             except Exception as e:
-                print(f"Error sending password: {e}")
+                net_log.error("Error sending password: %s", e)
 
 
 
@@ -2287,122 +2370,29 @@ class BBSTerminalApp:
         # Add hyperlink tag
         self.mini_terminal.tag_configure("hyperlink", foreground="blue", underline=True)
 
-    def parse_mini_terminal_text(self, text):
-        """Insert text into mini terminal with proper ANSI handling and auto-scroll."""
-        if not text or not hasattr(self, 'mini_terminal') or not self.mini_terminal.winfo_exists():
-            return
-            
+    def insert_mini_terminal_runs(self, args, texts):
+        """Insert a tick's worth of already parsed runs into the mini terminal in one call.
+
+        args are the Text.insert arguments built by parse_ansi_and_insert; when
+        parsing failed they are None and texts are inserted without ANSI codes.
+        """
         try:
-            # Make text widget editable
             self.mini_terminal.configure(state=tk.NORMAL)
-            
-            # Process ANSI escape sequences
-            i = 0
-            current_tags = ["normal"]
-            buffer = ""
-            
-            while i < len(text):
-                if text[i:i+2] == '\x1b[':  # ANSI escape sequence
-                    # Insert any accumulated text with current tags
-                    if buffer:
-                        self.insert_mini_text_with_hyperlinks(buffer, tuple(current_tags))
-                        buffer = ""
-                    
-                    # Find the end of the sequence
-                    seq_end = text.find('m', i+2)
-                    if seq_end == -1:
-                        i += 1
-                        continue
-                    
-                    # Process the color code
-                    code_str = text[i+2:seq_end]
-                    codes = code_str.split(';')
-                    
-                    # Reset colors if code is 0
-                    if '0' in codes or not code_str:
-                        current_tags = ["normal"]
-                    
-                    # Process each color code
-                    for code in codes:
-                        if not code:
-                            continue
-                        if code == '1':  # Bold/bright
-                            current_tags = [t.replace('bright_', '') for t in current_tags]
-                            current_tags = ["bright_" + t if t in self.color_map.values() and not t.startswith('bright_') else t for t in current_tags]
-                        elif code in self.color_map:
-                            # Remove any existing color tags
-                            current_tags = [t for t in current_tags if t not in self.color_map.values()]
-                            # Add new color tag
-                            current_tags.append(self.color_map[code])
-                    
-                    i = seq_end + 1
-                else:
-                    buffer += text[i]
-                    i += 1
-            
-            # Insert any remaining text
-            if buffer:
-                self.insert_mini_text_with_hyperlinks(buffer, tuple(current_tags))
-            
-            # Force scrolling to the end
+            if args:
+                self.mini_terminal.insert(tk.END, *args)
+                for chars, tags in zip(args[::2], args[1::2]):
+                    if "hyperlink" in tags:
+                        self.note_hyperlink(chars)
+            else:
+                self.mini_terminal.insert(tk.END, CSI_REGEX.sub('', "".join(texts)))
             self.mini_terminal.see(tk.END)
-            self.master.update_idletasks()
-            
-            # Double-check scrolling (particularly important for long messages)
-            self.mini_terminal.yview_moveto(1.0)
-            
         except Exception as e:
-            print(f"Error in parse_mini_terminal_text: {e}")
-            # Fallback: insert as plain text
-            try:
-                plain_text = re.sub(r'\x1b\[[0-9;]*m', '', text)
-                self.mini_terminal.insert(tk.END, plain_text)
-                self.mini_terminal.see(tk.END)
-            except Exception as e2:
-                print(f"Fallback text insertion also failed: {e2}")
-                pass
+            render_log.error("Mini terminal update failed: %s", e)
         finally:
             # Always make sure to disable editing and set focus back to input
             self.mini_terminal.configure(state=tk.DISABLED)
             self.master.after_idle(self.mini_input.focus_set)
 
-    def insert_mini_text_with_hyperlinks(self, text, tags=("normal",)):
-        """Insert text with hyperlink detection into mini terminal."""
-        url_pattern = re.compile(r'(https?://[^\s<>"\']+|www\.[^\s<>"\']+)')
-        last_end = 0
-        
-        # Default to normal if no tags specified
-        if not tags:
-            tags = ("normal",)
-        
-        for match in url_pattern.finditer(text):
-            start, end = match.span()
-            
-            # Insert non-URL text
-            if start > last_end:
-                self.mini_terminal.insert(tk.END, text[last_end:start], tags)
-            
-            # Clean URL and insert with hyperlink tag
-            url = text[start:end].rstrip('.,;:)]}\'"')
-            if url.startswith('www.'):
-                url = 'http://' + url
-                
-            # Add both hyperlink tag and original formatting tags
-            all_tags = ("hyperlink",) + (tags if isinstance(tags, tuple) else (tags,))
-            self.mini_terminal.insert(tk.END, url, all_tags)
-            
-            # Store the hyperlink for tracking
-            self.store_hyperlink(url, "mini_terminal")
-            
-            last_end = end
-        
-        # Insert remaining text
-        if last_end < len(text):
-            self.mini_terminal.insert(tk.END, text[last_end:], tags)
-        
-        # Make sure we're still at the bottom of the text
-        self.mini_terminal.see(tk.END)
-
     def send_mini_message(self, event=None):
         """Send message from mini mode input field."""
         if not self.connected or not self.writer:
@@ -2419,17 +2409,7 @@ class BBSTerminalApp:
         self.mini_input_var.set("")
         
         # Use the same sending mechanism as main input - DON'T ENCODE HERE
-        full_message = message + "\r\n"
-        
-        async def send():
-            try:
-                # Remove the encode() call - the writer handles the encoding
-                self.writer.write(full_message)
-                await self.writer.drain()
-            except Exception as e:
-                print(f"Error sending mini message: {e}")
-                    
-        asyncio.run_coroutine_threadsafe(send(), self.loop)
+        self.outbound.send(message + "\r\n")
         
         # Refocus the input field
         self.master.after(50, self.mini_input.focus_set)
@@ -2448,7 +2428,7 @@ class BBSTerminalApp:
                 
             # If still not found, exit
             if not start_index:
-                print("No URL found at cursor position")
+                media_log.info("No URL found at cursor position")
                 return
                 
             # Search for whitespace after the URL
@@ -2462,7 +2442,7 @@ class BBSTerminalApp:
             url = self.mini_terminal.get(start_index, end_index).strip()
             
             # Store the URL in history
-            self.store_hyperlink(url, "mini_terminal_click")
+            self.note_hyperlink(url)
             
             # Handle audio streams and other URLs appropriately
             if (url.lower().endswith(('.mp3', '.m3u', '.pls', '.aac', '.ogg')) or 
@@ -2477,7 +2457,7 @@ class BBSTerminalApp:
             # Refocus the input field after a short delay
             self.master.after(100, self.mini_input.focus_set)
         except Exception as e:
-            print(f"Error opening hyperlink from mini: {e}")
+            media_log.error("Error opening hyperlink from mini: %s", e)
             traceback.print_exc()
 
     def show_mini_thumbnail_preview(self, event):
@@ -2494,7 +2474,7 @@ class BBSTerminalApp:
                 url = self.mini_terminal.get(start_index, end_index).strip()
                 self.show_thumbnail(url, event)
         except Exception as e:
-            print(f"Error in thumbnail preview: {e}")
+            media_log.error("Error in thumbnail preview: %s", e)
 
     def show_thumbnail_preview(self, event):
         """Show a thumbnail preview of the hyperlink with improved error handling."""
@@ -2510,7 +2490,7 @@ class BBSTerminalApp:
                 
             # If still not found, exit
             if not start_index:
-                print("No URL found at cursor position")
+                media_log.info("No URL found at cursor position")
                 return
                 
             # Search for whitespace after the URL
@@ -2525,7 +2505,7 @@ class BBSTerminalApp:
             if url:
                 self.show_thumbnail(url, event)
         except Exception as e:
-            print(f"Error in thumbnail preview: {e}")
+            media_log.error("Error in thumbnail preview: %s", e)
 
     def show_directed_message_thumbnail_preview(self, event):
         """Show a thumbnail preview of the hyperlink from directed messages with improved error handling."""
@@ -2541,7 +2521,7 @@ class BBSTerminalApp:
                 
             # If still not found, exit
             if not start_index:
-                print("No URL found at cursor position")
+                media_log.info("No URL found at cursor position")
                 return
                 
             # Search for whitespace after the URL
@@ -2556,7 +2536,7 @@ class BBSTerminalApp:
             if url:
                 self.show_thumbnail(url, event)
         except Exception as e:
-            print(f"Error in directed message thumbnail preview: {e}")
+            media_log.error("Error in directed message thumbnail preview: %s", e)
 
 
 
@@ -2609,21 +2589,10 @@ class BBSTerminalApp:
 
     def insert_buffer_with_hyperlinks(self, buffer, tags):
         """Insert a text buffer with hyperlink detection."""
-        url_pattern = re.compile(r'(https?://[^\s<>"\']+|www\.[^\s<>"\']+)')
-        last_end = 0
-        
-        for match in url_pattern.finditer(buffer):
-            start, end = match.span()
-            
-            # Insert non-URL text before the URL with current tags
-            if start > last_end:
-                self.terminal_display.insert(tk.END, buffer[last_end:start], tags)
-            
-            # Clean the URL to remove trailing punctuation that might have been included
-            url = buffer[start:end].rstrip('.,;:)]}\'"')
-            if url.startswith('www.'):
-                url = 'http://' + url
-            
+        for chars, url in split_links(buffer):
+            if not url:
+                self.terminal_display.insert(tk.END, chars, tags)
+                continue
             # Apply both hyperlink tag and current style tags together
             # Make sure hyperlink is the first tag so it takes precedence
             if isinstance(tags, tuple):
@@ -2635,13 +2604,7 @@ class BBSTerminalApp:
             self.terminal_display.insert(tk.END, url, combined_tags)
             
             # Log the hyperlink for debugging
-            print(f"[DEBUG] Terminal hyperlink found: {url}")
-            
-            last_end = end
-        
-        # Insert any remaining text after the last URL
-        if last_end < len(buffer):
-            self.terminal_display.insert(tk.END, buffer[last_end:], tags)
+            render_log.debug("Terminal hyperlink found: %s", url)
 
     def map_code_to_tag(self, color_code):
         """Map numeric color code to a defined Tk tag."""
@@ -2668,7 +2631,28 @@ class BBSTerminalApp:
         return self.color_map.get(color_code, None)
 
     # Keep existing blink_timer and get_all_color_tags methods
+    def start_blink_timer(self):
+        """Start toggling the blink tag; blink_timer stops itself once no blinking text is left."""
+        if self.blink_timer_running:
+            return
+        self.blink_timer_running = True
+        self.master.after(500, self.blink_timer)
+
     def blink_timer(self):
+        """Toggle the shared blink tag between hidden and visible."""
+        try:
+            if not self.terminal_display.tag_ranges("blink"):
+                # Nothing blinks any more; leave the tag visible and stop
+                self.blink_state = False
+                self.terminal_display.tag_configure("blink", foreground="")
+                self.blink_timer_running = False
+                return
+            self.blink_state = not self.blink_state
+            hidden = self.terminal_display.cget("bg") if self.blink_state else ""
+            self.terminal_display.tag_configure("blink", foreground=hidden)
+        except tk.TclError:
+            self.blink_timer_running = False
+            return
         
         # Schedule next blink
         self.master.after(500, self.blink_timer)
@@ -2703,7 +2687,7 @@ class BBSTerminalApp:
         
         # Reset forgotten users tracking for new connection
         self.forgotten_users = set()
-        print("[DEBUG] Forgotten users set reset for new connection")
+        net_log.debug("Forgotten users set reset for new connection")
 
         # Reset session state
         self.actions_requested_this_session = False
@@ -2816,7 +2800,7 @@ class BBSTerminalApp:
                 with open("font_settings.json", "r") as file:
                     return json.load(file)
         except Exception as e:
-            print(f"Error loading font settings: {e}")
+            persistence_log.error("Error loading font settings: %s", e)
         return {
             'font_name': "Courier New",
             'font_size': 10,
@@ -2827,41 +2811,11 @@ class BBSTerminalApp:
 
     def load_chat_members_file(self):
         """Load chat members from chat_members.json, or return an empty set if not found."""
-        if os.path.exists("chat_members.json"):
-            with open("chat_members.json", "r") as file:
-                try:
-                    return set(json.load(file))
-                except Exception as e:
-                    print(f"[DEBUG] Error loading chat members file: {e}")
-                    return set()
-        return set()
+        return set(self.state_store.load("chat_members.json", []))
 
     def save_chat_members_file(self):
-        """Save the current chat members set to chat_members.json."""
-        try:
-            with open("chat_members.json", "w") as file:
-                json.dump(list(self.chat_members), file)
-        except Exception as e:
-            print(f"[DEBUG] Error saving chat members file: {e}")
-
-    def load_last_seen_file(self):
-        """Load last seen timestamps from last_seen.json, or return an empty dictionary if not found."""
-        if os.path.exists("last_seen.json"):
-            with open("last_seen.json", "r") as file:
-                try:
-                    return json.load(file)
-                except Exception as e:
-                    print(f"[DEBUG] Error loading last seen file: {e}")
-                    return {}
-        return {}
-
-    def save_last_seen_file(self):
-        """Save the current last seen timestamps to last_seen.json."""
-        try:
-            with open("last_seen.json", "w") as file:
-                json.dump(self.last_seen, file)
-        except Exception as e:
-            print(f"Error saving last seen file: {e}")
+        """Schedule the current chat members set to be saved to chat_members.json."""
+        self.state_store.update("chat_members.json", sorted(self.chat_members))
 
     def refresh_chat_members(self):
         """Periodically refresh the chat members list."""
@@ -2893,7 +2847,7 @@ class BBSTerminalApp:
                 with open("frame_sizes.json", "r") as f:
                     return json.load(f)
         except Exception as e:
-            print(f"Error loading frame sizes: {e}")
+            persistence_log.error("Error loading frame sizes: %s", e)
         return {}
 
     def save_frame_sizes(self):
@@ -2916,14 +2870,14 @@ class BBSTerminalApp:
                                 "links": paned.winfo_width() - paned.sashpos(1)
                             })
                         except tk.TclError:
-                            print("Warning: Could not get sash positions")
+                            persistence_log.warning("Could not get sash positions")
                 except Exception as e:
-                    print(f"Warning: Error getting panel positions: {e}")
+                    persistence_log.warning("Error getting panel positions: %s", e)
                     
             with open("frame_sizes.json", "w") as f:
                 json.dump(sizes, f)
         except Exception as e:
-            print(f"Error saving frame sizes: {e}")
+            persistence_log.error("Error saving frame sizes: %s", e)
 
     def load_saved_settings(self):
         """Load all saved UI settings."""
@@ -2940,7 +2894,7 @@ class BBSTerminalApp:
                     self.bannerless_mode.set(settings.get('bannerless_mode', False))
                     return settings
         except Exception as e:
-            print(f"Error loading settings: {e}")
+            persistence_log.error("Error loading settings: %s", e)
         return {}
 
     def apply_saved_settings(self):
@@ -2960,17 +2914,17 @@ class BBSTerminalApp:
                         try:
                             self.paned.sash_place(0, settings['paned_pos'], 0)
                         except Exception as e:
-                            print(f"Error setting sash position: {e}")
+                            persistence_log.error("Error setting sash position: %s", e)
                     self.master.after(100, set_sash)
             except Exception as e:
-                print(f"Error applying paned window settings: {e}")
+                persistence_log.error("Error applying paned window settings: %s", e)
 
         # Apply window geometry if saved
         if 'window_geometry' in settings:
             try:
                 self.master.geometry(settings['window_geometry'])
             except Exception as e:
-                print(f"Error setting window geometry: {e}")
+                persistence_log.error("Error setting window geometry: %s", e)
 
         # Apply Messages to You visibility
         if not settings.get('show_messages', True):
@@ -2986,7 +2940,7 @@ class BBSTerminalApp:
                 with open("command_history.json", "r") as file:
                     return json.load(file)
         except Exception as e:
-            print(f"Error loading command history: {e}")
+            persistence_log.error("Error loading command history: %s", e)
         return []
 
     def save_command_history(self):
@@ -2995,7 +2949,7 @@ class BBSTerminalApp:
             with open("command_history.json", "w") as file:
                 json.dump(self.command_history[-100:], file)  # Keep only last 100 commands
         except Exception as e:
-            print(f"Error saving command history: {e}")
+            persistence_log.error("Error saving command history: %s", e)
     async def telnet_client_task(self, host, port):
         """Async function connecting via telnetlib3 (CP437 + ANSI)."""
         try:
@@ -3009,85 +2963,93 @@ class BBSTerminalApp:
             )
             self.reader = reader
             self.writer = writer
+            self.outbound.attach(writer)
             self.connected = True
             self.connect_button.config(text="Disconnect")
-            self.msg_queue.put_nowait(f"Connected to {host}:{port}\n")
-
-            while not self.stop_event.is_set():
-                try:
-                    # Use shield to prevent cancellation during critical operations
-                    data = await asyncio.shield(
-                        asyncio.wait_for(reader.read(4096), timeout=30)
-                    )
-                    if not data:
-                        break
-                    self.msg_queue.put_nowait(data)
-                except asyncio.CancelledError:
-                    print("[DEBUG] Telnet reader task was cancelled, shutting down gracefully")
-                    break
-                except asyncio.TimeoutError:
-                    continue
-                except ConnectionResetError:
-                    print("[DEBUG] Connection reset by peer")
-                    break
-                except Exception as e:
-                    print(f"[DEBUG] Error reading data: {e}")
-                    break
+            self.post_incoming(f"Connected to {host}:{port}\n")
+            await self.read_loop(reader)
 
         except asyncio.CancelledError:
-            print("[DEBUG] Connection task cancelled during setup")
+            net_log.debug("Connection task cancelled during setup")
             # Handle cancellation gracefully
-            self.msg_queue.put_nowait("Connection attempt cancelled\n")
+            self.post_incoming("Connection attempt cancelled\n")
         except Exception as e:
-            print(f"[DEBUG] Connection failed: {e}")
-            self.msg_queue.put_nowait(f"Connection failed: {e}\n")
+            net_log.debug("Connection failed: %s", e)
+            self.post_incoming(f"Connection failed: {e}\n")
         finally:
             try:
                 await self.disconnect_from_bbs()
             except asyncio.CancelledError:
-                print("[DEBUG] Disconnect during cleanup was cancelled")
+                net_log.debug("Disconnect during cleanup was cancelled")
                 # Still need to clean up
                 self.connected = False
                 self.reader = None
                 self.writer = None
-        try:
-            reader, writer = await telnetlib3.open_connection(
-                host=host,
-                port=port,
-                term=self.terminal_mode.get().lower(),
-                encoding='cp437',  # Use 'latin1' if your BBS uses it
-                cols=self.cols,    # Use the configured number of columns
-                rows=self.rows     # Use the configured number of rows
-            )
-            self.reader = reader
-            self.writer = writer
-            self.connected = True
-            self.connect_button.config(text="Disconnect")
-            self.msg_queue.put_nowait(f"Connected to {host}:{port}\n")
 
+    async def read_loop(self, reader):
+        """Read from the BBS until EOF or disconnect, handing each chunk to the UI.
+
+        Each read is awaited directly; the read size doubles while reads come
+        back full and halves when they come back mostly empty. A single
+        watchdog timer reports idle connections and read stats, and cancels
+        the read if a disconnect was requested while it was blocked.
+        """
+        loop = asyncio.get_running_loop()
+        read_size = self.read_min_size
+        self.last_read_time = loop.time()
+        self.read_count = 0
+        self.read_bytes = 0
+        self.read_watchdog_handle = loop.call_later(
+            self.read_idle_timeout, self.read_watchdog, asyncio.current_task())
+        try:
             while not self.stop_event.is_set():
                 try:
-                    # Use shield to prevent cancellation during critical operations
-                    data = await asyncio.shield(
-                        asyncio.wait_for(reader.read(4096), timeout=30)
-                    )
-                    if not data:
-                        break
-                    self.msg_queue.put_nowait(data)
-                except asyncio.TimeoutError:
-                    continue
+                    data = await self.read_incoming(reader, read_size)
+                except asyncio.CancelledError:
+                    net_log.debug("Telnet reader task was cancelled, shutting down gracefully")
+                    break
                 except ConnectionResetError:
-                    print("[DEBUG] Connection reset by peer")
+                    net_log.debug("Connection reset by peer")
                     break
                 except Exception as e:
-                    print(f"[DEBUG] Error reading data: {e}")
+                    net_log.debug("Error reading data: %s", e)
                     break
-
-        except Exception as e:
-            print(f"[DEBUG] Connection failed: {e}")
-            self.msg_queue.put_nowait(f"Connection failed: {e}\n")
+                if not data:
+                    break
+                self.last_read_time = loop.time()
+                self.read_count += 1
+                self.read_bytes += len(data)
+                if len(data) >= read_size and read_size < self.read_max_size:
+                    read_size *= 2
+                elif len(data) < read_size // 4 and read_size > self.read_min_size:
+                    read_size //= 2
+                self.post_incoming(data)
         finally:
-            await self.disconnect_from_bbs()
+            self.read_watchdog_handle.cancel()
+
+    def read_watchdog(self, task):
+        """Periodic check on the read loop, rescheduled every read_idle_timeout seconds."""
+        if task.done():
+            return
+        if self.stop_event.is_set():
+            task.cancel()
+            return
+        loop = asyncio.get_running_loop()
+        idle = loop.time() - self.last_read_time
+        if idle >= self.read_idle_timeout:
+            net_log.debug("No data from BBS for %.0fs", idle)
+        elif self.read_count:
+            net_log.debug("Telnet reads: %s reads, %.0f bytes/read", self.read_count, self.read_bytes / self.read_count)
+        self.read_count = 0
+        self.read_bytes = 0
+        self.read_watchdog_handle = loop.call_later(self.read_idle_timeout, self.read_watchdog, task)
+
+    def read_incoming(self, reader, size):
+        """Return a read coroutine for the reader, yielding raw bytes in binary receive mode."""
+        if self.binary_receive:
+            # Bypass TelnetReaderUnicode so every byte is decoded only once, by decode_cp437
+            return telnetlib3.TelnetReader.read(reader, size)
+        return reader.read(size)
 
     # In the disconnect_from_bbs method, before the final line:
 
@@ -3103,25 +3065,25 @@ class BBSTerminalApp:
             
             # Always reset forgotten users when disconnecting
             self.forgotten_users = set()
-            print("[DEBUG] Forgotten users list has been reset")
+            net_log.debug("Forgotten users list has been reset")
             
-            # Instead of directly calling clear_chat_members, update the members list safely
+            # Runs on the main thread, which also records everyone leaving in presence
             def update_ui():
-                self.chat_members = set(['Chatbot'])  # Only keep Chatbot in the list
-                self.save_chat_members_file()
-                self.update_members_display()
+                self.clear_chat_members()
+                self.reset_vt_tags()
             
             # Schedule UI update on main thread
             self.master.after_idle(update_ui)
 
             if self.writer:
                 try:
-                    # Send disconnect command if still connected
+                    # Send what is still queued, then the disconnect command
+                    await self.outbound.detach()
                     try:
                         self.writer.write('quit\r\n')
                         await asyncio.shield(self.writer.drain())
                     except (asyncio.CancelledError, Exception):
-                        print("[DEBUG] Exception during quit message, continuing with close")
+                        net_log.debug("Exception during quit message, continuing with close")
                         pass  # Ignore errors during quit command
                     
                     # Close the writer safely with cancel protection
@@ -3135,19 +3097,19 @@ class BBSTerminalApp:
                                         asyncio.wait_for(self.writer.wait_closed(), timeout=2.0)
                                     )
                                 except (asyncio.TimeoutError, asyncio.CancelledError) as e:
-                                    print(f"[DEBUG] Writer wait_closed timed out or was cancelled: {e}")
+                                    net_log.debug("Writer wait_closed timed out or was cancelled: %s", e)
                                 except Exception as e:
-                                    print(f"[DEBUG] Error waiting for writer to close: {e}")
+                                    net_log.debug("Error waiting for writer to close: %s", e)
                             else:
                                 # No wait_closed method, just continue
                                 pass
                     except asyncio.CancelledError:
-                        print("[DEBUG] Writer close operation was cancelled")
+                        net_log.debug("Writer close operation was cancelled")
                     except Exception as e:
-                        print(f"[DEBUG] Error closing writer: {e}")
+                        net_log.debug("Error closing writer: %s", e)
                             
                 except Exception as e:
-                    print(f"Warning: Error closing writer: {e}")
+                    net_log.warning("Error closing writer: %s", e)
 
             # Mark the connection as closed
             self.connected = False
@@ -3162,7 +3124,7 @@ class BBSTerminalApp:
             else:
                 self.master.after_idle(update_connect_button)
 
-            self.msg_queue.put_nowait("Disconnected from BBS.\n")
+            self.post_incoming("Disconnected from BBS.\n")
             
             # Start auto-reconnect sequence if enabled
             if self.auto_logon_enabled.get():
@@ -3171,7 +3133,7 @@ class BBSTerminalApp:
                 else:
                     self.master.after_idle(self.start_auto_reconnect)
         except asyncio.CancelledError:
-            print("[DEBUG] Disconnect task was cancelled during cleanup")
+            net_log.debug("Disconnect task was cancelled during cleanup")
             # Still clean up the connection state
             self.connected = False
             self.reader = None
@@ -3180,7 +3142,7 @@ class BBSTerminalApp:
             def emergency_ui_update():
                 if self.connect_button and self.connect_button.winfo_exists():
                     self.connect_button.config(text="Connect")
-                self.msg_queue.put_nowait("Connection closed (cancelled).\n")
+                self.post_incoming("Connection closed (cancelled).\n")
             
             self.master.after_idle(emergency_ui_update)
         finally:
@@ -3198,20 +3160,20 @@ class BBSTerminalApp:
             
             # Always reset forgotten users when disconnecting
             self.forgotten_users = set()
-            print("[DEBUG] Forgotten users list has been reset")
+            net_log.debug("Forgotten users list has been reset")
             
-            # Instead of directly calling clear_chat_members, update the members list safely
+            # Runs on the main thread, which also records everyone leaving in presence
             def update_ui():
-                self.chat_members = set(['Chatbot'])  # Only keep Chatbot in the list
-                self.save_chat_members_file()
-                self.update_members_display()
+                self.clear_chat_members()
+                self.reset_vt_tags()
             
             # Schedule UI update on main thread
             self.master.after_idle(update_ui)
 
             if self.writer:
                 try:
-                    # Send disconnect command if still connected
+                    # Send what is still queued, then the disconnect command
+                    await self.outbound.detach()
                     try:
                         self.writer.write('quit\r\n')
                         await self.writer.drain()
@@ -3228,7 +3190,7 @@ class BBSTerminalApp:
                             pass
                             
                 except Exception as e:
-                    print(f"Warning: Error closing writer: {e}")
+                    net_log.warning("Error closing writer: %s", e)
 
             # Mark the connection as closed
             self.connected = False
@@ -3243,7 +3205,7 @@ class BBSTerminalApp:
             else:
                 self.master.after_idle(update_connect_button)
     
-            self.msg_queue.put_nowait("Disconnected from BBS.\n")
+            self.post_incoming("Disconnected from BBS.\n")
                 
             # Add this: Start auto-reconnect sequence if enabled
             if self.auto_logon_enabled.get():
@@ -3272,8 +3234,13 @@ class BBSTerminalApp:
         # Store members in a temporary variable
         self.chat_members = set(['Chatbot'])  # Only keep Chatbot in the list
         
-        # Save to file - this is fine to do in any thread
+        # Queue the save - this is fine to do in any thread
         self.save_chat_members_file()
+
+        # Everyone else has left as far as presence is concerned, so the next
+        # banner records them joining again; saved now as this also runs on exit
+        self.presence.note_members(self.chat_members)
+        self.save_presence()
         
         # Schedule UI updates on the main thread
         if threading.current_thread() is threading.main_thread():
@@ -3282,35 +3249,68 @@ class BBSTerminalApp:
             # Use after_idle to ensure UI updates happen on main thread
             self.master.after_idle(self.update_members_display)
             
-        print("[DEBUG] Chat members cleared")
+        parse_log.debug("Chat members cleared")
 
     # 1.6️⃣ MESSAGES
+    def post_incoming(self, data):
+        """Queue incoming data for the UI, waking it only if it is not already due to run.
+
+        Safe to call from any thread. The flag is cleared before the queue is
+        drained, so data queued after a drain always raises a new wakeup.
+        """
+        self.msg_queue.put_nowait(data)
+        if self.incoming_signaled.is_set():
+            return
+        self.incoming_signaled.set()
+        self.incoming_posted_at = time.perf_counter()
+        try:
+            self.master.event_generate("<<TelnetData>>", when="tail")
+        except (tk.TclError, RuntimeError) as e:
+            # The window is gone or Tk is shutting down; the poll picks it up
+            net_log.debug("Could not signal incoming data: %s", e)
+
+    def poll_incoming_messages(self):
+        """Safety-net poll for incoming data; normally <<TelnetData>> does the work."""
+        self.process_incoming_messages()
+        self.master.after(self.poll_fallback_interval, self.poll_incoming_messages)
+
     def process_incoming_messages(self):
-        """Check the queue for data and parse lines for display."""
+        """Drain queued data and parse lines for display.
+
+        At most render_budget seconds of queued data are handled per call and
+        all lines produced are rendered in one batch. A backlog left over by
+        the budget is picked up again after 1 ms so pending UI events run in
+        between.
+        """
+        self.incoming_backlog_scheduled = False
+        signaled = self.incoming_signaled.is_set()
+        self.incoming_signaled.clear()
+        start = time.perf_counter()
+        processed = False
+        backlog = False
         try:
             while True:
+                if processed and time.perf_counter() - start > self.render_budget:
+                    backlog = True
+                    break
                 data = self.msg_queue.get_nowait()
                 self.process_data_chunk(data)
+                processed = True
         except queue.Empty:
             pass
         finally:
-            self.master.after(100, self.process_incoming_messages)
+            self.flush_terminal_output()
+            if processed and signaled:
+                self.wakeup_latency.add(time.perf_counter() - self.incoming_posted_at)
+                self.wakeup_latency.maybe_report()
+            if backlog and not self.incoming_backlog_scheduled:
+                self.incoming_backlog_scheduled = True
+                self.master.after(1, self.process_incoming_messages)
 
     def decode_cp437(self, data):
         """Decode CP437 encoded text, preserving special characters"""
-        # Convert bytes to list of integers if needed
-        if isinstance(data, bytes):
-            data = list(data)
-        
-        # Map each byte to its Unicode equivalent
-        result = ''
-        for byte in data:
-            if byte in self.cp437_map:
-                result += self.cp437_map[byte]
-            else:
-                result += chr(byte)
-        
-        return result
+        # Single table-driven pass instead of building the string byte by byte
+        return decode_cp437(data)
 
 
     def limit_input_length(self, *args):
@@ -3325,11 +3325,11 @@ class BBSTerminalApp:
             # Avoid playing sounds too frequently (debounce)
             current_time = time.time()
             if current_time - self.last_sound_time < 1.0:
-                print("[DEBUG] Skipping sound - too soon after previous sound")
+                media_log.debug("Skipping sound - too soon after previous sound")
                 return
                 
             if hasattr(self, 'chat_sound_file') and os.path.exists(self.chat_sound_file):
-                print(f"[DEBUG] Playing chat sound: {self.chat_sound_file}")
+                media_log.debug("Playing chat sound: %s", self.chat_sound_file)
                 # Stop any playing sound
                 winsound.PlaySound(None, winsound.SND_PURGE)
                 # Play the sound asynchronously
@@ -3337,9 +3337,9 @@ class BBSTerminalApp:
                 self.current_sound = "chat"
                 self.last_sound_time = current_time
             else:
-                print(f"[DEBUG] Chat sound file not found: {getattr(self, 'chat_sound_file', 'Not set')}")
+                media_log.debug("Chat sound file not found: %s", getattr(self, 'chat_sound_file', 'Not set'))
         except Exception as e:
-            print(f"Error playing chat sound: {e}")
+            media_log.error("Error playing chat sound: %s", e)
 
     def play_directed_sound(self):
         """Play directed sound with immediate interruption of any playing sound."""
@@ -3347,11 +3347,11 @@ class BBSTerminalApp:
             # Avoid playing sounds too frequently (debounce)
             current_time = time.time()
             if current_time - self.last_sound_time < 1.0:
-                print("[DEBUG] Skipping sound - too soon after previous sound")
+                media_log.debug("Skipping sound - too soon after previous sound")
                 return
                 
             if hasattr(self, 'directed_sound_file') and os.path.exists(self.directed_sound_file):
-                print(f"[DEBUG] Playing directed sound: {self.directed_sound_file}")
+                media_log.debug("Playing directed sound: %s", self.directed_sound_file)
                 # Stop any playing sound
                 winsound.PlaySound(None, winsound.SND_PURGE)
                 # Play the sound asynchronously with priority
@@ -3359,9 +3359,9 @@ class BBSTerminalApp:
                 self.current_sound = "directed"
                 self.last_sound_time = current_time
             else:
-                print(f"[DEBUG] Directed sound file not found: {getattr(self, 'directed_sound_file', 'Not set')}")
+                media_log.debug("Directed sound file not found: %s", getattr(self, 'directed_sound_file', 'Not set'))
         except Exception as e:
-            print(f"Error playing directed sound: {e}")
+            media_log.error("Error playing directed sound: %s", e)
 
 
 
@@ -3371,19 +3371,40 @@ class BBSTerminalApp:
     def process_data_chunk(self, data):
         """Process incoming data with enhanced action list detection."""
         # Decode CP437 data
+        decode_start = time.perf_counter()
         if isinstance(data, bytes):
+            nbytes = len(data)
             data = self.decode_cp437(data)
         else:
-            data = self.decode_cp437(data.encode('cp437'))
+            # Legacy pipeline: telnetlib3 already decoded with the stock codec
+            raw = data.encode('cp437')
+            nbytes = len(raw)
+            data = self.decode_cp437(raw)
+        self.decode_stats.add(nbytes, time.perf_counter() - decode_start)
+        self.decode_stats.maybe_report("binary" if self.binary_receive else "legacy")
+
+        if self.full_screen_ansi.get():
+            self.process_screen_chunk(data)
+            return
         
         # Log the raw incoming data for debugging
-        print(f"[DEBUG] Raw incoming data: {repr(data)}")
-        
-        # Normalize newlines
-        data = data.replace('\r\n', '\n').replace('\r', '\n')
-        self.partial_line += data
-        lines = self.partial_line.split("\n")
+        parse_log.debug("Raw incoming data: %r", data)
         
+        # Split into complete lines; the unterminated tail stays buffered
+        self.process_lines(self.line_assembler.feed(data))
+
+    def process_lines(self, lines, show_lines=True):
+        """Run complete lines through banner, action list, trigger and chatlog handling.
+
+        With show_lines False the lines are not written to the terminal,
+        because the full-screen grid has already drawn them.
+        """
+        if show_lines:
+            show = self.append_terminal_text
+        else:
+            def show(text, default_tag="normal"):
+                pass
+
         # Precompile an ANSI escape code regex
         ansi_regex = re.compile(r'(\x1b\[[0-9;]*m)')
         
@@ -3393,7 +3414,7 @@ class BBSTerminalApp:
         banner_complete = False
         assistance_line_detected = False
         
-        for line in lines[:-1]:
+        for line in lines:
             # Split the line into ANSI codes and text while preserving the codes
             line_parts = ansi_regex.split(line)
             
@@ -3412,39 +3433,39 @@ class BBSTerminalApp:
                 already_forgotten_match = re.search(r"REMEMBER\s+([^\.]+)", clean_line)
                 if already_forgotten_match:
                     forgotten_user = already_forgotten_match.group(1).strip()
-                    print(f"[DEBUG] Detected already forgotten user: {forgotten_user}")
+                    parse_log.debug("Detected already forgotten user: %s", forgotten_user)
                     # Add both the full name and base name to forgotten_users set
                     self.forgotten_users.add(forgotten_user)
                     base_name = forgotten_user.split('@')[0] if '@' in forgotten_user else forgotten_user
                     self.forgotten_users.add(base_name)
-                    print(f"[DEBUG] Updated forgotten_users set: {self.forgotten_users}")
+                    parse_log.debug("Updated forgotten_users set: %s", self.forgotten_users)
 
             # Check for chatroom exit message and reset forgotten users
             if "Exiting Teleconference..." in clean_line:
-                print("[DEBUG] Detected chatroom exit - resetting forgotten users tracking")
+                parse_log.debug("Detected chatroom exit - resetting forgotten users tracking")
                 self.forgotten_users = set()
-                self.append_terminal_text(original_with_ansi + "\n", "normal")
+                show(original_with_ansi + "\n", "normal")
                 continue
 
 
             # ENHANCED ACTION LIST DETECTION - Check this before banner detection
             # =================================================================
             if "Action listing for" in clean_line:
-                print("[DEBUG] Action listing header detected")
+                parse_log.debug("Action listing header detected")
                 self.actions = []
                 self.collecting_actions = True
-                self.append_terminal_text(original_with_ansi + "\n", "normal")
+                show(original_with_ansi + "\n", "normal")
                 continue
                 
             # Continue collecting actions if in action list mode
             elif self.collecting_actions:
                 # Display the line
-                self.append_terminal_text(original_with_ansi + "\n", "normal")
+                show(original_with_ansi + "\n", "normal")
                 
                 # Check for end of action list - either standalone colon or empty line
                 if clean_line == ":" or clean_line == "" or clean_line.endswith(":") or "here with you" in clean_line:
                     if self.actions:
-                        print(f"[DEBUG] Finished collecting actions: {self.actions}")
+                        parse_log.debug("Finished collecting actions: %s", self.actions)
                         self.collecting_actions = False
                         self.master.after_idle(self.update_actions_listbox)
                     continue
@@ -3467,7 +3488,7 @@ class BBSTerminalApp:
                 ]
                         
                 if valid_actions:
-                    print(f"[DEBUG] Found valid actions: {valid_actions}")
+                    parse_log.debug("Found valid actions: %s", valid_actions)
                     self.actions.extend(valid_actions)
                 continue
             
@@ -3484,7 +3505,7 @@ class BBSTerminalApp:
                 
                 # Only display the line if NOT in bannerless mode
                 if not self.bannerless_mode.get():
-                    self.append_terminal_text(original_with_ansi + "\n", "normal")
+                    show(original_with_ansi + "\n", "normal")
                 continue
             
             # Continue collecting banner lines
@@ -3494,7 +3515,7 @@ class BBSTerminalApp:
                 
                 # Only display the line if NOT in bannerless mode
                 if not self.bannerless_mode.get():
-                    self.append_terminal_text(original_with_ansi + "\n", "normal")
+                    show(original_with_ansi + "\n", "normal")
                 
                 # BANNER END DETECTION
                 # ===================
@@ -3512,14 +3533,14 @@ class BBSTerminalApp:
                     in_banner = False
                     self.collecting_users = False
                     
-                    print("[DEBUG] Banner complete with colon delimiter")
+                    parse_log.debug("Banner complete with colon delimiter")
                     self.update_chat_members([item[1] for item in banner_lines])
                     self.process_forget_list_after_banner()
 
 
                     # In Bannerless Mode, replace banner with just the colon
                     if self.bannerless_mode.get():
-                        self.append_terminal_text(":\n", "normal")
+                        show(":\n", "normal")
                     
                     # Request actions after banner processing - IMPORTANT: This triggers the action list
                     if not self.actions_requested_this_session:
@@ -3537,12 +3558,12 @@ class BBSTerminalApp:
                     in_banner = False
                     self.collecting_users = False
                     
-                    print("[DEBUG] Banner complete with assistance line")
+                    parse_log.debug("Banner complete with assistance line")
                     self.update_chat_members([item[1] for item in banner_lines])
                     self.process_forget_list_after_banner()
                     # In Bannerless Mode, replace banner with minimal output
                     if self.bannerless_mode.get():
-                        self.append_terminal_text("> \n", "normal")
+                        show("> \n", "normal")
                     
                     # Request actions after banner processing - IMPORTANT: This triggers the action list
                     if not self.actions_requested_this_session:
@@ -3563,7 +3584,7 @@ class BBSTerminalApp:
             
             # If we reach here, it's a regular line (not part of banner or action list)
             if clean_line:
-                self.append_terminal_text(original_with_ansi + "\n", "normal")
+                show(original_with_ansi + "\n", "normal")
                 self.check_triggers(clean_line)  # Use clean line for trigger checking
                 self.parse_and_save_chatlog_message(clean_line, original_with_ansi)
                 if "You have already forgotten that user" in clean_line:
@@ -3571,35 +3592,20 @@ class BBSTerminalApp:
                     already_forgotten_match = re.search(r"already forgotten that user[^<]*<([^>]+)>", clean_line)
                     if already_forgotten_match:
                         forgotten_user = already_forgotten_match.group(1)
-                        print(f"[DEBUG] Already forgotten user detected: {forgotten_user}")
+                        parse_log.debug("Already forgotten user detected: %s", forgotten_user)
                         # Add to our tracking set
                         self.forgotten_users.add(forgotten_user)
 
-        self.partial_line = lines[-1]
-
     def send_actions_request(self):
         """Send request for action list with proper reliability measures."""
         if not self.connected or not self.writer:
-            print("[DEBUG] Cannot request actions - not connected")
+            net_log.debug("Cannot request actions - not connected")
             return
 
-        print("[DEBUG] Sending action list request")
+        net_log.debug("Sending action list request")
         
-        # Send the command to request actions with proper error handling
-        message = "actions\r\n"  
-        
-        async def send():
-            try:
-                print("[DEBUG] Sending actions command...")
-                await asyncio.sleep(0.5)  # Add small delay for stability
-                self.writer.write(message)
-                await self.writer.drain()
-                print("[DEBUG] Action request sent successfully")
-            except Exception as e:
-                print(f"[ERROR] Failed to send actions request: {e}")
-        
-        # Use create_task instead of run_coroutine_threadsafe for better reliability
-        asyncio.run_coroutine_threadsafe(send(), self.loop)
+        # Send the command after a small delay for stability
+        self.master.after(500, lambda: self.outbound.send("actions\r\n"))
         
         # Add a flag to prevent duplicate requests
         self.actions_requested_this_session = True
@@ -3623,125 +3629,55 @@ class BBSTerminalApp:
 
     def parse_and_save_chatlog_message(self, clean_line, original_line):
         """Parse chat messages with robust format detection and proper routing."""
-        # Skip system messages and noise - MODIFY THIS PART
-        skip_patterns = [
-            r"You are in", r"Topic:", r"Just press", r"Just type", r"assistance",
-            r"are here with you", r"is here with you", r"^\s*$", 
-            r"^\s*:(?!\[).*$",  # Only skip colon lines that DON'T start with :[
-            r"^\s*\(.*\)\s*$", r"\[Type your (?:User-ID|Password)[^]]*:\]",
-            r"Type your (?:User-ID|Password)[^]]*:", 
-            r"^\[?(?:Enter|Type)(?: your)? [Pp]assword[^]]*:\]\s*$",
-            r"^\[?(?:Enter|Type)(?: your)? username[^]]*:\]\s*$",
-            r"Action listing for:", r"^>", r"^\*", r"Welcome to", r"Connected to", r"^The "
-        ]
-        
         # Debug: Print ALL incoming message lines for troubleshooting
-        print(f"[DEBUG-MSG] Processing message: '{clean_line}'")
+        parse_log.debug("Processing message: '%s'", clean_line)
         
-        if any(re.search(pattern, clean_line, re.IGNORECASE) for pattern in skip_patterns):
+        # Skip system messages and noise
+        if is_noise(clean_line):
             if clean_line.startswith(":["):
-                print(f"[DEBUG] Colon message matched skip pattern: '{clean_line}'")
+                parse_log.debug("Colon message matched skip pattern: '%s'", clean_line)
             else:
-                print(f"[DEBUG] Skipping non-message: '{clean_line}'")
+                parse_log.debug("Skipping non-message: '%s'", clean_line)
             return
 
         # Add timestamp if not present
-        has_timestamp = bool(re.match(r'^\[\d{4}-\d{2}-\d{2}\s+\d{2}:\d{2}:\d{2}\]', clean_line))
-        timestamp = time.strftime("[%Y-%m-%d %H:%M:%S] ") if not has_timestamp else ""
-        
-        # Enhanced message patterns for more robust detection - ADJUST COLON PATTERNS
-        patterns = {
-            # Classic format patterns
-            'classic_whisper': r'^\[([^@\]]+(?:@[^\]]+)?)\s*\(whispered(?:\s+to\s+you)?\):\]\s*(.+)$',
-            'classic_direct_to_you': r'^\[([^@\]]+(?:@[^\]]+)?)\s*\(to\s+you\):\]\s*(.+)$',
-            'classic_public_direct': r'^\[([^@\]]+(?:@[^\]]+)?)\s*\(to\s+([^@\]]+(?:@[^\]]+)?)\):\]\s*(.+)$',
-            'classic_regular': r'^\[([^@\]]+(?:@[^\]]+)?):\]\s*(.+)$',
-            
-            # Colon-prefixed format patterns with broader matching - This is the key change
-            'colon_whisper': r'^:\s*\[([^@\]]+(?:@[^\]]+)?)\]\s*\(whispered(?:\s+to\s+you)?\):\s*(.+)$',
-            'colon_direct_to_you': r'^:\s*\[([^@\]]+(?:@[^\]]+)?)\]\s*\(to\s+you\):\s*(.+)$',
-            'colon_public_direct': r'^:\s*\[([^@\]]+(?:@[^\]]+)?)\]\s*\(to\s+([^@\]]+(?:@[^\]]+)?)\):\s*(.+)$',
-            'colon_regular': r'^:\s*\[([^@\]]+(?:@[^\]]+)?)\]:\s*(.+)$',
-            # Alternative format patterns - MAJORLINK STYLE
-            'alt_whisper': r'^From\s+([^@\(]+(?:@[^\(]+)?)\s*\(whispered\):\s*(.+)$',
-            'alt_direct_to_you': r'^From\s+([^@\(]+(?:@[^\(]+)?)\s*\(to\s+you\):\s*(.+)$',
-            'alt_public_direct': r'^From\s+([^@\(]+(?:@[^\(]+)?)\s*\(to\s+([^@\)]+(?:@[^\)]+)?)\):\s*(.+)$',
-            'alt_regular': r'^From\s+([^@:]+(?:@[^:]+)?):(?:\s*)(.+)$',
-            
-            # PBX-style formats
-            'pbx_whisper': r'^([^@\s]+(?:@[^\s]+)?)\s+whispers:(?:\s*)(.+)$',
-            'pbx_direct': r'^([^@\s]+(?:@[^\s]+)?)\s+says(?:\s+to\s+([^@\s:]+(?:@[^\s:]+)?)):(?:\s*)(.+)$',
-            'pbx_regular': r'^([^@\s]+(?:@[^\s]+)?)\s+says:(?:\s*)(.+)$',
-            
-            # Handle page notifications
-            'page_notification': r'([^@\s]+(?:@[^\s]+)?)\s+is\s+paging\s+you\s+from\s+([^:]+):(?:\s*)(.+)$'
-        }
-
-        # Try each pattern
-        for msg_type, pattern in patterns.items():
-            match = re.match(pattern, clean_line)
-            if not match:
-                if clean_line.startswith(":[") and msg_type.startswith("colon_"):
-                    print(f"[DEBUG] Pattern '{msg_type}' failed to match colon message")
-                continue
-                
-            # Success match! Log it
-            if clean_line.startswith(":["):
-                print(f"[DEBUG] Successfully matched pattern '{msg_type}' for message: '{clean_line}'")
-                
-            # Message successfully matched, extract parts
-            sender = match.group(1).strip()
+        timestamp = time.strftime("[%Y-%m-%d %H:%M:%S] ") if not has_timestamp(clean_line) else ""
         
+        msg = classify_message(clean_line)
+        if msg is not None:
+            if clean_line.startswith(":["):
+                parse_log.debug("Successfully matched pattern '%s' for message: '%s'", msg.msg_type, clean_line)
+            sender = msg.sender
+            message = msg.body
+            self.presence.note_message(sender)
+            self.schedule_presence_save()
             
             # Handle different message formats
-            if 'whisper' in msg_type or 'direct_to_you' in msg_type:
+            if msg.kind in ("whisper", "direct"):
                 # Direct message to the user
-                message = match.group(2)
-                msg_category = "whisper" if "whisper" in msg_type else "direct"
-                formatted = f"{timestamp}From {sender} ({msg_category}): {message}"
+                formatted = f"{timestamp}From {sender} ({msg.kind}): {message}"
                 
                 # Add to directed messages and play sound
                 self.append_directed_message(formatted)
                 self.play_directed_sound()
                 
                 # Always log whispers/directs in chatlog
-                self.save_chatlog_message(sender, formatted)
-                
-                # Store any hyperlinks in the message
-                self.parse_and_store_hyperlinks(message, sender)
+                self.save_chatlog_message(sender, formatted, kind=msg.kind)
                 
-            elif 'page_notification' in msg_type:
+            elif msg.kind == "page":
                 # Handle page notifications specially
-                location = match.group(2).strip()
-                message = match.group(3)
-                formatted = f"{timestamp}Page from {sender} ({location}): {message}"
+                formatted = f"{timestamp}Page from {sender} ({msg.location}): {message}"
                 
                 # Show in directed messages and play sound
                 self.append_directed_message(formatted)
                 self.play_directed_sound()
                 
                 # Also log in chatlog
-                self.save_chatlog_message(sender, formatted)
-                
-                # Store any hyperlinks
-                self.parse_and_store_hyperlinks(message, sender)
+                self.save_chatlog_message(sender, formatted, kind=msg.kind)
                 
-            elif 'public_direct' in msg_type or ('pbx_direct' in msg_type and len(match.groups()) >= 3) or 'colon_public_direct' in msg_type:
+            elif msg.kind == "public_direct":
                 # Message between others or to you
-                if 'colon_public_direct' in msg_type:
-                    recipient = match.group(2).strip()
-                    message = match.group(3) if len(match.groups()) >= 3 else match.group(2)
-                elif 'public_direct' in msg_type:
-                    recipient_index = 2
-                    message_index = 3
-                    recipient = match.group(recipient_index).strip()
-                    message = match.group(message_index)
-                else:  # pbx_direct
-                    recipient_index = 1
-                    message_index = 2
-                    recipient = match.group(recipient_index).strip()
-                    message = match.group(message_index)
-                    
+                recipient = msg.recipient
                 formatted = f"{timestamp}From {sender} (to {recipient}): {message}"
                 
                 # Check if the message is to the current user
@@ -3759,85 +3695,42 @@ class BBSTerminalApp:
                     self.play_chat_sound()
                     
                 # Always save to chatlog
-                self.save_chatlog_message(sender, formatted)
-                
-                # Store any hyperlinks
-                self.parse_and_store_hyperlinks(message, sender)
+                self.save_chatlog_message(sender, formatted, kind=msg.kind, recipient=recipient)
                 
             else:
                 # Regular public message
-                message = match.group(2)
                 formatted = f"{timestamp}From {sender}: {message}"
                 
                 # Regular messages go to chatlog and play chat sound
-                self.save_chatlog_message(sender, formatted)
+                self.save_chatlog_message(sender, formatted, kind=msg.kind)
                 self.play_chat_sound()
-                
-                # Store any hyperlinks
-                self.parse_and_store_hyperlinks(message, sender)
             
-            # We've matched and processed a message, so return
+            # Store any hyperlinks in the message
+            self.parse_and_store_hyperlinks(message, sender)
             return
 
-        # If we get here, we didn't match any known pattern
-        # Check for URLs in the raw message and store them with "Unknown" sender
-        if re.search(r'(https?://[^\s<>"\']+|www\.[^\s<>"\']+)', clean_line):
-            print(f"[DEBUG] Found URLs in unmatched message: {clean_line}")
-            self.parse_and_store_hyperlinks(clean_line, "Unknown")
-
+        if clean_line.startswith(":["):
+            parse_log.debug("No colon pattern matched message: '%s'", clean_line)
 
-    def insert_with_hyperlinks(self, text, tags):
-        """Enhanced hyperlink detection and insertion."""
-        url_pattern = re.compile(r'(https?://[^\s<>"\']+|www\.[^\s<>"\']+)')
-        last_end = 0
-        
-        for match in url_pattern.finditer(text):
-            start, end = match.span()
-            # Insert non-URL text
-            if start > last_end:
-                self.terminal_display.insert(tk.END, text[last_end:start], tags)
-            
-            # Clean and insert URL
-            url = text[start:end].rstrip('.,;:)]}\'"')
-            if url.startswith('www.'):
-                url = 'http://' + url
-            self.terminal_display.insert(tk.END, url, ("hyperlink",) + (tags if isinstance(tags, tuple) else (tags,)))
+        # If we get here, we didn't match any known pattern
+        # Check for URLs in the raw message and store them without a sender
+        if extract_urls(clean_line):
+            parse_log.debug("Found URLs in unmatched message: %s", clean_line)
+            self.parse_and_store_hyperlinks(clean_line)
 
-            last_end = end
-        
-        # Insert remaining text
-        if last_end < len(text):
-            self.terminal_display.insert(tk.END, text[last_end:], tags)
 
     def insert_directed_message_with_hyperlinks(self, text, tag):
         """Insert directed message text with hyperlinks detected and tagged."""
-        url_pattern = re.compile(r'(https?://[^\s<>"\']+|www\.[^\s<>"\']+)')
-        last_end = 0
-        
-        for match in url_pattern.finditer(text):
-            start, end = match.span()
-            
-            # Insert non-URL text before the hyperlink
-            if start > last_end:
-                self.directed_msg_display.insert(tk.END, text[last_end:start], tag)
-            
-            # Clean the URL to remove trailing punctuation
-            url = text[start:end].rstrip('.,;:)]}\'"')
-            if url.startswith('www.'):
-                url = 'http://' + url
-            
+        for chars, url in split_links(text):
+            if not url:
+                self.directed_msg_display.insert(tk.END, chars, tag)
+                continue
             # Insert URL with hyperlink tag
             self.directed_msg_display.insert(tk.END, url, ("hyperlink",))
             
             # Store URL for history/debugging
-            print(f"[DEBUG] Directed message hyperlink found: {url}")
-            self.store_hyperlink(url, "directed_message")
-            
-            last_end = end
-        
-        # Insert any remaining text after the last URL
-        if last_end < len(text):
-            self.directed_msg_display.insert(tk.END, text[last_end:], tag)
+            parse_log.debug("Directed message hyperlink found: %s", url)
+            self.note_hyperlink(url)
 
     def send_message(self, event=None):
         """Send the user's typed message and manage command history."""
@@ -3879,16 +3772,7 @@ class BBSTerminalApp:
         # Send message directly without MUD mode prefix
         message = user_input + "\r\n" if user_input else "\r\n"
 
-        # Send message using asyncio.run_coroutine_threadsafe
-        if self.connected and self.writer:
-            async def send():
-                try:
-                    self.writer.write(message)
-                    await self.writer.drain()
-                except Exception as e:
-                    print(f"Error sending message: {e}")
-                    
-            asyncio.run_coroutine_threadsafe(send(), self.loop)
+        self.outbound.send(message)
 
         # Reset history browsing
         self.command_index = -1
@@ -3953,16 +3837,7 @@ class BBSTerminalApp:
             # Clean up the message
             if not message.endswith('\r\n'):
                 message = message + '\r\n'
-                
-            async def send():
-                try:
-                    self.writer.write(message)
-                    await self.writer.drain()
-                except Exception as e:
-                    print(f"Error sending custom message: {e}")
-                    
-            # Run the async send function
-            asyncio.run_coroutine_threadsafe(send(), self.loop)
+            self.outbound.send(message)
 
     def send_action(self, action):
         """Send an action command to the BBS."""
@@ -3975,23 +3850,15 @@ class BBSTerminalApp:
         else:
             message = f"{action}\r\n"
             
-        async def send():
-            try:
-                self.writer.write(message)
-                await self.writer.drain()
-                self.deselect_all_members()
-            except Exception as e:
-                print(f"Error sending action: {e}")
-                
-        asyncio.run_coroutine_threadsafe(send(), self.loop)
+        self.outbound.send(message)
+        self.deselect_all_members()
 
     # 1.7️⃣ KEEP-ALIVE
     async def keep_alive(self):
         """Send an <ENTER> keystroke at the specified interval."""
         while not self.keep_alive_stop_event.is_set():
             if self.connected and self.writer:
-                self.writer.write("\r\n")
-                await self.writer.drain()
+                self.outbound.send("\r\n")
             
             # Calculate total seconds from minutes and seconds
             try:
@@ -4007,36 +3874,169 @@ class BBSTerminalApp:
 
 
     def append_terminal_text(self, text, default_tag="normal"):
-        """Append text to the terminal display with improved error handling."""
+        """Queue text for the terminal display; it is rendered with the rest of this tick's output."""
+        render_log.debug("Appending to terminal: %r...", text[:20])
+        if self.full_screen_ansi.get():
+            self.vt_screen.feed(text.replace("\n", "\r\n"))
+        else:
+            self.render_pending.append(text)
+        if not self.render_scheduled:
+            self.render_scheduled = True
+            self.master.after_idle(self.flush_terminal_output)
+
+    def flush_terminal_output(self):
+        """Render all queued terminal text with one insert and one scroll."""
+        self.render_scheduled = False
+        if self.full_screen_ansi.get():
+            self.render_vt_screen()
+            return
+        if not self.render_pending:
+            return
+        texts = self.render_pending
+        self.render_pending = []
         try:
-            print(f"[DEBUG] Appending to terminal: {repr(text[:20])}...")
             self.terminal_display.configure(state=tk.NORMAL)
-            self.parse_ansi_and_insert(text)
+            args = self.parse_ansi_and_insert(texts)
+            self.trim_scrollback()
             self.terminal_display.see(tk.END)
             self.terminal_display.configure(state=tk.DISABLED)
             
-            # If in mini mode, also update mini terminal
+            # If in mini mode, also update mini terminal from the same runs
             if hasattr(self, 'is_in_mini_mode') and self.is_in_mini_mode and hasattr(self, 'mini_terminal') and self.mini_terminal.winfo_exists():
-                try:
-                    self.mini_terminal.configure(state=tk.NORMAL)
-                    self.parse_mini_terminal_text(text)
-                    self.mini_terminal.see(tk.END)
-                    self.mini_terminal.configure(state=tk.DISABLED)
-                    # Ensure focus goes back to input
-                    self.master.after_idle(self.mini_input.focus_set)
-                except Exception as mini_err:
-                    print(f"[ERROR] Mini terminal update failed: {mini_err}")
+                self.insert_mini_terminal_runs(args, texts)
         except Exception as e:
-            print(f"[ERROR] Failed to update terminal display: {e}")
+            render_log.error("Failed to update terminal display: %s", e)
             traceback.print_exc()
             try:
                 self.terminal_display.configure(state=tk.NORMAL)
-                self.terminal_display.insert(tk.END, text)
+                self.terminal_display.insert(tk.END, "".join(texts))
                 self.terminal_display.see(tk.END)
                 self.terminal_display.configure(state=tk.DISABLED)
             except Exception as e2:
-                print(f"[ERROR] Even simple terminal update failed: {e2}")
-
+                render_log.error("Even simple terminal update failed: %s", e2)
+
+    def toggle_full_screen_ansi(self):
+        """Switch the terminal display between line mode and the full-screen ANSI grid."""
+        self.render_pending = []
+        self.terminal_display.configure(state=tk.NORMAL)
+        self.terminal_display.delete("1.0", tk.END)
+        self.reset_vt_tags()
+        if self.full_screen_ansi.get():
+            self.vt_screen.reset()
+            # One text line per screen row; rows are then replaced in place
+            self.terminal_display.insert("1.0", "\n" * (self.vt_screen.rows - 1))
+        self.terminal_display.configure(state=tk.DISABLED)
+        if self.full_screen_ansi.get():
+            self.render_vt_screen()
+
+    def process_screen_chunk(self, data):
+        """Feed decoded output to the screen model, still running every line through process_lines."""
+        self.vt_screen.feed(data)
+        if self.vt_screen.responses:
+            if self.connected and self.writer:
+                for response in self.vt_screen.responses:
+                    self.outbound.send(response)
+            self.vt_screen.responses = []
+        # Cursor movement and erase codes mean nothing to the line handlers;
+        # colour codes are kept as line mode keeps them
+        lines = [CSI_REGEX.sub(lambda m: m.group(0) if m.group(2) == 'm' else '', line)
+                 for line in self.line_assembler.feed(data)]
+        self.process_lines(lines, show_lines=False)
+
+    def render_vt_screen(self):
+        """Push the screen rows that changed since the last render into terminal_display."""
+        screen = self.vt_screen
+        dirty = screen.take_dirty()
+        display = self.terminal_display
+        display.configure(state=tk.NORMAL)
+        has_blink = False
+        for y in dirty:
+            line = y + 1
+            display.delete(f"{line}.0", f"{line}.end")
+            args = []
+            for text, attr in screen.row_runs(y):
+                args.append(text)
+                args.append(self.vt_tag(attr))
+                has_blink = has_blink or attr[3]
+            display.insert(f"{line}.0", *args)
+            for start, end in link_spans(''.join(screen.chars[y])):
+                display.tag_add("hyperlink", f"{line}.{start}", f"{line}.{end}")
+        if has_blink:
+            self.start_blink_timer()
+        display.tag_remove("vt_cursor", "1.0", tk.END)
+        display.tag_add("vt_cursor", f"{screen.y + 1}.{screen.x}")
+        display.configure(state=tk.DISABLED)
+        display.see(f"{screen.y + 1}.0")
+
+    def vt_tag(self, attr):
+        """Return the Tk tags for a screen cell attribute, creating its tag on first use."""
+        tags = self.vt_tags.get(attr)
+        if tags is not None:
+            self.vt_tags.move_to_end(attr)
+            return tags
+        if len(self.vt_tags) >= VT_TAG_LIMIT:
+            self.evict_vt_tag()
+        fg, bg, bold, blink, underline, reverse = attr
+        if isinstance(fg, int) and fg < 8 and bold:
+            fg += 8
+        default_fg = "#ffffff" if bold else self.terminal_display.cget("fg")
+        default_bg = self.terminal_display.cget("bg")
+        fg_hex = color_hex(fg) if fg is not None else default_fg
+        bg_hex = color_hex(bg) if bg is not None else ""
+        if reverse:
+            fg_hex, bg_hex = bg_hex or default_bg, fg_hex
+        self.vt_tag_counter += 1
+        name = f"vt_{self.vt_tag_counter}"
+        self.terminal_display.tag_configure(name, foreground=fg_hex, background=bg_hex, underline=underline)
+        if not self.vt_tags:
+            self.terminal_display.tag_configure("vt_cursor", background="#808080")
+        # Newer tags win, so keep links, blink and the cursor above the colour tags
+        self.terminal_display.tag_raise("hyperlink")
+        self.terminal_display.tag_raise("blink")
+        self.terminal_display.tag_raise("vt_cursor")
+        tags = (name, "blink") if blink else (name,)
+        self.vt_tags[attr] = tags
+        return tags
+
+    def evict_vt_tag(self):
+        """Delete the least recently used grid tag; rows still showing it are redrawn next render."""
+        _, tags = self.vt_tags.popitem(last=False)
+        name = tags[0]
+        for start in self.terminal_display.tag_ranges(name)[::2]:
+            self.vt_screen.dirty.add(int(str(start).split('.')[0]) - 1)
+        self.terminal_display.tag_delete(name)
+
+    def reset_vt_tags(self):
+        """Delete every grid tag, e.g. on disconnect, and redraw the grid with fresh ones."""
+        for tags in self.vt_tags.values():
+            self.terminal_display.tag_delete(tags[0])
+        self.vt_tags.clear()
+        if self.full_screen_ansi.get():
+            self.vt_screen.dirty.update(range(self.vt_screen.rows))
+            if not self.render_scheduled:
+                self.render_scheduled = True
+                self.master.after_idle(self.flush_terminal_output)
+
+    def trim_scrollback(self):
+        """Delete the oldest terminal lines once the scrollback limit is exceeded.
+
+        Lines are removed in chunks of a tenth of the limit, so the widget is
+        trimmed only once every few hundred lines rather than on every insert.
+        """
+        if not self.scrollback_lines:
+            return
+        line_count = int(self.terminal_display.index("end-1c").split(".")[0])
+        chunk = max(self.scrollback_lines // 10, 100)
+        if line_count <= self.scrollback_lines + chunk:
+            return
+        cut = f"{line_count - self.scrollback_lines}.0"
+        if self.scrollback_spill:
+            try:
+                with open("scrollback.log", "a", encoding="utf-8") as file:
+                    file.write(self.terminal_display.get("1.0", cut))
+            except Exception as e:
+                render_log.error("Error writing scrollback spill: %s", e)
+        self.terminal_display.delete("1.0", cut)
 
     def show_thumbnail(self, url, event):
         """Display a thumbnail preview near the mouse pointer."""
@@ -4087,7 +4087,7 @@ class BBSTerminalApp:
                     self._handle_website_preview(url, label)
 
         except Exception as e:
-            print(f"Image preview error: {str(e)}")
+            media_log.error("Image preview error: %s", str(e))
             traceback.print_exc()  # Add this to get more details
             def update_label_error():
                 if self.preview_window and label.winfo_exists():
@@ -4118,7 +4118,7 @@ class BBSTerminalApp:
             photo = ImageTk.PhotoImage(first_frame)
             
             if is_animated_gif:
-                print(f"[DEBUG] Processing animated GIF with {getattr(img, 'n_frames', '?')} frames")
+                media_log.debug("Processing animated GIF with %s frames", getattr(img, 'n_frames', '?'))
                 
                 # Extract all frames using PIL.ImageSequence
                 frames = []
@@ -4134,7 +4134,7 @@ class BBSTerminalApp:
                         frame_copy.thumbnail(max_size)
                         frames.append(ImageTk.PhotoImage(frame_copy))
                     
-                    print(f"[DEBUG] Successfully extracted {len(frames)} frames from GIF using ImageSequence")
+                    media_log.debug("Successfully extracted %s frames from GIF using ImageSequence", len(frames))
                     
                     # Update the label and start animation
                     def update_label():
@@ -4155,7 +4155,7 @@ class BBSTerminalApp:
                     self.master.after(0, update_label)
                     
                 except Exception as e:
-                    print(f"[DEBUG] Error extracting frames: {e}")
+                    media_log.debug("Error extracting frames: %s", e)
                     traceback.print_exc()
                     # Fallback to static image if frame extraction fails
                     def update_label():
@@ -4172,7 +4172,7 @@ class BBSTerminalApp:
                 self.master.after(0, update_label)
 
         except Exception as e:
-            print(f"Error handling image preview: {e}")
+            media_log.error("Error handling image preview: %s", e)
             traceback.print_exc()
             def update_label_error():
                 if self.preview_window and label.winfo_exists():
@@ -4225,7 +4225,7 @@ class BBSTerminalApp:
             else:
                 raise Exception("Favicon not found")
         except Exception as e:
-            print(f"Favicon preview error: {e}")
+            media_log.error("Favicon preview error: %s", e)
             # Show domain name if favicon fails
             parsed_url = urlparse(url)
             def update_label():
@@ -4284,7 +4284,7 @@ class BBSTerminalApp:
                 image.thumbnail((200, 200))  # Set thumbnail size as needed.
                 return ImageTk.PhotoImage(image)
             except Exception as e:
-                print("Error loading thumbnail:", e)
+                media_log.error("Error loading thumbnail: %s", e)
         return None
 
     def show_preview(self, event, url):
@@ -4328,37 +4328,12 @@ class BBSTerminalApp:
         # Note: '30' now maps to 'darkgray' instead of 'black'
         return self.color_map.get(color_code, None)
 
-    def save_chatlog_message(self, username, message):
+    def save_chatlog_message(self, username, message, kind=None, recipient=None):
         """Save a message to the chatlog."""
-        chatlog = self.load_chatlog()
-        if username not in chatlog:
-            chatlog[username] = []
-        chatlog[username].append(message)
-
-        # Check if chatlog exceeds 1GB and trim if necessary
-        chatlog_size = len(json.dumps(chatlog).encode('utf-8'))
-        if chatlog_size > 1 * 1024 * 1024 * 1024:  # 1GB
-            self.trim_chatlog(chatlog)
-
-        self.save_chatlog(chatlog)
-
-    def load_chatlog(self):
-        """Load chatlog from a local file or initialize an empty dictionary."""
-        if os.path.exists("chatlog.json"):
-            with open("chatlog.json", "r") as file:
-                return json.load(file)
-        return {}
-
-    def save_chatlog(self, chatlog):
-        """Save chatlog to a local file."""
-        with open("chatlog.json", "w") as file:
-            json.dump(chatlog, file)
-
-    def trim_chatlog(self, chatlog):
-        """Trim the chatlog to fit within the size limit."""
-        usernames = list(chatlog.keys())
-
-
+        try:
+            self.chatlog_store.append(username, message, kind=kind, recipient=recipient)
+        except Exception as e:
+            persistence_log.error("Error saving chatlog message: %s", e)
 
     def save_panel_sizes(self):
         """Save current panel sizes to file with improved error handling."""
@@ -4382,15 +4357,15 @@ class BBSTerminalApp:
                                     "links": paned.winfo_width() - paned.sashpos(1)
                                 })
                             except tk.TclError as e:
-                                print(f"Warning: Could not get sash positions: {e}")
+                                persistence_log.warning("Could not get sash positions: %s", e)
                             break
                 except Exception as e:
-                    print(f"Warning: Error getting panel positions: {e}")
+                    persistence_log.warning("Error getting panel positions: %s", e)
                     
             with open("frame_sizes.json", "w") as f:
                 json.dump(sizes, f)
         except Exception as e:
-            print(f"Error saving frame sizes: {e}")
+            persistence_log.error("Error saving frame sizes: %s", e)
 
     def show_change_font_window(self):
         """Open a Toplevel window to change font, font size, font color, and background color."""
@@ -4582,7 +4557,7 @@ class BBSTerminalApp:
                 current_font = current_font[0]
                 current_size = int(current_font[1]) if len(current_font) > 1 else 10
         except Exception as e:
-            print(f"Error parsing font settings: {e}")
+            render_log.error("Error parsing font settings: %s", e)
             current_font = "Courier New"
             current_size = 10
 
@@ -4614,10 +4589,7 @@ class BBSTerminalApp:
         tk.Label(confirm_dialog, text=msg, padx=20, pady=10).pack()
         
         def confirm():
-            chatlog = self.load_chatlog()
-            if username in chatlog:
-                del chatlog[username]
-                self.save_chatlog(chatlog)
+            self.chatlog_store.delete_user(username)
             confirm_dialog.destroy()
             self.show_all_messages()
         
@@ -4663,131 +4635,219 @@ class BBSTerminalApp:
         self.chatlog_listbox.bind("<Button-3>", show_menu)
 
     def load_chatlog_list(self):
-        """Load chatlog from a local file and populate the listbox."""
-        chatlog = self.load_chatlog()
+        """Load chatlog users from the store and populate the listbox."""
         self.chatlog_listbox.delete(0, tk.END)
-        for username in chatlog.keys():
+        for username in self.chatlog_store.usernames():
             self.chatlog_listbox.insert(tk.END, username)
 
     def display_chatlog_messages(self, event=None):
-        """Display messages with clickable hyperlinks in the chatlog panel."""
-        chatlog = self.load_chatlog()
+        """Display the newest page of messages; older pages load when scrolled to the top."""
+        start = time.perf_counter()
         self.chatlog_display.configure(state=tk.NORMAL)
         self.chatlog_display.delete(1.0, tk.END)
         
         try:
             if event is None or not self.chatlog_listbox.curselection():
                 # Show all messages combined chronologically
-                all_messages = []
-                for username, messages in chatlog.items():
-                    all_messages.extend((username, msg) for msg in messages)
-                
-                # Sort by timestamp
-                all_messages.sort(key=lambda x: re.match(r'\[(.*?)\]', x[1]).group(1) if re.match(r'\[(.*?)\]', x[1]) else "0")
-                
-                for username, message in all_messages:
-                    self.chatlog_display.insert(tk.END, "> ")
-                    self.insert_message_with_hyperlinks(message, self.chatlog_display)
-                    self.chatlog_display.insert(tk.END, "\n\n")
+                self.chatlog_page_user = None
             else:
                 # Show messages for selected user
                 selected_index = self.chatlog_listbox.curselection()
-                username = self.chatlog_listbox.get(selected_index)
-                messages = chatlog.get(username, [])
-                messages.sort(key=lambda x: re.match(r'\[(.*?)\]', x).group(1) if re.match(r'\[(.*?)\]', x) else "0")
-                
-                for message in messages:
-                    self.chatlog_display.insert(tk.END, "> ")
-                    self.insert_message_with_hyperlinks(message, self.chatlog_display)
-                    self.chatlog_display.insert(tk.END, "\n\n")
+                self.chatlog_page_user = self.chatlog_listbox.get(selected_index)
+            
+            rows = self.chatlog_store.page(self.chatlog_page_user, limit=self.chatlog_page_size)
+            self.chatlog_page_cursor = (rows[0][0], rows[0][1]) if len(rows) == self.chatlog_page_size else None
+            for _, _, _, message in rows:
+                self.chatlog_display.insert(tk.END, "> ")
+                self.insert_message_with_hyperlinks(message, self.chatlog_display)
+                self.chatlog_display.insert(tk.END, "\n\n")
         
         except Exception as e:
-            print(f"Error displaying chatlog messages: {e}")
+            render_log.error("Error displaying chatlog messages: %s", e)
         finally:
             self.chatlog_display.configure(state=tk.DISABLED)
             self.chatlog_display.see(tk.END)
+        render_log.debug("Chatlog first page shown in %.1f ms", (time.perf_counter() - start) * 1000)
+
+    def on_chatlog_scroll(self, first, last):
+        """Scrollbar callback for the chatlog display; fetch an older page at the top."""
+        self.chatlog_scrollbar.set(first, last)
+        if float(first) <= 0.0 and self.chatlog_page_cursor and not self.chatlog_page_loading:
+            self.chatlog_page_loading = True
+            self.chatlog_display.after_idle(self.load_older_chatlog_page)
 
-    def insert_message_with_hyperlinks(self, text, text_widget):
+    def load_older_chatlog_page(self):
+        """Prepend the page of messages before the oldest one shown, keeping the view in place."""
+        try:
+            if not self.chatlog_page_cursor or not self.chatlog_display.winfo_exists():
+                return
+            rows = self.chatlog_store.page(self.chatlog_page_user, before=self.chatlog_page_cursor,
+                                           limit=self.chatlog_page_size)
+            self.chatlog_page_cursor = (rows[0][0], rows[0][1]) if len(rows) == self.chatlog_page_size else None
+            if not rows:
+                return
+
+            self.chatlog_display.configure(state=tk.NORMAL)
+            # Right gravity keeps the mark after each insert, so rows stay in order
+            self.chatlog_display.mark_set("page_insert", "1.0")
+            self.chatlog_display.mark_gravity("page_insert", tk.RIGHT)
+            for _, _, _, message in rows:
+                self.chatlog_display.insert("page_insert", "> ")
+                self.insert_message_with_hyperlinks(message, self.chatlog_display, "page_insert")
+                self.chatlog_display.insert("page_insert", "\n\n")
+            self.chatlog_display.configure(state=tk.DISABLED)
+            # Keep the message that was at the top in view
+            self.chatlog_display.yview("page_insert")
+        except Exception as e:
+            persistence_log.error("Error loading older chatlog messages: %s", e)
+        finally:
+            self.chatlog_page_loading = False
+
+    def search_chatlog(self, event=None):
+        """Show chatlog messages matching the search box, limited to the selected user if any."""
+        query = self.chatlog_search_var.get().strip()
+        if not query:
+            self.clear_chatlog_search()
+            return
+
+        selected_index = self.chatlog_listbox.curselection()
+        username = self.chatlog_listbox.get(selected_index) if selected_index else None
+
+        self.chatlog_display.configure(state=tk.NORMAL)
+        self.chatlog_display.delete(1.0, tk.END)
+        try:
+            start = time.perf_counter()
+            results = self.chatlog_store.search(query, username=username)
+            elapsed_ms = (time.perf_counter() - start) * 1000
+            scope = f" from {username}" if username else ""
+            self.chatlog_page_cursor = None  # No paging through search results
+            self.chatlog_display.insert(
+                tk.END, f"{len(results)} messages{scope} matching '{query}' ({elapsed_ms:.0f} ms)\n\n")
+            for _, message in results:
+                self.chatlog_display.insert(tk.END, "> ")
+                self.insert_message_with_hyperlinks(message, self.chatlog_display)
+                self.chatlog_display.insert(tk.END, "\n\n")
+        except Exception as e:
+            persistence_log.error("Error searching chatlog: %s", e)
+        finally:
+            self.chatlog_display.configure(state=tk.DISABLED)
+            self.chatlog_display.see(tk.END)
+
+    def clear_chatlog_search(self):
+        """Clear the search box and go back to the normal message view."""
+        self.chatlog_search_var.set("")
+        if self.chatlog_listbox.curselection():
+            self.chatlog_listbox.event_generate("<<ListboxSelect>>")
+        else:
+            self.display_chatlog_messages(None)
+
+    def insert_message_with_hyperlinks(self, text, text_widget, index=tk.END):
         """Insert text with hyperlinks into any text widget."""
-        url_pattern = re.compile(r'(https?://[^\s<>"\']+|www\.[^\s<>"\']+)')
-        last_end = 0
-        
-        for match in url_pattern.finditer(text):
-            start, end = match.span()
-            # Insert non-URL text
-            if start > last_end:
-                text_widget.insert(tk.END, text[last_end:start])
-                
-            # Clean and insert URL
-            url = text[start:end].rstrip('.,;:)]}\'"')
-            if url.startswith('www.'):
-                url = 'http://' + url
-            text_widget.insert(tk.END, url, "hyperlink")
-            
-            last_end = end
-        
-        # Insert remaining text
-        if last_end < len(text):
-            text_widget.insert(tk.END, text[last_end:])
+        for chars, url in split_links(text):
+            if url:
+                text_widget.insert(index, url, "hyperlink")
+            else:
+                text_widget.insert(index, chars)
 
     def update_members_display(self):
-        """Update the chat members display with bubble icons and adjust panel width."""
+        """Reconcile the member bubbles with chat_members, touching only what changed.
+
+        Buttons are kept in member_buttons by username. Departed members'
+        buttons are destroyed, new members get a button packed at their
+        sorted position, and nothing is done at all when the member set is
+        unchanged.
+        """
         if not self.members_frame or not self.members_frame.winfo_exists():
             return
-        # Clear existing widgets
-        for widget in self.members_frame.winfo_children():
-            widget.destroy()
+        members = sorted(self.chat_members, key=str.lower)
+        if members == self.member_order:
+            return
 
-        # Create a temporary label to measure text width
-        font = ("Arial VGA 437", 9, "bold")
-        test_label = ttk.Label(self.members_frame, font=font)
-        
-        # Calculate max width using character-based estimation - use only usernames without domains
-        max_width = 0
-        for member in sorted(self.chat_members):
-            # Strip domain for display purposes
-            display_name = member.split('@')[0] if '@' in member else member
-            
-            # Estimate width: each character is roughly 7 pixels wide in this font
-            # Add extra padding (40 pixels) for button margins and safety
-            text_width = (len(display_name) * 7) + 40
-            max_width = max(max_width, text_width)
-        
-        test_label.destroy()
-        
-        # Set width using panel_width class variable rather than dynamically calculating
-        members_frame = self.members_frame.master.master  # Get the outer frame
-        members_frame.configure(width=self.panel_width)
+        for member in list(self.member_buttons):
+            if member not in self.chat_members:
+                self.member_buttons.pop(member).destroy()
 
-        # Create member buttons
-        style = ttk.Style()
-        for i, member in sorted(enumerate(self.chat_members)):
+        for index, member in enumerate(members):
+            if member in self.member_buttons:
+                continue
             # Strip domain for display purposes
             display_name = member.split('@')[0] if '@' in member else member
-            
-            bg_color = self.random_color()
-            style_name = f"Member{i}.TButton"
-            style.configure(style_name,
-                padding=(10, 5),
-                relief="raised",
-                background=bg_color,
-                borderwidth=2,
-                font=font)
-
-            # Use display_name for UI but store full member value for functionality
-            button = ttk.Button(self.members_frame, 
+            button = ttk.Button(self.members_frame,
                               text=display_name,
-                              style=style_name,
-                              )
-            button.pack(pady=2, padx=5, fill=tk.X, expand=False, ipadx=10)
-            
+                              style=self.member_style(member))
+            pack_options = dict(pady=2, padx=5, fill=tk.X, expand=False, ipadx=10)
+            if index > 0:
+                button.pack(after=self.member_buttons[members[index - 1]], **pack_options)
+            elif self.members_frame.pack_slaves():
+                button.pack(before=self.members_frame.pack_slaves()[0], **pack_options)
+            else:
+                button.pack(**pack_options)
+
             # Keep full name with domain in the lambda for proper functionality
             button.bind('<Button-1>', lambda e, m=member: self.select_member(m))
-            button.bind('<Enter>', lambda e, b=button, s=style_name: self.on_button_hover(b, True, s))
-            button.bind('<Leave>', lambda e, b=button, s=style_name: self.on_button_hover(b, False, s))
+            button.bind('<Enter>', lambda e, m=member: self.on_member_hover(m, True))
+            button.bind('<Leave>', lambda e, m=member: self.on_member_hover(m, False))
+            button.bind('<Button-3>', lambda e, m=member: self.show_member_menu(e, m))
+            self.member_buttons[member] = button
 
+        self.member_order = members
+
+        # Set width using panel_width class variable rather than dynamically calculating
+        members_frame = self.members_frame.master.master  # Get the outer frame
+        members_frame.configure(width=self.panel_width)
         self.members_frame.update_idletasks()
 
+    def member_style(self, member, hover=False):
+        """Return the button style for a member: selected, or its stable palette colour."""
+        if member == getattr(self, 'selected_member', None):
+            return "BubbleSelected.TButton"
+        return self.palette_style(member, hover)
+
+    def palette_style(self, name, hover=False):
+        """Return the palette button style for name; the same name always gets the same colour."""
+        index = zlib.crc32(name.lower().encode('utf-8')) % len(MEMBER_PALETTE)
+        return f"MemberHover{index}.TButton" if hover else f"Member{index}.TButton"
+
+    def show_member_menu(self, event, member):
+        """Show a member's presence and activity in a right-click menu."""
+        record = self.presence.get(member) or {}
+
+        def format_time(timestamp):
+            if not timestamp:
+                return "never"
+            return time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(timestamp))
+
+        menu = tk.Menu(self.master, tearoff=0)
+        for label in (f"Last seen: {format_time(record.get('last_seen'))}",
+                      f"Last spoke: {format_time(record.get('last_spoke'))}",
+                      f"Messages today: {self.presence.messages_today(member)}",
+                      f"Messages total: {record.get('messages', 0)}"):
+            menu.add_command(label=label, state=tk.DISABLED)
+        menu.add_separator()
+        menu.add_command(label="Select", command=lambda: self.select_member(member))
+        try:
+            menu.tk_popup(event.x_root, event.y_root)
+        finally:
+            menu.grab_release()
+
+    def schedule_presence_save(self, delay=5000):
+        """Save the presence index after a short delay, once per batch of updates."""
+        if self.presence_save_pending:
+            return
+        self.presence_save_pending = True
+        self.master.after(delay, self.save_presence)
+
+    def save_presence(self):
+        """Hand the presence index to the state store for writing."""
+        self.presence_save_pending = False
+        self.state_store.update("presence.json", self.presence.to_json())
+
+    def on_member_hover(self, member, is_hovering):
+        """Darken a member bubble while the pointer is over it."""
+        button = self.member_buttons.get(member)
+        if button:
+            button.configure(style=self.member_style(member, hover=is_hovering))
+
     def update_chat_members(self, lines_with_users):
         """Update chat members list with enhanced support for multiple banner formats."""
         # Preserve important settings before any processing
@@ -4795,101 +4855,13 @@ class BBSTerminalApp:
         bannerless_mode_state = self.bannerless_mode.get()
         keep_alive_state = self.keep_alive_enabled.get()
         
-        print(f"[DEBUG] Preserving settings - Auto Logon: {auto_logon_state}, Bannerless: {bannerless_mode_state}, Keep Alive: {keep_alive_state}")
-        
-        # Combine lines and clean ANSI codes
-        combined = " ".join(lines_with_users)
-        combined_clean = re.sub(r'\x1b\[[0-9;]*m', '', combined)
-        print(f"[DEBUG] Raw banner: {combined_clean}")
-        
-        # Store previous members before updating with new members
-        previous_members = set(self.chat_members)
+        parse_log.debug("Preserving settings - Auto Logon: %s, Bannerless: %s, Keep Alive: %s", auto_logon_state, bannerless_mode_state, keep_alive_state)
         
-        # Extract users from multiple banner formats
-        final_usernames = set()
-        
-        # Extract topic first - we'll use this to clean up the user section
-        topic = ""
-        topic_patterns = [
-            r'Topic:\s*\((.*?)\)',
-            r'Topic:\s*(.*?)(?=\s*\w+\@|\s*\w+,|\s*\w+\s+and|\s+\w+\s+are|\s+\w+\s+is)',
-        ]
-        
-        for pattern in topic_patterns:
-            topic_match = re.search(pattern, combined_clean)
-            if topic_match:
-                topic = topic_match.group(1).strip()
-                print(f"[DEBUG] Extracted topic: {topic}")
-                break
-        
-        # First try to identify the "X Y and Z are here with you" pattern
-        # This pattern specifically handles names with spaces when followed by "and"
-        names_with_spaces_pattern = re.compile(r'(\w+(?:\s+\w+)?(?:@\w+)?)\s+and\s+(\w+(?:@\w+)?)\s+are\s+here')
-        names_match = names_with_spaces_pattern.search(combined_clean)
-        
-        if names_match:
-            # Found names with potential spaces
-            first_name = names_match.group(1).strip()
-            second_name = names_match.group(2).strip()
-            
-            # Check if these are valid names
-            if first_name and len(first_name) > 1:
-                final_usernames.add(first_name)
-            
-            if second_name and len(second_name) > 1:
-                final_usernames.add(second_name)
-                
-            print(f"[DEBUG] Found multi-word usernames: {final_usernames}")
-        
-        # If no username with spaces found, fall back to regular patterns
-        if not final_usernames:
-            # Try standard patterns for usernames
-            username_patterns = [
-                # Pattern for "X is here with you"
-                r'(\w+(?:@\w+)?)\s+is\s+here\s+with\s+you',
-                # Pattern for "X, Y, and Z are here with you"
-                r'(\w+(?:@\w+)?),?\s+(\w+(?:@\w+)?),?\s+and\s+(\w+(?:@\w+)?)\s+are\s+here',
-                # Pattern for "X and Y are here with you"
-                r'(\w+(?:@\w+)?)\s+and\s+(\w+(?:@\w+)?)\s+are\s+here',
-                # Pattern for comma-separated list
-                r'(\w+(?:@\w+)?),\s+(\w+(?:@\w+)?),\s+(\w+(?:@\w+)?)'
-            ]
-            
-            for pattern in username_patterns:
-                matches = re.findall(pattern, combined_clean)
-                if matches:
-                    # Handle both tuple results and string results
-                    for match in matches:
-                        if isinstance(match, tuple):
-                            for username in match:
-                                if username and len(username) > 1:  # Valid username check
-                                    final_usernames.add(username.strip())
-                        else:
-                            if match and len(match) > 1:  # Valid username check
-                                final_usernames.add(match.strip())
-                    
-                    if final_usernames:
-                        print(f"[DEBUG] Found users with standard patterns: {final_usernames}")
-                        break
-        
-        # If still no usernames found, try the more complex extraction
-        if not final_usernames:
-            # Add more complex extraction here...
-            # Try to extract usernames from common phrases in BBS banners
-            
-            # Extract the "are here with you" section which usually contains usernames
-            here_with_you_match = re.search(r'(.*?)\s+are\s+here\s+with\s+you', combined_clean)
-            if here_with_you_match:
-                user_section = here_with_you_match.group(1).strip()
-                
-                # Try to identify names with capitalized first letters (better indicator of proper names)
-                capitalized_names = re.findall(r'([A-Z][a-z]+(?:\s+[A-Z][a-z]+)?)', user_section)
-                
-                for name in capitalized_names:
-                    if name and len(name) > 1 and name.lower() not in ['topic', 'channel']:
-                        final_usernames.add(name)
-                
-                print(f"[DEBUG] Found capitalized usernames: {final_usernames}")
+        banner = parse_banner(lines_with_users)
+        if banner.topic:
+            parse_log.debug("Extracted topic: %s", banner.topic)
+        parse_log.debug("Found usernames: %s", banner.users)
+        final_usernames = set(banner.users)
         
         # Always include Chatbot in the list
         final_usernames.add('Chatbot')
@@ -4897,14 +4869,16 @@ class BBSTerminalApp:
         # Update the chat members if we found valid usernames
         if final_usernames:
             self.chat_members = final_usernames
-            print(f"[DEBUG] Updated chat members: {self.chat_members}")
+            parse_log.debug("Updated chat members: %s", self.chat_members)
             self.save_chat_members_file()
-            
-            # Update last seen time for each user
-            current_time = time.time()
-            for member in self.chat_members:
-                self.last_seen[member] = current_time
-            self.save_last_seen_file()
+
+            # Update last seen time for each user, and who joined or left. A
+            # banner that parsed to nobody is not everyone leaving the room
+            if banner.users:
+                joined, left = self.presence.note_members(self.chat_members)
+                if joined or left:
+                    parse_log.debug("Members joined: %s, left: %s", sorted(joined), sorted(left))
+                self.schedule_presence_save()
             
             # Update the UI display on the main thread
             if threading.current_thread() is threading.main_thread():
@@ -4917,7 +4891,7 @@ class BBSTerminalApp:
         self.auto_logon_enabled.set(auto_logon_state)
         self.bannerless_mode.set(bannerless_mode_state)
         self.keep_alive_enabled.set(keep_alive_state)
-        print(f"[DEBUG] Restored settings - Auto Logon: {auto_logon_state}, Bannerless: {bannerless_mode_state}, Keep Alive: {keep_alive_state}")
+        parse_log.debug("Restored settings - Auto Logon: %s, Bannerless: %s, Keep Alive: %s", auto_logon_state, bannerless_mode_state, keep_alive_state)
         
         # Instead of toggling, directly restart keep-alive if it was enabled
         if keep_alive_state:
@@ -4935,23 +4909,17 @@ class BBSTerminalApp:
             
         # Then start it if enabled
         if self.keep_alive_enabled.get():
-            print("[DEBUG] Restarting keep-alive mechanism")
+            net_log.debug("Restarting keep-alive mechanism")
             self.start_keep_alive()
             
     def play_ding_sound(self):
         """Play a standard ding sound effect."""
         winsound.MessageBeep(winsound.MB_ICONEXCLAMATION)
 
-    async def _send_message(self, message):
-        """Async helper method to send messages."""
-        if self.connected and self.writer:
-            self.writer.write(message)
-            await self.writer.drain()
-
     def update_actions_listbox(self):
         """Update the Actions panel with parsed actions and adjust panel width."""
         if not self.actions:
-            print("[DEBUG] No actions to display")
+            parse_log.debug("No actions to display")
             return
             
         # Calculate max width using character-based estimation
@@ -5009,35 +4977,23 @@ class BBSTerminalApp:
     def create_action_button(self, index, action):
         """Helper method to create an action button."""
         try:
-            # Create the button in the scrollable frame instead of actions_frame
-            style = ttk.Style()
-            style_name = f"Action{index}.TButton"
-            bg_color = self.random_color()
-            
-            style.configure(
-                style_name,
-                padding=(10, 5),
-                relief="raised",
-                background=bg_color,
-                borderwidth=2,
-                font=("Arial VGA 437", 9, "bold")
-            )
-
+            # Create the button in the scrollable frame instead of actions_frame;
+            # actions share the member bubbles' palette styles
             button = ttk.Button(
                 self.actions_scrollable_frame,
                 text=action,
-                style=style_name,
+                style=self.palette_style(action),
                 command=lambda a=action: self.on_action_select(a)  # Use command for better click handling
                 )  # Removed fixed width property
             # Add padding around text instead
             button.pack(pady=2, padx=5, fill=tk.X, expand=False, ipadx=10)  # Added ipadx for minimal padding
             
             # Keep only hover bindings, removed the Button-1 binding
-            button.bind('<Enter>', lambda e, b=button, s=style_name: self.on_button_hover(b, True, s))
-            button.bind('<Leave>', lambda e, b=button, s=style_name: self.on_button_hover(b, False, s))
+            button.bind('<Enter>', lambda e, b=button, a=action: b.configure(style=self.palette_style(a, hover=True)))
+            button.bind('<Leave>', lambda e, b=button, a=action: b.configure(style=self.palette_style(a)))
             
         except Exception as e:
-            print(f"[DEBUG] Error creating action button: {e}")
+            parse_log.debug("Error creating action button: %s", e)
 
     def on_action_select(self, action):
         """Handle action selection with or without a target username."""
@@ -5049,77 +5005,146 @@ class BBSTerminalApp:
                 action_command = action
                 
             # Send the action
-            asyncio.run_coroutine_threadsafe(
-                self._send_message(action_command + "\r\n"), 
-                self.loop
-            )
+            self.outbound.send(action_command + "\r\n")
             
             # Deselect member if one was selected
             self.deselect_all_members()
 
-    def store_hyperlink(self, url, sender="Unknown", timestamp=None):
-        """Store a hyperlink with metadata."""
-        if timestamp is None:
-            timestamp = time.strftime("[%Y-%m-%d %H:%M:%S]")
-        
-        links = self.load_links_history()
-        links.append({
-            "url": url,
-            "sender": sender,
-            "timestamp": timestamp
-        })
-        self.save_links_history(links)
+    def store_hyperlink(self, url, sender=None, timestamp=None, message=None):
+        """Store a hyperlink with metadata; a message already recorded is not counted again."""
+        self.links_store.record(url, sender, timestamp, message)
+        self.schedule_links_flush()
         
         # Update links display if window is open
-        if self.chatlog_window and self.chatlog_window.winfo_exists():
-            self.display_stored_links()
+        self.queue_links_update(url)
 
-    def load_links_history(self):
-        """Load stored hyperlinks from file."""
-        if os.path.exists("hyperlinks.json"):
-            with open("hyperlinks.json", "r") as file:
-                return json.load(file)
-        return []
+    def note_hyperlink(self, url):
+        """Store a hyperlink seen while rendering or clicking, unless it is already known."""
+        if not self.links_store.ensure(url):
+            return
+        self.schedule_links_flush()
+        self.queue_links_update(url)
+
+    def schedule_links_flush(self, delay=2000):
+        """Write changed hyperlink records to disk after a short delay, once per batch."""
+        if self.links_flush_pending:
+            return
+        self.links_flush_pending = True
+        self.master.after(delay, self.flush_links)
 
-    def save_links_history(self, links):
-        """Save hyperlinks to file."""
-        with open("hyperlinks.json", "w") as file:
-            json.dump(links, file)
+    def flush_links(self):
+        """Flush pending hyperlink records to the journal."""
+        self.links_flush_pending = False
+        self.links_store.flush()
 
     def clear_links_history(self):
         """Clear all stored hyperlinks."""
-        self.save_links_history([])
+        self.links_store.clear()
         if self.chatlog_window and self.chatlog_window.winfo_exists():
             self.display_stored_links()
 
+    def links_panel_open(self):
+        """Return True if the chatlog window's links panel exists."""
+        return bool(self.chatlog_window and self.chatlog_window.winfo_exists()
+                    and hasattr(self, 'links_display'))
+
     def display_stored_links(self):
-        """Display stored hyperlinks in the links panel with top scroll positioning."""
-        if not hasattr(self, 'links_display'):
+        """Display the newest page of stored hyperlinks in the links panel."""
+        if not self.links_panel_open():
             return
 
         self.links_display.configure(state=tk.NORMAL)
         self.links_display.delete(1.0, tk.END)
+        for tag in self.links_rows.values():
+            self.links_display.tag_delete(tag)
+        self.links_rows.clear()
+        self.links_pending_urls.clear()
+        self.links_visible_limit = self.links_page_size
         
-        links = self.load_links_history()
-        # Display links in reverse chronological order
-        links.reverse()
-        
-        for link in links:
-            timestamp = link.get("timestamp", "")
-            sender = link.get("sender", "Unknown")
-            url = link.get("url", "")
-            
-            # Skip empty or invalid URLs
-            if not url or url == "http://":
-                continue
-                
-            self.links_display.insert(tk.END, f"{timestamp} from {sender}:\n")
-            self.links_display.insert(tk.END, f"{url}\n\n", "hyperlink")
+        # Display links in reverse chronological order of their last sighting
+        for link in self.links_store.page(0, self.links_visible_limit):
+            self.insert_link_row(link, tk.END)
         
         self.links_display.configure(state=tk.DISABLED)
         # Ensure we start at the top
         self.links_display.see("1.0")
 
+    def insert_link_row(self, link, index):
+        """Insert one link entry at index, tagged so it can be moved or removed later."""
+        url = link["url"]
+        
+        # Skip empty or invalid URLs
+        if not url or url == "http://":
+            return
+            
+        self.links_row_counter += 1
+        row_tag = f"linkrow-{self.links_row_counter}"
+        senders = ", ".join(link["senders"]) or "Unknown"
+        seen = f" (x{link['count']})" if link["count"] > 1 else ""
+        self.links_display.insert(index,
+                                  f"{link['last_seen']} from {senders}{seen}:\n", (row_tag,),
+                                  f"{url}\n\n", ("hyperlink", row_tag))
+        self.links_rows[url] = row_tag
+        if index != tk.END:
+            self.links_rows.move_to_end(url, last=False)
+
+    def remove_link_row(self, url):
+        """Delete the row shown for url, if any."""
+        row_tag = self.links_rows.pop(url, None)
+        if row_tag is None:
+            return
+        ranges = self.links_display.tag_ranges(row_tag)
+        if ranges:
+            self.links_display.delete(ranges[0], ranges[-1])
+        self.links_display.tag_delete(row_tag)
+
+    def queue_links_update(self, url):
+        """Queue url to be moved to the top of the links panel on the next idle tick."""
+        if not self.links_panel_open():
+            return
+        self.links_pending_urls.add(url)
+        if not self.links_update_scheduled:
+            self.links_update_scheduled = True
+            self.master.after_idle(self.apply_links_updates)
+
+    def apply_links_updates(self):
+        """Prepend links that changed since the last tick and trim the panel to its row cap."""
+        self.links_update_scheduled = False
+        pending = self.links_pending_urls
+        self.links_pending_urls = set()
+        if not pending or not self.links_panel_open():
+            return
+
+        records = [self.links_store.links[url] for url in pending if url in self.links_store.links]
+        # Oldest first, so the most recent ends up on top after prepending
+        records.sort(key=lambda record: record["last_seen"])
+
+        self.links_display.configure(state=tk.NORMAL)
+        for link in records:
+            self.remove_link_row(link["url"])
+            self.insert_link_row(link, "1.0")
+        while len(self.links_rows) > self.links_visible_limit:
+            self.remove_link_row(next(reversed(self.links_rows)))
+        self.links_display.configure(state=tk.DISABLED)
+
+    def on_links_scroll(self, first, last):
+        """Scrollbar callback for the links panel; load older links at the bottom."""
+        self.links_scrollbar.set(first, last)
+        if float(last) >= 1.0 and len(self.links_rows) >= self.links_visible_limit:
+            self.links_visible_limit += self.links_page_size
+            self.master.after_idle(self.load_older_links)
+
+    def load_older_links(self):
+        """Append the next page of older links below those already shown."""
+        if not self.links_panel_open():
+            return
+        self.links_display.configure(state=tk.NORMAL)
+        shown = len(self.links_rows)
+        for link in self.links_store.page(shown, self.links_visible_limit - shown):
+            if link["url"] not in self.links_rows:
+                self.insert_link_row(link, tk.END)
+        self.links_display.configure(state=tk.DISABLED)
+
     def open_chatlog_hyperlink(self, event):
         """Handle clicking a hyperlink in the chatlog links panel."""
         index = self.links_display.index("@%s,%s" % (event.x, event.y))
@@ -5155,51 +5180,20 @@ class BBSTerminalApp:
                 break
 
     def parse_and_store_hyperlinks(self, message, sender=None):
-        """Extract and store hyperlinks from a message with improved handling for all formats."""
-        # More comprehensive URL pattern with improved handling for complex URLs
-        url_pattern = re.compile(r'(https?://[^\s<>"\']+|www\.[^\s<>"\']+)')
-        
-        # Debug output to track message processing
-        print(f"[DEBUG] Parsing links from message: {message}")
-        print(f"[DEBUG] Sender: {sender}")
-        
-        # Extract all URLs from the message
-        urls = url_pattern.findall(message)
-        
-        print(f"[DEBUG] Found URLs: {urls}")
-        
-        # Clean URLs (remove trailing punctuation)
-        cleaned_urls = []
-        for url in urls:
-            # Remove trailing punctuation that might have been caught
-            url = re.sub(r'[.,;:)}\]]+$', '', url)
-            # Add http:// to www. urls
-            if url.startswith('www.'):
-                url = 'http://' + url
-            cleaned_urls.append(url)
+        """Extract and store hyperlinks from a message."""
+        urls = extract_urls(message)
+        if not urls:
+            return
+        parse_log.debug("Found URLs from %s: %s", sender, urls)
         
         timestamp = time.strftime("[%Y-%m-%d %H:%M:%S]")
-        
-
-
-        for url in cleaned_urls:
-            print(f"[DEBUG] Storing URL: {url} from {sender}")  # Debug line
-
-        for match in url_pattern.finditer(message):
-            url = match.group(1).strip()
-            if url.startswith('www.'):
-                url = 'http://' + url
-
-            self.store_hyperlink(url, sender, timestamp)
+        for url in urls:
+            self.store_hyperlink(url, sender, timestamp, message)
             
-             # Check if it's an image/GIF URL and update the preview frame
+            # Check if it's an image/GIF URL and update the preview frame
             if any(url.lower().endswith(ext) for ext in ['.jpg', '.jpeg', '.png', '.gif']):
                 self.update_latest_image_frame(url)
 
-            # Make sure to update the links display if window is open
-            if hasattr(self, 'chatlog_window') and self.chatlog_window and self.chatlog_window.winfo_exists():
-                self.master.after(0, self.display_stored_links)
-
     def show_all_messages(self):
         """Deselect user and show all messages combined."""
         self.chatlog_listbox.selection_clear(0, tk.END)
@@ -5212,7 +5206,7 @@ class BBSTerminalApp:
                 with open("font_settings.json", "r") as file:
                     return json.load(file)
         except Exception as e:
-            print(f"Error loading font settings: {e}")
+            persistence_log.error("Error loading font settings: %s", e)
         return {
             'font_name': "Courier New",
             'font_size': 10,
@@ -5231,10 +5225,7 @@ class BBSTerminalApp:
                                  f"Are you sure you want to delete {username} and their chat logs?",
                                  icon='warning'):
             # Remove from chatlog
-            chatlog = self.load_chatlog()
-            if username in chatlog:
-                del chatlog[username]
-                self.save_chatlog(chatlog)
+            self.chatlog_store.delete_user(username)
             
             # Remove from listbox
             self.chatlog_listbox.delete(selected)
@@ -5262,7 +5253,7 @@ class BBSTerminalApp:
                 with open("frame_sizes.json", "r") as f:
                     return json.load(f)
         except Exception as e:
-            print(f"Error loading frame sizes: {e}")
+            persistence_log.error("Error loading frame sizes: %s", e)
         return {}
 
     def save_frame_sizes(self):
@@ -5285,14 +5276,14 @@ class BBSTerminalApp:
                                 "links": paned.winfo_width() - paned.sashpos(1)
                             })
                         except tk.TclError:
-                            print("Warning: Could not get sash positions")
+                            persistence_log.warning("Could not get sash positions")
                 except Exception as e:
-                    print(f"Warning: Error getting panel positions: {e}")
+                    persistence_log.warning("Error getting panel positions: %s", e)
                     
             with open("frame_sizes.json", "w") as f:
                 json.dump(sizes, f)
         except Exception as e:
-            print(f"Error saving frame sizes: {e}")
+            persistence_log.error("Error saving frame sizes: %s", e)
 
     def load_saved_settings(self):
         """Load all saved UI settings."""
@@ -5309,7 +5300,7 @@ class BBSTerminalApp:
                     self.bannerless_mode.set(settings.get('bannerless_mode', False))
                     return settings
         except Exception as e:
-            print(f"Error loading settings: {e}")
+            persistence_log.error("Error loading settings: %s", e)
         return {}
 
     def apply_saved_settings(self):
@@ -5329,17 +5320,17 @@ class BBSTerminalApp:
                         try:
                             self.paned.sash_place(0, settings['paned_pos'], 0)
                         except Exception as e:
-                            print(f"Error setting sash position: {e}")
+                            persistence_log.error("Error setting sash position: %s", e)
                     self.master.after(100, set_sash)
             except Exception as e:
-                print(f"Error applying paned window settings: {e}")
+                persistence_log.error("Error applying paned window settings: %s", e)
 
         # Apply window geometry if saved
         if 'window_geometry' in settings:
             try:
                 self.master.geometry(settings['window_geometry'])
             except Exception as e:
-                print(f"Error setting window geometry: {e}")
+                persistence_log.error("Error setting window geometry: %s", e)
 
         # Apply Messages to You visibility
         if not settings.get('show_messages', True):
@@ -5359,27 +5350,25 @@ class BBSTerminalApp:
             if self.actions_list_requested:
                 return
                 
-            print("[DEBUG] Requesting actions list sequence")
+            net_log.debug("Requesting actions list sequence")
             self.actions_list_requested = True
             
             try:
                 # Send action list request with proper writer access
-                print("[DEBUG] Sending /a list command")
-                self.writer.write("/a list\r\n")
-                await self.writer.drain()  # Use writer's drain method
+                net_log.debug("Sending /a list command")
+                self.outbound.send("/a list\r\n")
                 
                 # Wait briefly
                 await asyncio.sleep(0.5)
                 
                 # Send enter keystroke
-                print("[DEBUG] Sending enter keystroke")
-                self.writer.write("\r\n")
-                await self.writer.drain()  # Use writer's drain method
+                net_log.debug("Sending enter keystroke")
+                self.outbound.send("\r\n")
                 
-                print("[DEBUG] Actions list request sequence completed")
+                net_log.debug("Actions list request sequence completed")
                 
             except Exception as e:
-                print(f"[DEBUG] Error in request_actions_list: {e}")
+                net_log.debug("Error in request_actions_list: %s", e)
             finally:
                 self.actions_list_requested = False
 
@@ -5390,14 +5379,10 @@ class BBSTerminalApp:
                 try:
                     await self.request_actions_list()
                 except Exception as e:
-                    print(f"[DEBUG] Error in send_actions_request: {e}")
+                    net_log.debug("Error in send_actions_request: %s", e)
             
-            future = asyncio.run_coroutine_threadsafe(send(), self.loop)
-            try:
-                # Wait for completion with timeout
-                future.result(timeout=5)
-            except Exception as e:
-                print(f"Error during actions request: {e}")
+            # Don't wait on the future; the sends are ordered by the outbound queue
+            asyncio.run_coroutine_threadsafe(send(), self.loop)
 
     def setup_autocorrect(self):
         """Initialize autocorrect functionality."""
@@ -5441,7 +5426,7 @@ class BBSTerminalApp:
                 self.current_misspelled = None
                 self.close_spelling_popup()
         except Exception as e:
-            print(f"Spell check error: {e}")
+            parse_log.error("Spell check error: %s", e)
 
     def show_spelling_popup(self, word, suggestions):
         """Display spelling suggestions popup."""
@@ -5475,10 +5460,10 @@ class BBSTerminalApp:
                 self.current_sound = "directed"
                 winsound.PlaySound(self.directed_sound_file, winsound.SND_FILENAME | winsound.SND_ASYNC)
             except Exception as e:
-                print(f"Error playing directed sound: {e}")
+                media_log.error("Error playing directed sound: %s", e)
                 self.current_sound = None
         else:
-            print(f"Directed sound file not found: {self.directed_sound_file}")
+            media_log.info("Directed sound file not found: %s", self.directed_sound_file)
 
 
     # Add this method to your BBSTerminalApp class
@@ -5508,7 +5493,7 @@ class BBSTerminalApp:
                 self.chatlog_display.configure(**other_displays_settings)
                 
         except Exception as e:
-            print(f"Error updating display font: {e}")
+            render_log.error("Error updating display font: %s", e)
 
     def handle_escape(self, event=None):
         """Handle escape key press for autocorrect."""
@@ -5549,27 +5534,11 @@ class BBSTerminalApp:
 
     def select_member(self, member):
         """Select a member from the chat list."""
-        print(f"Selected member: {member}")
+        parse_log.info("Selected member: %s", member)
         self.selected_member = member
         # Highlight the selected member's button
-        for child in self.members_frame.winfo_children():
-            if isinstance(child, ttk.Button):
-                if child['text'] == member:
-                    child.configure(style="BubbleSelected.TButton")
-                else:
-                    child.configure(style="Bubble.TButton")
-
-    def on_button_hover(self, button, is_hovering, style_name):
-        """Handle hover effects for bubble buttons."""
-        style = ttk.Style()
-        if is_hovering:
-            if not hasattr(button, '_original_bg'):
-                button._original_bg = style.lookup(style_name, 'background')
-            # Darken the button slightly on hover
-            style.configure(style_name, background=self.darken_color(button._original_bg))
-        else:
-            if hasattr(button, '_original_bg'):
-                style.configure(style_name, background=button._original_bg)
+        for name, button in self.member_buttons.items():
+            button.configure(style=self.member_style(name))
 
     def darken_color(self, color):
         """Darken a hex color by 20%."""
@@ -5579,31 +5548,22 @@ class BBSTerminalApp:
         darkened = tuple(int(c * 0.8) for c in rgb)
         return f"#{darkened[0]:02x}{darkened[1]:02x}{darkened[2]:02x}"
 
-    def random_color(self):
-        """Generate a random color with sufficient contrast."""
-        # Generate pastel colors for better readability
-        r = random.randint(100, 255)
-        g = random.randint(100, 255)
-        b = random.randint(100, 255)
-        return f"#{r:02x}{g:02x}{b:02x}"
-
-
     def init_audio_player(self):
         """Initialize the audio player with expanded plugin discovery and debug output."""
         if vlc is None:
-            print("VLC module is not available")
+            media_log.info("VLC module is not available")
             return
 
         try:
-            print(f"[DEBUG] VLC version: {vlc.__version__}")
-            print(f"[DEBUG] Python version: {sys.version}")
+            media_log.debug("VLC version: %s", vlc.__version__)
+            media_log.debug("Python version: %s", sys.version)
             
             # Create a plugins directory if needed (for packaged app)
             if getattr(sys, 'frozen', False):
                 plugins_dir = os.path.join(os.path.dirname(sys.executable), 'plugins')
                 if not os.path.exists(plugins_dir):
                     os.makedirs(plugins_dir)
-                print(f"[DEBUG] Created plugins directory: {plugins_dir}")
+                media_log.debug("Created plugins directory: %s", plugins_dir)
             
             # Set environment variables
             os.environ["VLC_VERBOSE"] = "-1"
@@ -5625,15 +5585,15 @@ class BBSTerminalApp:
             try:
                 # Create VLC instance with full parameters
                 self.vlc_instance = vlc.Instance(*instance_params)
-                print("[DEBUG] VLC initialized with full parameters")
+                media_log.debug("VLC initialized with full parameters")
             except Exception as e:
-                print(f"[DEBUG] Full VLC init failed: {e}")
+                media_log.debug("Full VLC init failed: %s", e)
                 try:
                     # Fallback to minimal parameters
                     self.vlc_instance = vlc.Instance('--quiet', '--no-xlib')
-                    print("[DEBUG] VLC initialized with minimal parameters")
+                    media_log.debug("VLC initialized with minimal parameters")
                 except Exception as e2:
-                    print(f"[DEBUG] Minimal VLC init failed: {e2}")
+                    media_log.debug("Minimal VLC init failed: %s", e2)
                     self.vlc_instance = None
                     return
             
@@ -5642,15 +5602,15 @@ class BBSTerminalApp:
             
             # Log player capabilities
             if hasattr(self.player, 'get_version'):
-                print(f"[DEBUG] VLC player version: {self.player.get_version()}")
+                media_log.debug("VLC player version: %s", self.player.get_version())
             
             self.current_stream = None
             self.is_playing = False
             
-            print("[DEBUG] VLC audio player initialized successfully")
+            media_log.debug("VLC audio player initialized successfully")
             
         except Exception as e:
-            print(f"[ERROR] Error initializing audio player: {e}")
+            media_log.error("Error initializing audio player: %s", e)
             traceback.print_exc()
             self.vlc_instance = None
             self.player = None
@@ -5658,7 +5618,7 @@ class BBSTerminalApp:
     def play_audio_stream(self, url):
         """Play audio stream with advanced handling for complex podcast URLs."""
         try:
-            print(f"[DEBUG] Attempting to play: {url}")
+            media_log.debug("Attempting to play: %s", url)
             
             # Special handling for complex podcast URLs
             if ('podderapp.com' in url or 'podtrac.com' in url or 'redirect.mp3' in url or 
@@ -5679,7 +5639,7 @@ class BBSTerminalApp:
                 self.init_audio_player()
                 
             if not self.vlc_instance:
-                print("[ERROR] VLC not available")
+                media_log.error("VLC not available")
                 self.track_info.config(text="Error: VLC not available")
                 return
                 
@@ -5699,7 +5659,7 @@ class BBSTerminalApp:
             self.master.after(1000, self.update_seek_bar)
                 
         except Exception as e:
-            print(f"[ERROR] Error playing audio stream: {e}")
+            media_log.error("Error playing audio stream: %s", e)
             traceback.print_exc()
             self.track_info.config(text=f"Error: {str(e)}")
 
@@ -5715,7 +5675,7 @@ class BBSTerminalApp:
             threading.Thread(target=self._resolve_with_custom_headers, args=(url,), daemon=True).start()
         
         except Exception as e:
-            print(f"[ERROR] Deep resolve error: {e}")
+            media_log.error("Deep resolve error: %s", e)
             traceback.print_exc()
             self.master.after(0, lambda: self.track_info.config(text=f"Error: {str(e)}"))
 
@@ -5726,14 +5686,14 @@ class BBSTerminalApp:
                 self.init_audio_player()
             
             if not self.vlc_instance:
-                print("[ERROR] VLC not available")
+                media_log.error("VLC not available")
                 self.track_info.config(text="Error: VLC not available")
                 return
                 
             # Stop any current playback
             self.stop_playback()
             
-            print(f"[DEBUG] Trying direct playback of: {url}")
+            media_log.debug("Trying direct playback of: %s", url)
             
             # Create media with aggressive options
             self.current_stream = self.vlc_instance.media_new(url)
@@ -5766,13 +5726,13 @@ class BBSTerminalApp:
             self.master.after(500, self._check_playback_status)
             
         except Exception as e:
-            print(f"[ERROR] Direct play error: {e}")
+            media_log.error("Direct play error: %s", e)
             traceback.print_exc()
 
     def _resolve_with_custom_headers(self, url):
         """Resolve podcast URL with extensive custom headers."""
         try:
-            print(f"[DEBUG] Trying manual resolution of: {url}")
+            media_log.debug("Trying manual resolution of: %s", url)
             
             headers = {
                 'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36',
@@ -5793,13 +5753,13 @@ class BBSTerminalApp:
             
             # Get the final URL
             final_url = response.url
-            print(f"[DEBUG] Final URL after redirection: {final_url}")
+            media_log.debug("Final URL after redirection: %s", final_url)
             
             # Play the final URL in the main thread
             self.master.after(0, lambda: self._play_resolved_podcast(final_url))
             
         except Exception as e:
-            print(f"[ERROR] Custom header resolution error: {e}")
+            media_log.error("Custom header resolution error: %s", e)
             traceback.print_exc()
 
     def _check_playback_status(self):
@@ -5808,7 +5768,7 @@ class BBSTerminalApp:
             return
         
         state = self.player.get_state()
-        print(f"[DEBUG] Player state: {state}")
+        media_log.debug("Player state: %s", state)
         
         if state == vlc.State.Playing:
             self.track_info.config(text="Playing podcast...")
@@ -5829,11 +5789,11 @@ class BBSTerminalApp:
                 self.init_audio_player()
                 
             if not self.vlc_instance:
-                print("[ERROR] VLC not available")
+                media_log.error("VLC not available")
                 self.track_info.config(text="Error: VLC not available")
                 return
                 
-            print(f"[DEBUG] Playing resolved URL: {final_url}")
+            media_log.debug("Playing resolved URL: %s", final_url)
             
             # Create media with the resolved URL
             self.current_stream = self.vlc_instance.media_new(final_url)
@@ -5869,7 +5829,7 @@ class BBSTerminalApp:
             self.master.after(500, self._check_playback_status)
             
         except Exception as e:
-            print(f"[ERROR] Error playing resolved podcast: {e}")
+            media_log.error("Error playing resolved podcast: %s", e)
             traceback.print_exc()
             self.track_info.config(text=f"Error: {str(e)}")
 
@@ -5879,7 +5839,7 @@ class BBSTerminalApp:
             return
             
         state = event.u.new_state
-        print(f"[DEBUG] Media state changed to: {state}")
+        media_log.debug("Media state changed to: %s", state)
         
         if state == vlc.State.Error:
             self.master.after(0, lambda: self.track_info.config(text="Error playing stream"))
@@ -5927,7 +5887,7 @@ class BBSTerminalApp:
                     self.master.after(2000, self.update_media_info)
             
         except Exception as e:
-            print(f"Error updating media info: {e}")
+            media_log.error("Error updating media info: %s", e)
             # Still reschedule to keep trying
             self.master.after(2000, self.update_media_info)
 
@@ -5983,7 +5943,7 @@ class BBSTerminalApp:
                 with open("command_history.json", "r") as file:
                     return json.load(file)
         except Exception as e:
-            print(f"Error loading command history: {e}")
+            persistence_log.error("Error loading command history: %s", e)
         return []
 
     def save_command_history(self):
@@ -5992,16 +5952,15 @@ class BBSTerminalApp:
             with open("command_history.json", "w") as file:
                 json.dump(self.command_history[-100:], file)  # Keep only last 100 commands
         except Exception as e:
-            print(f"Error saving command history: {e}")
+            persistence_log.error("Error saving command history: %s", e)
 
     
 
     def deselect_all_members(self):
         """Deselect all members in the list."""
-        for child in self.members_frame.winfo_children():
-            if isinstance(child, ttk.Button):
-                child.configure(style="Bubble.TButton")
         self.selected_member = None
+        for name, button in self.member_buttons.items():
+            button.configure(style=self.member_style(name))
 
     def get_selected_member(self):
         """Return the currently selected member."""
@@ -6020,12 +5979,27 @@ class BBSTerminalApp:
             'show_password': self.show_password.get(),
             'show_messages_to_you': self.show_messages_to_you.get(),
             'bannerless_mode': self.bannerless_mode.get(),
-            'auto_logon_enabled': self.auto_logon_enabled.get()  # Add this line
+            'auto_logon_enabled': self.auto_logon_enabled.get(),  # Add this line
+            'binary_receive': self.binary_receive,
+            'chatlog_max_bytes': self.chatlog_max_bytes,
+            'chatlog_max_messages_per_user': self.chatlog_max_messages_per_user,
+            'chatlog_max_age_days': self.chatlog_max_age_days,
+            'scrollback_lines': self.scrollback_lines,
+            'scrollback_spill': self.scrollback_spill,
+            'full_screen_ansi': self.full_screen_ansi.get(),
+            'send_rate_limits': self.send_rate_limits,
+            'debug_levels': self.debug_levels,
+            'debug_log_file': self.debug_log_file
         }
     
         with open("settings.json", "w") as file:
             json.dump(settings, file)
 
+        self.chatlog_store.close()
+        self.links_store.flush()
+        self.save_presence()
+        self.state_store.close()
+
 
 
     async def cleanup(app):
@@ -6049,7 +6023,7 @@ class BBSTerminalApp:
             app.loop.stop()
             app.loop.close()
         except Exception as e:
-            print(f"Error during cleanup: {e}")
+            net_log.error("Error during cleanup: %s", e)
 
     def previous_command(self, event=None):
         """Navigate to previous command in history."""
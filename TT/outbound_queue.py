@@ -0,0 +1,139 @@
+import asyncio
+import collections
+import time
+
+from debug_log import get_logger
+
+log = get_logger("net")
+
+
+class OutboundQueue:
+    """Single ordered queue for everything written to the telnet connection.
+
+    send() may be called from any thread; lines are appended on the asyncio
+    loop and a single writer task sends whatever has queued up with one
+    write() and one drain(). rate_limits maps a command word (lowercase,
+    e.g. "/f") to the minimum number of seconds between two sends of that
+    command; a rate limited line holds back the lines queued after it so
+    the order is never changed.
+    """
+
+    def __init__(self, loop, rate_limits=None, report_interval=10.0):
+        self.loop = loop
+        self.rate_limits = {key.lower(): value for key, value in (rate_limits or {}).items()}
+        self.report_interval = report_interval
+        self.pending = collections.deque()
+        self.next_allowed = {}
+        self.writer = None
+        self.task = None
+        self.wakeup = None
+        self.sent_lines = 0
+        self.sent_batches = 0
+        self.window_latency = 0.0
+        self.window_lines = 0
+        self.max_latency = 0.0
+        self.last_report = time.monotonic()
+
+    def attach(self, writer):
+        """Start sending to writer. Must be called on the loop."""
+        if self.task:
+            self.task.cancel()
+        self.pending.clear()
+        self.next_allowed = {}
+        self.writer = writer
+        self.wakeup = asyncio.Event()
+        self.task = asyncio.ensure_future(self._run())
+
+    async def detach(self, flush=True):
+        """Stop the writer task, first writing any queued lines if flush is set."""
+        if self.task:
+            self.task.cancel()
+            try:
+                await self.task
+            except asyncio.CancelledError:
+                pass
+            self.task = None
+        if flush and self.pending and self.writer:
+            try:
+                self.writer.write("".join(text for text, _ in self.pending))
+                await self.writer.drain()
+            except Exception as e:
+                log.debug("Could not flush outbound queue: %s", e)
+        self.pending.clear()
+        self.next_allowed = {}
+        self.writer = None
+
+    def send(self, text):
+        """Queue text for sending; safe to call from any thread."""
+        self.loop.call_soon_threadsafe(self._enqueue, text, time.perf_counter())
+
+    def depth(self):
+        """Return the number of lines waiting to be sent."""
+        return len(self.pending)
+
+    def _enqueue(self, text, queued_at):
+        if not self.writer or not self.task:
+            log.debug("Dropping outbound text, not connected: %r", text)
+            return
+        self.pending.append((text, queued_at))
+        self.wakeup.set()
+
+    def _command_key(self, text):
+        word = text.split(None, 1)[0].lower() if text.strip() else ""
+        return word if word in self.rate_limits else None
+
+    def _take_batch(self):
+        """Pop the lines that may go out now; return them and how long to wait for the rest."""
+        now = time.monotonic()
+        batch = []
+        while self.pending:
+            text, queued_at = self.pending[0]
+            key = self._command_key(text)
+            if key is not None:
+                allowed = self.next_allowed.get(key, 0.0)
+                if allowed > now:
+                    return batch, allowed - now
+                self.next_allowed[key] = now + self.rate_limits[key]
+            batch.append(self.pending.popleft())
+        return batch, None
+
+    async def _run(self):
+        while True:
+            await self.wakeup.wait()
+            self.wakeup.clear()
+            batch, wait = self._take_batch()
+            if batch:
+                try:
+                    self.writer.write("".join(text for text, _ in batch))
+                    await self.writer.drain()
+                except Exception as e:
+                    log.error("Failed to send %s queued line(s): %s", len(batch), e)
+                else:
+                    self._record(batch)
+            if wait is not None:
+                self.loop.call_later(wait, self.wakeup.set)
+
+    def _record(self, batch):
+        now = time.perf_counter()
+        self.sent_batches += 1
+        for _, queued_at in batch:
+            latency = now - queued_at
+            self.sent_lines += 1
+            self.window_lines += 1
+            self.window_latency += latency
+            self.max_latency = max(self.max_latency, latency)
+        self.maybe_report()
+
+    def maybe_report(self):
+        """Print queue depth and send latency once per report interval."""
+        now = time.monotonic()
+        if now - self.last_report < self.report_interval or not self.window_lines:
+            return
+        average = self.window_latency / self.window_lines * 1000
+        log.debug("Outbound queue: %s lines, depth %s, avg latency %.1f ms, max %.1f ms, "
+                  "%s lines in %s writes total", self.window_lines, len(self.pending), average,
+                  self.max_latency * 1000, self.sent_lines, self.sent_batches)
+        self.window_lines = 0
+        self.window_latency = 0.0
+        self.max_latency = 0.0
+        self.last_report = now
@@ -0,0 +1,93 @@
+import time
+
+from debug_log import get_logger
+
+log = get_logger("persistence")
+
+# Order of the values in a persisted record; the file is a JSON object of
+# username -> list in this order, which keeps it small for busy boards
+FIELDS = ("last_seen", "last_spoke", "messages", "day", "today", "joined", "left")
+
+
+class PresenceIndex:
+    """Per-user presence and activity, fed by room banners and chat messages.
+
+    Each user has one record holding when they were last seen in a room,
+    when they last spoke, their total message count, their count for the
+    current day and the times of their last join and leave. Lookups are
+    dictionary reads, so the members panel never has to scan the chatlog.
+    """
+
+    def __init__(self):
+        self.records = {}
+        self.present = set()
+
+    def load(self, data):
+        """Restore records from the persisted {username: [values...]} form."""
+        self.records = {}
+        for username, values in (data or {}).items():
+            if isinstance(values, list) and len(values) == len(FIELDS):
+                self.records[username] = dict(zip(FIELDS, values))
+            else:
+                log.debug("Skipping malformed presence record for %s", username)
+
+    def to_json(self):
+        """Return the records in their compact persisted form."""
+        return {username: [record[field] for field in FIELDS]
+                for username, record in self.records.items()}
+
+    def _record(self, username):
+        record = self.records.get(username)
+        if record is None:
+            record = dict.fromkeys(FIELDS)
+            record["messages"] = 0
+            record["today"] = 0
+            self.records[username] = record
+        return record
+
+    def note_message(self, username, when=None):
+        """Count a chat message from username."""
+        when = time.time() if when is None else when
+        day = time.strftime("%Y-%m-%d", time.localtime(when))
+        record = self._record(username)
+        record["last_seen"] = when
+        record["last_spoke"] = when
+        record["messages"] += 1
+        if record["day"] != day:
+            record["day"] = day
+            record["today"] = 0
+        record["today"] += 1
+
+    def note_members(self, members, when=None):
+        """Record the users present in the current room; return (joined, left) sets."""
+        when = time.time() if when is None else when
+        members = set(members)
+        joined = members - self.present
+        left = self.present - members
+        for username in members:
+            self._record(username)["last_seen"] = when
+        for username in joined:
+            self.records[username]["joined"] = when
+        for username in left:
+            self._record(username)["left"] = when
+        self.present = members
+        return joined, left
+
+    def merge_last_seen(self, last_seen):
+        """Fold in a {username: timestamp} map, keeping the later time for each user."""
+        for username, when in (last_seen or {}).items():
+            if not isinstance(when, (int, float)):
+                continue
+            record = self._record(username)
+            record["last_seen"] = max(record["last_seen"] or 0, when)
+
+    def get(self, username):
+        """Return the record for username, or None if they have never been seen."""
+        return self.records.get(username)
+
+    def messages_today(self, username):
+        """Return how many messages username has sent today."""
+        record = self.records.get(username)
+        if not record or record["day"] != time.strftime("%Y-%m-%d"):
+            return 0
+        return record["today"]
@@ -0,0 +1,101 @@
+import json
+import os
+import threading
+import time
+
+from debug_log import get_logger
+
+log = get_logger("persistence")
+
+
+class StateStore:
+    """Small JSON state files, written atomically on a background thread.
+
+    update() takes a snapshot of a value and marks its file dirty; a writer
+    thread writes dirty files at most once every flush_interval seconds,
+    each to a temporary file that is then renamed over the original, so a
+    crash never leaves a truncated file behind. close() writes anything
+    still pending before returning; after that, update() writes at once.
+    """
+
+    def __init__(self, flush_interval=5.0):
+        self.flush_interval = flush_interval
+        self.pending = {}
+        self.condition = threading.Condition()
+        # Held while files are written, so a write made after close() can
+        # never be overtaken by an older snapshot still being flushed
+        self.write_lock = threading.Lock()
+        self.closed = False
+        self.last_flush = 0.0
+        self.thread = threading.Thread(target=self._run, name="StateStore", daemon=True)
+        self.thread.start()
+
+    def load(self, path, default):
+        """Read a JSON file, returning default if it is missing or unreadable."""
+        if not os.path.exists(path):
+            return default
+        try:
+            with open(path, "r") as file:
+                return json.load(file)
+        except (OSError, ValueError) as e:
+            log.error("Error loading %s: %s", path, e)
+            return default
+
+    def update(self, path, value):
+        """Schedule value to be written to path; value is copied now, not at write time."""
+        snapshot = json.dumps(value)
+        with self.condition:
+            if not self.closed:
+                self.pending[path] = snapshot
+                self.condition.notify()
+                return
+        # The writer thread is gone, e.g. during shutdown after close()
+        with self.write_lock:
+            with self.condition:
+                # An older snapshot close() has not flushed yet is superseded
+                self.pending.pop(path, None)
+            self._write(path, snapshot)
+
+    def close(self):
+        """Stop the writer thread and write whatever is still pending."""
+        with self.condition:
+            self.closed = True
+            self.condition.notify()
+        self.thread.join(timeout=5)
+        self._write_pending()
+
+    def _run(self):
+        while True:
+            with self.condition:
+                while not self.pending and not self.closed:
+                    self.condition.wait()
+                if self.closed:
+                    return
+            # Coalesce everything that arrives within the flush interval
+            delay = self.last_flush + self.flush_interval - time.monotonic()
+            if delay > 0:
+                with self.condition:
+                    self.condition.wait_for(lambda: self.closed, timeout=delay)
+                    if self.closed:
+                        return
+            self._write_pending()
+
+    def _write_pending(self):
+        with self.write_lock:
+            with self.condition:
+                pending = self.pending
+                self.pending = {}
+            for path, snapshot in pending.items():
+                self._write(path, snapshot)
+            self.last_flush = time.monotonic()
+
+    def _write(self, path, snapshot):
+        temp_path = path + ".tmp"
+        try:
+            with open(temp_path, "w") as file:
+                file.write(snapshot)
+                file.flush()
+                os.fsync(file.fileno())
+            os.replace(temp_path, path)
+        except OSError as e:
+            log.error("Error saving %s: %s", path, e)
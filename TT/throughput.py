@@ -0,0 +1,76 @@
+import time
+
+from debug_log import get_logger
+
+
+class ThroughputCounter:
+    """Accumulate processed byte counts and report a bytes/sec rate."""
+
+    def __init__(self, name, report_interval=10.0, subsystem="parse"):
+        self.name = name
+        self.log = get_logger(subsystem)
+        self.report_interval = report_interval
+        self.total_bytes = 0
+        self.total_time = 0.0
+        self.window_bytes = 0
+        self.window_time = 0.0
+        self.last_report = time.monotonic()
+
+    def add(self, nbytes, elapsed):
+        """Record nbytes processed in elapsed seconds."""
+        self.total_bytes += nbytes
+        self.total_time += elapsed
+        self.window_bytes += nbytes
+        self.window_time += elapsed
+
+    def rate(self):
+        """Return the bytes/sec rate over the whole lifetime of the counter."""
+        if self.total_time <= 0:
+            return 0.0
+        return self.total_bytes / self.total_time
+
+    def maybe_report(self, label=""):
+        """Print the rate for the current window once per report interval."""
+        now = time.monotonic()
+        if now - self.last_report < self.report_interval or not self.window_bytes:
+            return
+        window_rate = self.window_bytes / self.window_time if self.window_time > 0 else 0.0
+        suffix = f" ({label})" if label else ""
+        self.log.debug("%s%s: %s bytes/sec (%s bytes in %.4fs)", self.name, suffix,
+                       format(window_rate, ",.0f"), self.window_bytes, self.window_time)
+        self.window_bytes = 0
+        self.window_time = 0.0
+        self.last_report = now
+
+
+class LatencyCounter:
+    """Accumulate latency samples and report their average and maximum."""
+
+    def __init__(self, name, report_interval=10.0, subsystem="render"):
+        self.name = name
+        self.log = get_logger(subsystem)
+        self.report_interval = report_interval
+        self.window_total = 0.0
+        self.window_count = 0
+        self.window_max = 0.0
+        self.last_report = time.monotonic()
+
+    def add(self, elapsed):
+        """Record one latency sample of elapsed seconds."""
+        self.window_total += elapsed
+        self.window_count += 1
+        self.window_max = max(self.window_max, elapsed)
+
+    def maybe_report(self, label=""):
+        """Print the average and maximum for the current window once per report interval."""
+        now = time.monotonic()
+        if now - self.last_report < self.report_interval or not self.window_count:
+            return
+        suffix = f" ({label})" if label else ""
+        self.log.debug("%s%s: avg %.1f ms, max %.1f ms over %s samples", self.name, suffix,
+                       self.window_total / self.window_count * 1000, self.window_max * 1000,
+                       self.window_count)
+        self.window_total = 0.0
+        self.window_count = 0
+        self.window_max = 0.0
+        self.last_report = now
@@ -0,0 +1,400 @@
+import re
+
+# Classic BBS (CGA) palette for the 16 base colours
+ANSI16 = [
+    "#000000", "#aa0000", "#00aa00", "#aa5500", "#0000aa", "#aa00aa", "#00aaaa", "#aaaaaa",
+    "#555555", "#ff5555", "#55ff55", "#ffff55", "#5555ff", "#ff55ff", "#55ffff", "#ffffff",
+]
+
+
+def color_hex(color):
+    """Return the #rrggbb for a palette index (0-255) or pass a #rrggbb string through."""
+    if isinstance(color, str):
+        return color
+    if color < 16:
+        return ANSI16[color]
+    if color < 232:
+        color -= 16
+        levels = (0, 95, 135, 175, 215, 255)
+        return "#{:02x}{:02x}{:02x}".format(levels[color // 36], levels[(color // 6) % 6], levels[color % 6])
+    gray = 8 + (color - 232) * 10
+    return "#{:02x}{:02x}{:02x}".format(gray, gray, gray)
+
+
+# Cell attributes are shared tuples: (fg, bg, bold, blink, underline, reverse).
+# fg/bg are None for the default colour, a palette index, or a #rrggbb string.
+DEFAULT_ATTR = (None, None, False, False, False, False)
+
+# One token per match: CSI, other escapes, a control character, or printable text
+TOKEN_REGEX = re.compile(
+    r'\x1b\[([?>=]?)([0-9;:]*)[ -/]*([@-~])'
+    r'|\x1b\][^\x07\x1b]*(?:\x07|\x1b\\)'
+    r'|\x1b[()*+][0-9A-Za-z]'
+    r'|\x1b([^\[\]()*+])'
+    r'|([\x00-\x1a\x1c-\x1f\x7f])'
+    r'|([^\x00-\x1f\x7f]+)'
+)
+
+# A complete escape sequence starting at an ESC; used to hold back a sequence
+# split across two chunks
+ESCAPE_COMPLETE = re.compile(
+    r'\x1b(?:\[[?>=]?[0-9;:]*[ -/]*[@-~]|\][^\x07\x1b]*(?:\x07|\x1b\\)|[()*+][0-9A-Za-z]|[^\[\]()*+])'
+)
+
+
+class VTScreen:
+    """VT100/ANSI screen model: a cols x rows cell grid with a cursor.
+
+    feed() interprets cursor movement (CUU/CUD/CUF/CUB/CUP/CHA/VPA), erase
+    (ED/EL/ECH), insert/delete of lines and characters, scroll regions
+    (DECSTBM), SGR with 16, 256 and 24-bit colours, and save/restore cursor.
+    Rows touched since the last take_dirty() call are tracked so a view only
+    redraws what changed. Replies the host asked for (cursor position
+    reports) collect in responses.
+    """
+
+    def __init__(self, cols=80, rows=25):
+        self.cols = cols
+        self.rows = rows
+        self.responses = []
+        self.reset()
+
+    def reset(self):
+        """Clear the screen and return every setting to its power-on state."""
+        self.chars = [[' '] * self.cols for _ in range(self.rows)]
+        self.attrs = [[DEFAULT_ATTR] * self.cols for _ in range(self.rows)]
+        self.x = 0
+        self.y = 0
+        self.wrap_pending = False
+        self.attr = DEFAULT_ATTR
+        self.top = 0
+        self.bottom = self.rows - 1
+        self.saved = (0, 0, DEFAULT_ATTR)
+        self.pending = ""
+        self.dirty = set(range(self.rows))
+
+    def take_dirty(self):
+        """Return the sorted rows changed since the last call and forget them."""
+        dirty = sorted(self.dirty)
+        self.dirty = set()
+        return dirty
+
+    def row_runs(self, y):
+        """Return row y as a list of (text, attr) runs."""
+        chars = self.chars[y]
+        attrs = self.attrs[y]
+        runs = []
+        start = 0
+        for x in range(1, self.cols + 1):
+            if x == self.cols or attrs[x] != attrs[start]:
+                runs.append((''.join(chars[start:x]), attrs[start]))
+                start = x
+        return runs
+
+    def text(self):
+        """Return the screen contents as plain text, one line per row."""
+        return '\n'.join(''.join(row).rstrip() for row in self.chars)
+
+    def feed(self, data):
+        """Interpret a chunk of decoded terminal output."""
+        data = self.pending + data
+        self.pending = ""
+        cut = data.rfind('\x1b')
+        if cut != -1 and not ESCAPE_COMPLETE.match(data, cut) and len(data) - cut < 64:
+            self.pending = data[cut:]
+            data = data[:cut]
+
+        for match in TOKEN_REGEX.finditer(data):
+            text = match.group(6)
+            if text is not None:
+                self.print_text(text)
+                continue
+            control = match.group(5)
+            if control is not None:
+                self.control(control)
+                continue
+            final = match.group(3)
+            if final is not None:
+                self.csi(match.group(1), match.group(2), final)
+                continue
+            escape = match.group(4)
+            if escape is not None:
+                self.esc(escape)
+
+    # Output
+
+    def print_text(self, text):
+        i = 0
+        length = len(text)
+        while i < length:
+            if self.wrap_pending:
+                self.wrap_pending = False
+                self.x = 0
+                self.linefeed()
+            n = min(length - i, self.cols - self.x)
+            row = self.y
+            self.chars[row][self.x:self.x + n] = text[i:i + n]
+            self.attrs[row][self.x:self.x + n] = [self.attr] * n
+            self.dirty.add(row)
+            i += n
+            if self.x + n >= self.cols:
+                self.x = self.cols - 1
+                self.wrap_pending = True
+            else:
+                self.x += n
+
+    def control(self, char):
+        if char == '\r':
+            self.x = 0
+            self.wrap_pending = False
+        elif char in '\n\x0b\x0c':
+            self.linefeed()
+        elif char == '\b':
+            self.x = max(0, self.x - 1)
+            self.wrap_pending = False
+        elif char == '\t':
+            self.x = min(self.cols - 1, (self.x // 8 + 1) * 8)
+        # BEL and other controls are ignored
+
+    def linefeed(self):
+        self.wrap_pending = False
+        if self.y == self.bottom:
+            self.scroll_up(1)
+        elif self.y < self.rows - 1:
+            self.y += 1
+
+    def reverse_index(self):
+        self.wrap_pending = False
+        if self.y == self.top:
+            self.scroll_down(1)
+        elif self.y > 0:
+            self.y -= 1
+
+    # Erase and scroll
+
+    def erase_attr(self):
+        """Erased cells keep the current background colour (BCE), as BBS art expects."""
+        return (None, self.attr[1], False, False, False, False) if self.attr[1] is not None else DEFAULT_ATTR
+
+    def clear_cells(self, y, start, end):
+        if start >= end:
+            return
+        self.chars[y][start:end] = [' '] * (end - start)
+        self.attrs[y][start:end] = [self.erase_attr()] * (end - start)
+        self.dirty.add(y)
+
+    def blank_row(self):
+        return [' '] * self.cols, [self.erase_attr()] * self.cols
+
+    def scroll_up(self, n, top=None):
+        top = self.top if top is None else top
+        n = min(n, self.bottom - top + 1)
+        for _ in range(n):
+            del self.chars[top]
+            del self.attrs[top]
+            chars, attrs = self.blank_row()
+            self.chars.insert(self.bottom, chars)
+            self.attrs.insert(self.bottom, attrs)
+        self.dirty.update(range(top, self.bottom + 1))
+
+    def scroll_down(self, n, top=None):
+        top = self.top if top is None else top
+        n = min(n, self.bottom - top + 1)
+        for _ in range(n):
+            del self.chars[self.bottom]
+            del self.attrs[self.bottom]
+            chars, attrs = self.blank_row()
+            self.chars.insert(top, chars)
+            self.attrs.insert(top, attrs)
+        self.dirty.update(range(top, self.bottom + 1))
+
+    # Escape sequences
+
+    def esc(self, char):
+        if char == '7':
+            self.saved = (self.x, self.y, self.attr)
+        elif char == '8':
+            self.x, self.y, self.attr = self.saved
+            self.wrap_pending = False
+        elif char == 'D':
+            self.linefeed()
+        elif char == 'E':
+            self.x = 0
+            self.linefeed()
+        elif char == 'M':
+            self.reverse_index()
+        elif char == 'c':
+            self.reset()
+
+    def csi(self, private, params, final):
+        if private == '?':
+            # DEC private modes (cursor visibility, autowrap, ...) are not modelled
+            return
+        args = [int(p) if p else 0 for p in params.replace(':', ';').split(';')] if params else []
+
+        def arg(index, default=1):
+            value = args[index] if index < len(args) else 0
+            return value if value else default
+
+        if final == 'm':
+            self.sgr(args)
+            return
+
+        self.wrap_pending = False
+        if final == 'A':
+            self.y = max(self.top if self.y >= self.top else 0, self.y - arg(0))
+        elif final == 'B':
+            self.y = min(self.bottom if self.y <= self.bottom else self.rows - 1, self.y + arg(0))
+        elif final == 'C':
+            self.x = min(self.cols - 1, self.x + arg(0))
+        elif final == 'D':
+            self.x = max(0, self.x - arg(0))
+        elif final == 'E':
+            self.y = min(self.rows - 1, self.y + arg(0))
+            self.x = 0
+        elif final == 'F':
+            self.y = max(0, self.y - arg(0))
+            self.x = 0
+        elif final in 'G`':
+            self.x = min(self.cols - 1, arg(0) - 1)
+        elif final == 'd':
+            self.y = min(self.rows - 1, arg(0) - 1)
+        elif final in 'Hf':
+            self.y = min(self.rows - 1, arg(0) - 1)
+            self.x = min(self.cols - 1, arg(1) - 1)
+        elif final == 'J':
+            self.erase_display(arg(0, 0))
+        elif final == 'K':
+            self.erase_line(arg(0, 0))
+        elif final == 'X':
+            self.clear_cells(self.y, self.x, min(self.cols, self.x + arg(0)))
+        elif final == 'P':
+            self.delete_chars(arg(0))
+        elif final == '@':
+            self.insert_chars(arg(0))
+        elif final == 'L':
+            if self.top <= self.y <= self.bottom:
+                self.scroll_down(arg(0), top=self.y)
+        elif final == 'M':
+            if self.top <= self.y <= self.bottom:
+                self.scroll_up(arg(0), top=self.y)
+        elif final == 'S':
+            self.scroll_up(arg(0))
+        elif final == 'T':
+            self.scroll_down(arg(0))
+        elif final == 'r':
+            top = arg(0) - 1
+            bottom = arg(1, self.rows) - 1
+            if 0 <= top < bottom < self.rows:
+                self.top, self.bottom = top, bottom
+                self.x = self.y = 0
+        elif final == 's':
+            self.saved = (self.x, self.y, self.attr)
+        elif final == 'u':
+            self.x, self.y, self.attr = self.saved
+        elif final == 'n':
+            if arg(0, 0) == 6:
+                self.responses.append(f"\x1b[{self.y + 1};{self.x + 1}R")
+            elif arg(0, 0) == 5:
+                self.responses.append("\x1b[0n")
+
+    def erase_display(self, mode):
+        if mode == 0:
+            self.clear_cells(self.y, self.x, self.cols)
+            for y in range(self.y + 1, self.rows):
+                self.clear_cells(y, 0, self.cols)
+        elif mode == 1:
+            for y in range(self.y):
+                self.clear_cells(y, 0, self.cols)
+            self.clear_cells(self.y, 0, self.x + 1)
+        else:
+            for y in range(self.rows):
+                self.clear_cells(y, 0, self.cols)
+            # ANSI.SYS homes the cursor on a full clear and BBS screens rely on it
+            self.x = self.y = 0
+
+    def erase_line(self, mode):
+        if mode == 0:
+            self.clear_cells(self.y, self.x, self.cols)
+        elif mode == 1:
+            self.clear_cells(self.y, 0, self.x + 1)
+        else:
+            self.clear_cells(self.y, 0, self.cols)
+
+    def delete_chars(self, n):
+        n = min(n, self.cols - self.x)
+        row_chars = self.chars[self.y]
+        row_attrs = self.attrs[self.y]
+        del row_chars[self.x:self.x + n]
+        del row_attrs[self.x:self.x + n]
+        row_chars.extend([' '] * n)
+        row_attrs.extend([self.erase_attr()] * n)
+        self.dirty.add(self.y)
+
+    def insert_chars(self, n):
+        n = min(n, self.cols - self.x)
+        row_chars = self.chars[self.y]
+        row_attrs = self.attrs[self.y]
+        row_chars[self.x:self.x] = [' '] * n
+        row_attrs[self.x:self.x] = [self.erase_attr()] * n
+        del row_chars[self.cols:]
+        del row_attrs[self.cols:]
+        self.dirty.add(self.y)
+
+    def sgr(self, args):
+        fg, bg, bold, blink, underline, reverse = self.attr
+        if not args:
+            args = [0]
+        i = 0
+        while i < len(args):
+            code = args[i]
+            if code == 0:
+                fg, bg, bold, blink, underline, reverse = DEFAULT_ATTR
+            elif code == 1:
+                bold = True
+            elif code == 22:
+                bold = False
+            elif code == 4:
+                underline = True
+            elif code == 24:
+                underline = False
+            elif code in (5, 6):
+                blink = True
+            elif code == 25:
+                blink = False
+            elif code == 7:
+                reverse = True
+            elif code == 27:
+                reverse = False
+            elif 30 <= code <= 37:
+                fg = code - 30
+            elif code == 39:
+                fg = None
+            elif 40 <= code <= 47:
+                bg = code - 40
+            elif code == 49:
+                bg = None
+            elif 90 <= code <= 97:
+                fg = code - 90 + 8
+            elif 100 <= code <= 107:
+                bg = code - 100 + 8
+            elif code in (38, 48):
+                color, i = self.extended_color(args, i)
+                if color is not None:
+                    if code == 38:
+                        fg = color
+                    else:
+                        bg = color
+            i += 1
+        self.attr = (fg, bg, bold, blink, underline, reverse)
+
+    @staticmethod
+    def extended_color(args, i):
+        """Parse 38/48;5;n or 38/48;2;r;g;b starting at args[i]; return (color, last index used)."""
+        if i + 1 < len(args):
+            if args[i + 1] == 5 and i + 2 < len(args):
+                return min(args[i + 2], 255), i + 2
+            if args[i + 1] == 2 and i + 4 < len(args):
+                r, g, b = (min(v, 255) for v in args[i + 2:i + 5])
+                return "#{:02x}{:02x}{:02x}".format(r, g, b), i + 4
+        return None, len(args)
@@ -3,14 +3,12 @@ import json
 
 DEFAULT_CONFIG_FILES = {
     "chat_members.json": [],
-    "chatlog.json": {},
     "favorites.json": [],
     "frame_sizes.json": {
         "paned_pos": 200,
         "window_geometry": "800x600"
     },
-    "hyperlinks.json": [],
-    "last_seen.json": {},
+    "presence.json": {},
     "panel_sizes.json": {
         "users": 150,
         "links": 300
@@ -21,7 +19,17 @@ DEFAULT_CONFIG_FILES = {
         "logon_automation": False,
         "keep_alive": False,
         "show_messages": True,
-        "majorlink_mode": True
+        "majorlink_mode": True,
+        "binary_receive": True,
+        "chatlog_max_bytes": 1073741824,
+        "chatlog_max_messages_per_user": 0,
+        "chatlog_max_age_days": 0,
+        "scrollback_lines": 5000,
+        "scrollback_spill": False,
+        "full_screen_ansi": False,
+        "send_rate_limits": {"/f": 0.3},
+        "debug_levels": {},
+        "debug_log_file": ""
     },
     "font_settings.json": {
         "font_name": "Courier New",
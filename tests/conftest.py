@@ -0,0 +1,5 @@
+import os
+import sys
+
+# The TT modules import each other by bare name, as they do when main.py runs
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "TT"))
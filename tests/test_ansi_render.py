@@ -0,0 +1,49 @@
+import pytest
+
+from ansi_render import ansi_runs, insert_args, link_runs
+
+COLOR_MAP = {'30': 'black', '31': 'red', '32': 'green', '33': 'yellow', '34': 'blue',
+             '35': 'magenta', '36': 'cyan', '37': 'white'}
+
+BLINK_STREAM = "".join(f"\x1b[5;3{i % 8}mblink {i}\x1b[0m plain\r\n" for i in range(10000))
+
+
+def test_blink_sequences_share_one_tag():
+    tags = set()
+    for _, run_tags in ansi_runs(BLINK_STREAM, COLOR_MAP):
+        tags.update(run_tags)
+    assert tags == {"normal", "blink"} | set(COLOR_MAP.values())
+
+
+def test_blink_not_repeated_within_a_run():
+    runs = ansi_runs("\x1b[5m\x1b[5;31mx", COLOR_MAP)
+    assert runs == [("x", ("normal", "blink", "red"))]
+
+
+def test_blinking_link_keeps_blink_tag():
+    args = insert_args(link_runs(ansi_runs("\x1b[5mgo to https://example.com now", COLOR_MAP)))
+    assert args == ["go to ", ("normal", "blink"),
+                    "https://example.com", ("hyperlink", "normal", "blink"),
+                    " now", ("normal", "blink")]
+
+
+def test_tk_tag_count_constant_after_10k_blinks():
+    tk = pytest.importorskip("tkinter")
+    try:
+        root = tk.Tk()
+    except tk.TclError:
+        pytest.skip("no display")
+    try:
+        text = tk.Text(root)
+        text.tag_configure("blink")
+        before = set(text.tag_names())
+        chunk = BLINK_STREAM.split("\r\n")
+        for i in range(0, len(chunk), 500):
+            args = insert_args(link_runs(ansi_runs("\n".join(chunk[i:i + 500]), COLOR_MAP)))
+            text.insert(tk.END, *args)
+        assert set(text.tag_names()) == before | {"normal"} | set(COLOR_MAP.values())
+        # Trimming the blinking text away leaves the blink tag with no ranges
+        text.delete("1.0", tk.END)
+        assert not text.tag_ranges("blink")
+    finally:
+        root.destroy()
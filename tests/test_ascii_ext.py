@@ -0,0 +1,29 @@
+import codecs
+
+from ASCII_EXT import CP437_DECODING_TABLE, create_cp437_to_unicode_map, decode_cp437
+
+
+def old_decode_cp437(data, cp437_map):
+    """The per-byte loop decode_cp437 replaced."""
+    result = ''
+    for byte in list(data):
+        if byte in cp437_map:
+            result += cp437_map[byte]
+        else:
+            result += chr(byte)
+    return result
+
+
+def test_table_matches_old_decoding_for_every_byte():
+    cp437_map = create_cp437_to_unicode_map()
+    for byte in range(256):
+        expected = old_decode_cp437(bytes([byte]), cp437_map)
+        assert codecs.charmap_decode(bytes([byte]), 'strict', CP437_DECODING_TABLE)[0] == expected
+        assert decode_cp437(bytes([byte])) == expected
+
+
+def test_whole_chunk_matches_old_decoding():
+    cp437_map = create_cp437_to_unicode_map()
+    data = bytes(range(256)) * 16
+    assert decode_cp437(data) == old_decode_cp437(data, cp437_map)
+    assert decode_cp437(bytearray(data)) == old_decode_cp437(data, cp437_map)
@@ -0,0 +1,71 @@
+from banner_parser import parse_banner
+
+MANY_USERS = [f"user{i}@bbs{i % 7}.example.org" for i in range(60)]
+
+# Real banner shapes from the supported boards, as lists of received lines,
+# with the topic and users each must give
+GOLDEN = [
+    # MajorLink colon style
+    (["You are in the MajorLink channel.",
+      "Topic: (General chat).",
+      "Bob, Alice@Vertrauen, and Carol are here with you.",
+      ":"],
+     "General chat", ["Bob", "Alice@Vertrauen", "Carol"]),
+    (["You are in the MajorLink channel.",
+      "Topic: (Late night) Bob is here with you.",
+      ":"],
+     "Late night", ["Bob"]),
+    # PBX style, list wrapped over lines
+    (["You are in the main channel. Topic: Retro gaming.",
+      "Bob, Alice, Carol",
+      "and Dave are here with",
+      "you.",
+      "Just press ? if you need any assistance."],
+     "Retro gaming", ["Bob", "Alice", "Carol", "Dave"]),
+    # Classic teleconference
+    (["You are in Lobby.",
+      "Bob and Alice are here with you.",
+      "Just type ? for assistance."],
+     "", ["Bob", "Alice"]),
+    # Topic running straight into the list
+    (["Topic: Music talk Bob and Alice are here with you."], "Music talk", ["Bob", "Alice"]),
+    # Names with spaces and full stops
+    (["You are in the MajorLink channel. Topic: (Chat).",
+      "Mr. Smith, Dr. Who, Mary Ann and St. Elmo are here with you."],
+     "Chat", ["Mr. Smith", "Dr. Who", "Mary Ann", "St. Elmo"]),
+    (["Mr. Smith and Bob are here with you."], "", ["Mr. Smith", "Bob"]),
+    # ANSI coloured and wrapped
+    (["\x1b[1;33mYou are in the \x1b[36mMajorLink\x1b[33m channel.\x1b[0m",
+      "\x1b[32mTopic: (\x1b[1mNews\x1b[0;32m).\x1b[0m",
+      "\x1b[37mBob\x1b[0m, \x1b[37mAlice\x1b[0m and",
+      "\x1b[37mCarol@host.example.com\x1b[0m are here with you.\x1b[0m"],
+     "News", ["Bob", "Alice", "Carol@host.example.com"]),
+    # Very large room
+    (["You are in the MajorLink channel.",
+      "Topic: (Busy night).",
+      ", ".join(MANY_USERS[:20]) + ",",
+      ", ".join(MANY_USERS[20:40]) + ",",
+      ", ".join(MANY_USERS[40:59]) + ", and " + MANY_USERS[59] + " are here with you."],
+     "Busy night", MANY_USERS),
+    # No user list at all
+    (["You are in the MajorLink channel.", "Topic: (Quiet)."], "Quiet", []),
+    # Duplicate and pseudo names are dropped
+    (["Topic, Bob, Bob and Channel are here with you."], "", ["Bob"]),
+]
+
+
+def test_golden_banners():
+    for lines, topic, users in GOLDEN:
+        info = parse_banner(lines)
+        assert info.topic == topic, lines
+        assert info.users == users, lines
+
+
+def test_single_user_banner_is_here_with_you():
+    assert parse_banner(["Bob is here with you."]).users == ["Bob"]
+
+
+def test_list_split_on_oxford_and_plain_and():
+    assert parse_banner(["A1, B2, and C3 are here with you."]).users == ["A1", "B2", "C3"]
+    assert parse_banner(["A1, B2 and C3 are here with you."]).users == ["A1", "B2", "C3"]
+    assert parse_banner(["A1 and B2 are here with you."]).users == ["A1", "B2"]
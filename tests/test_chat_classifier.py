@@ -0,0 +1,154 @@
+import re
+
+from chat_classifier import classify_message, has_timestamp, is_noise
+
+# The skip and message patterns exactly as parse_and_save_chatlog_message
+# held them before the classifier existed, tried in the same flat order
+OLD_SKIP_PATTERNS = [
+    r"You are in", r"Topic:", r"Just press", r"Just type", r"assistance",
+    r"are here with you", r"is here with you", r"^\s*$",
+    r"^\s*:(?!\[).*$",
+    r"^\s*\(.*\)\s*$", r"\[Type your (?:User-ID|Password)[^]]*:\]",
+    r"Type your (?:User-ID|Password)[^]]*:",
+    r"^\[?(?:Enter|Type)(?: your)? [Pp]assword[^]]*:\]\s*$",
+    r"^\[?(?:Enter|Type)(?: your)? username[^]]*:\]\s*$",
+    r"Action listing for:", r"^>", r"^\*", r"Welcome to", r"Connected to", r"^The "
+]
+
+OLD_PATTERNS = {
+    'classic_whisper': r'^\[([^@\]]+(?:@[^\]]+)?)\s*\(whispered(?:\s+to\s+you)?\):\]\s*(.+)$',
+    'classic_direct_to_you': r'^\[([^@\]]+(?:@[^\]]+)?)\s*\(to\s+you\):\]\s*(.+)$',
+    'classic_public_direct': r'^\[([^@\]]+(?:@[^\]]+)?)\s*\(to\s+([^@\]]+(?:@[^\]]+)?)\):\]\s*(.+)$',
+    'classic_regular': r'^\[([^@\]]+(?:@[^\]]+)?):\]\s*(.+)$',
+    'colon_whisper': r'^:\s*\[([^@\]]+(?:@[^\]]+)?)\]\s*\(whispered(?:\s+to\s+you)?\):\s*(.+)$',
+    'colon_direct_to_you': r'^:\s*\[([^@\]]+(?:@[^\]]+)?)\]\s*\(to\s+you\):\s*(.+)$',
+    'colon_public_direct': r'^:\s*\[([^@\]]+(?:@[^\]]+)?)\]\s*\(to\s+([^@\]]+(?:@[^\]]+)?)\):\s*(.+)$',
+    'colon_regular': r'^:\s*\[([^@\]]+(?:@[^\]]+)?)\]:\s*(.+)$',
+    'alt_whisper': r'^From\s+([^@\(]+(?:@[^\(]+)?)\s*\(whispered\):\s*(.+)$',
+    'alt_direct_to_you': r'^From\s+([^@\(]+(?:@[^\(]+)?)\s*\(to\s+you\):\s*(.+)$',
+    'alt_public_direct': r'^From\s+([^@\(]+(?:@[^\(]+)?)\s*\(to\s+([^@\)]+(?:@[^\)]+)?)\):\s*(.+)$',
+    'alt_regular': r'^From\s+([^@:]+(?:@[^:]+)?):(?:\s*)(.+)$',
+    'pbx_whisper': r'^([^@\s]+(?:@[^\s]+)?)\s+whispers:(?:\s*)(.+)$',
+    'pbx_direct': r'^([^@\s]+(?:@[^\s]+)?)\s+says(?:\s+to\s+([^@\s:]+(?:@[^\s:]+)?)):(?:\s*)(.+)$',
+    'pbx_regular': r'^([^@\s]+(?:@[^\s]+)?)\s+says:(?:\s*)(.+)$',
+    'page_notification': r'([^@\s]+(?:@[^\s]+)?)\s+is\s+paging\s+you\s+from\s+([^:]+):(?:\s*)(.+)$'
+}
+
+
+def old_classify(line):
+    """Return (kind, msg_type, sender, recipient, body, location) the way the old handler read them.
+
+    The one deliberate difference is pbx_direct, see below.
+    """
+    if any(re.search(pattern, line, re.IGNORECASE) for pattern in OLD_SKIP_PATTERNS):
+        return "skip"
+    for msg_type, pattern in OLD_PATTERNS.items():
+        match = re.match(pattern, line)
+        if not match:
+            continue
+        sender = match.group(1).strip()
+        if 'whisper' in msg_type or 'direct_to_you' in msg_type:
+            kind = "whisper" if "whisper" in msg_type else "direct"
+            return (kind, msg_type, sender, None, match.group(2), None)
+        if 'page_notification' in msg_type:
+            return ("page", msg_type, sender, None, match.group(3), match.group(2).strip())
+        if 'public_direct' in msg_type or 'pbx_direct' in msg_type:
+            # The old handler read pbx_direct as recipient=group 1, body=group 2,
+            # dropping the message; the classifier reads the groups as they are
+            return ("public_direct", msg_type, sender, match.group(2).strip(), match.group(3), None)
+        return ("regular", msg_type, sender, None, match.group(2), None)
+    return None
+
+
+def new_classify(line):
+    if is_noise(line):
+        return "skip"
+    msg = classify_message(line)
+    return tuple(msg) if msg else None
+
+
+# Lines as they arrive from the supported boards, with what the handler
+# must make of them
+GOLDEN = [
+    ("[Bob (whispered to you):] hey there",
+     ("whisper", "classic_whisper", "Bob", None, "hey there", None)),
+    ("[Bob@Vertrauen (to you):] ping",
+     ("direct", "classic_direct_to_you", "Bob@Vertrauen", None, "ping", None)),
+    ("[Bob (to Alice):] see www.example.com",
+     ("public_direct", "classic_public_direct", "Bob", "Alice", "see www.example.com", None)),
+    ("[Bob:] hello all",
+     ("regular", "classic_regular", "Bob", None, "hello all", None)),
+    (":[Carol] (whispered): psst",
+     ("whisper", "colon_whisper", "Carol", None, "psst", None)),
+    (":[Carol] (to you): hi",
+     ("direct", "colon_direct_to_you", "Carol", None, "hi", None)),
+    (":[Carol@Realm] (to Dave): yo",
+     ("public_direct", "colon_public_direct", "Carol@Realm", "Dave", "yo", None)),
+    (":[Carol]: evening",
+     ("regular", "colon_regular", "Carol", None, "evening", None)),
+    ("From Dave (whispered): secret",
+     ("whisper", "alt_whisper", "Dave", None, "secret", None)),
+    ("From Dave (to you): question",
+     ("direct", "alt_direct_to_you", "Dave", None, "question", None)),
+    ("From Dave (to Erin): answer",
+     ("public_direct", "alt_public_direct", "Dave", "Erin", "answer", None)),
+    ("From Dave: https://example.com/x.",
+     ("regular", "alt_regular", "Dave", None, "https://example.com/x.", None)),
+    ("Erin whispers: quiet",
+     ("whisper", "pbx_whisper", "Erin", None, "quiet", None)),
+    ("Erin says to Frank: hello Frank",
+     ("public_direct", "pbx_direct", "Erin", "Frank", "hello Frank", None)),
+    ("Erin says: morning",
+     ("regular", "pbx_regular", "Erin", None, "morning", None)),
+    ("Gus is paging you from Lobby: come here",
+     ("page", "page_notification", "Gus", None, "come here", "Lobby")),
+    ("You are in the MajorLink channel.", "skip"),
+    ("Topic: (General chat).", "skip"),
+    ("Bob, Alice and Carol are here with you.", "skip"),
+    (":Connected users", "skip"),
+    ("   ", "skip"),
+    ("(Bob just left)", "skip"),
+    ("[Type your User-ID:]", "skip"),
+    ("Enter your password:]", "skip"),
+    ("Action listing for: wave", "skip"),
+    ("> menu", "skip"),
+    ("*** Notice", "skip"),
+    ("Welcome to the board", "skip"),
+    ("The room is quiet", "skip"),
+    ("random line without a sender", None),
+    ("@Bob says: hi", None),
+    ("[2024-01-02 03:04:05] From Dave: stamped", None),
+]
+
+
+def test_golden_corpus_matches_old_handler():
+    for line, expected in GOLDEN:
+        assert old_classify(line) == expected, line
+
+
+def test_golden_corpus_classifier_results():
+    for line, expected in GOLDEN:
+        assert new_classify(line) == expected, line
+
+
+def test_generated_lines_match_old_handler():
+    names = ["Bob", "Alice@Vertrauen", "x", "Mr Smith", "a@b@c"]
+    templates = [
+        "[{n}:] {m}", "[{n} (to {r}):] {m}", "[{n} (whispered):] {m}",
+        ":[{n}]: {m}", ":[{n}] (to {r}): {m}", ":[{n}] (to you): {m}",
+        "From {n}: {m}", "From {n} (to {r}): {m}", "From {n} (whispered): {m}",
+        "{n} says: {m}", "{n} says to {r}: {m}", "{n} whispers: {m}",
+        "{n} is paging you from {r}: {m}", "{n} {m}",
+    ]
+    bodies = ["hi", "a: b", "(parens)", "[brackets]", "http://x.y/z"]
+    for template in templates:
+        for name in names:
+            for recipient in names:
+                for body in bodies:
+                    line = template.format(n=name, r=recipient, m=body)
+                    assert old_classify(line) == new_classify(line), line
+
+
+def test_has_timestamp():
+    assert has_timestamp("[2024-01-02 03:04:05] From Dave: hi")
+    assert not has_timestamp("[Dave:] hi")
@@ -0,0 +1,106 @@
+import json
+import time
+
+from chatlog_store import ChatlogStore
+
+
+def open_store(tmp_path, **limits):
+    return ChatlogStore(path=str(tmp_path / "chatlog.db"),
+                        legacy_path=str(tmp_path / "chatlog.json"), **limits)
+
+
+def test_total_bytes_cap_evicts_oldest_first(tmp_path):
+    store = open_store(tmp_path, max_bytes=100)
+    for i in range(30):
+        store.append("Bob" if i % 2 else "Alice", f"message {i:02d}", created=1000.0 + i)
+    survivors = [message for _, message in store.messages()]
+    assert store.total_bytes <= 100
+    assert store.total_bytes == sum(len(m) for m in survivors)
+    # The newest messages survive, in order, and nothing newer was dropped
+    assert survivors == [f"message {i:02d}" for i in range(30 - len(survivors), 30)]
+    assert len(survivors) == 100 // len("message 00")
+    store.close()
+
+
+def test_per_user_cap_only_trims_that_user(tmp_path):
+    store = open_store(tmp_path, max_messages_per_user=3)
+    for i in range(10):
+        store.append("Bob", f"bob {i}", created=1000.0 + i)
+    store.append("Alice", "alice 0", created=999.0)
+    assert [m for _, m in store.messages("Bob")] == ["bob 7", "bob 8", "bob 9"]
+    assert [m for _, m in store.messages("Alice")] == ["alice 0"]
+    assert store.user_counts == {"Bob": 3, "Alice": 1}
+    store.close()
+
+
+def test_age_cap_drops_expired_but_keeps_unstamped(tmp_path):
+    now = time.time()
+    store = open_store(tmp_path)
+    store.append("Bob", "ancient", created=now - 10 * 86400)
+    store.append("Bob", "old", created=now - 3 * 86400)
+    store.append("Bob", "fresh", created=now - 60)
+    store.append("Alice", "no stamp", created=0.0)
+    store.set_limits(max_age_days=2)
+    assert [m for _, m in store.messages()] == ["no stamp", "fresh"]
+    assert store.user_counts == {"Bob": 1, "Alice": 1}
+    assert store.total_bytes == len("fresh") + len("no stamp")
+    store.close()
+
+
+def test_limits_applied_on_open_to_existing_log(tmp_path):
+    store = open_store(tmp_path)
+    for i in range(20):
+        store.append("Bob", f"{i:02d}", created=1000.0 + i)
+    store.close()
+
+    store = open_store(tmp_path, max_messages_per_user=5)
+    assert [m for _, m in store.messages()] == [f"{i:02d}" for i in range(15, 20)]
+    store.close()
+
+
+def test_eviction_uses_created_order_not_insert_order(tmp_path):
+    store = open_store(tmp_path, max_messages_per_user=2)
+    store.append("Bob", "newest", created=3000.0)
+    store.append("Bob", "oldest", created=1000.0)
+    store.append("Bob", "middle", created=2000.0)
+    assert [m for _, m in store.messages("Bob")] == ["middle", "newest"]
+    store.close()
+
+
+def test_totals_survive_reopen_and_migration(tmp_path):
+    with open(tmp_path / "chatlog.json", "w") as file:
+        json.dump({"Bob": ["[2024-01-01 10:00:00] From Bob: hi"],
+                   "Alice": ["[2024-01-01 09:00:00] From Alice: hey"]}, file)
+    store = open_store(tmp_path, max_bytes=10 ** 6)
+    assert store.user_counts == {"Bob": 1, "Alice": 1}
+    assert [u for u, _ in store.messages()] == ["Alice", "Bob"]
+    assert (tmp_path / "chatlog.json.bak").exists()
+    total = store.total_bytes
+    store.close()
+
+    store = open_store(tmp_path)
+    assert store.total_bytes == total
+    store.close()
+
+
+def test_interrupted_migration_imports_nothing(tmp_path, monkeypatch):
+    with open(tmp_path / "chatlog.json", "w") as file:
+        json.dump({"Bob": ["[2024-01-01 10:00:00] From Bob: hi"]}, file)
+
+    def crash(self, key, value):
+        raise RuntimeError("crashed before the migrated flag was written")
+
+    monkeypatch.setattr(ChatlogStore, "_set_meta", crash)
+    try:
+        open_store(tmp_path)
+    except RuntimeError:
+        pass
+    monkeypatch.undo()
+
+    # The next start imports the legacy log exactly once
+    store = open_store(tmp_path)
+    assert store.messages() == [("Bob", "[2024-01-01 10:00:00] From Bob: hi")]
+    store.close()
+    store = open_store(tmp_path)
+    assert len(store.messages()) == 1
+    store.close()
@@ -0,0 +1,53 @@
+from line_assembler import LineAssembler
+
+
+def feed_in_chunks(assembler, data, size):
+    lines = []
+    for i in range(0, len(data), size):
+        lines.extend(assembler.feed(data[i:i + size]))
+    return lines
+
+
+def test_newline_free_stream_is_capped():
+    assembler = LineAssembler(max_line_length=65536)
+    data = "x" * (1024 * 1024)
+    lines = feed_in_chunks(assembler, data, 4096)
+    assert all(len(line) == 65536 for line in lines)
+    assert len(lines) == 15
+    assert len(assembler.partial) == 65536
+    assert "".join(lines) + assembler.partial == data
+
+
+def test_overlong_buffered_line_then_newline():
+    assembler = LineAssembler(max_line_length=1000)
+    lines = feed_in_chunks(assembler, "y" * 2500 + "\r\nnext\r\n", 250)
+    assert lines == ["y" * 1000, "y" * 1000, "y" * 500, "next"]
+    assert assembler.partial == ""
+
+
+def test_crlf_split_across_chunks():
+    assembler = LineAssembler()
+    assert assembler.feed("first\r") == ["first"]
+    assert assembler.feed("\nsecond\r") == ["second"]
+    assert assembler.feed("\n") == []
+    assert assembler.feed("third\n") == ["third"]
+
+
+def test_mixed_line_endings_in_4k_chunks():
+    line = "a" * 100
+    data = (line + "\r\n") * 5000 + (line + "\r") * 5000 + (line + "\n") * 5000
+    assembler = LineAssembler()
+    lines = feed_in_chunks(assembler, data, 4096)
+    assert lines == [line] * 15000
+    assert assembler.partial == ""
+
+
+def test_partial_line_kept_until_terminated():
+    assembler = LineAssembler()
+    assert assembler.feed("hel") == []
+    assert assembler.feed("lo") == []
+    assert assembler.partial == "hello"
+    assert assembler.feed(" world\n") == ["hello world"]
+    assembler.feed("dropped")
+    assembler.reset()
+    assert assembler.partial == ""
@@ -0,0 +1,56 @@
+import pytest
+
+from link_extract import extract_urls, link_spans, may_contain_url, split_links, strip_trailing
+
+
+@pytest.mark.parametrize("punctuation", list('.,;:!?)') + ['"', "'", ']', '}', '...', '),', '!?'])
+def test_trailing_punctuation_stripped(punctuation):
+    assert extract_urls(f"see https://example.com/page{punctuation}") == ["https://example.com/page"]
+
+
+def test_stripped_punctuation_stays_in_text():
+    assert split_links("go to https://example.com/a. Then") == (
+        ("go to ", None),
+        ("https://example.com/a", "https://example.com/a"),
+        (". Then", None),
+    )
+
+
+def test_balanced_parentheses_kept():
+    assert extract_urls("https://en.wikipedia.org/wiki/Tk_(software)") == [
+        "https://en.wikipedia.org/wiki/Tk_(software)"]
+    assert extract_urls("(see https://en.wikipedia.org/wiki/Tk_(software))") == [
+        "https://en.wikipedia.org/wiki/Tk_(software)"]
+    assert extract_urls("(see https://example.com/x)") == ["https://example.com/x"]
+    assert extract_urls("https://example.com/f(a)(b).") == ["https://example.com/f(a)(b)"]
+
+
+def test_unbalanced_closer_stripped_before_punctuation():
+    assert strip_trailing("https://example.com/x).") == "https://example.com/x"
+    assert strip_trailing("https://example.com/(x).") == "https://example.com/(x)"
+
+
+def test_www_links_gain_scheme():
+    assert extract_urls("visit www.example.com, now") == ["http://www.example.com"]
+
+
+def test_bare_www_and_scheme_are_not_links():
+    for text in ("www.", "see www. now", "www..", "www.,", "http://", "https://."):
+        assert extract_urls(text) == [], text
+        assert link_spans(text) == [], text
+    assert split_links("see www.. now") == (("see ", None), ("www..", None), (" now", None))
+
+
+def test_query_and_fragment_kept():
+    assert extract_urls("https://example.com/a?b=c&d=e#frag.") == ["https://example.com/a?b=c&d=e#frag"]
+
+
+def test_link_spans_keep_offsets():
+    text = "  www.example.com/x, and https://a.b/c)"
+    assert [text[start:end] for start, end in link_spans(text)] == ["www.example.com/x", "https://a.b/c"]
+
+
+def test_no_url_fast_path():
+    assert not may_contain_url("plain chat line")
+    assert split_links("plain chat line") == (("plain chat line", None),)
+    assert split_links("") == ()
@@ -0,0 +1,95 @@
+import json
+
+from links_store import LinksStore
+
+
+def open_store(tmp_path):
+    return LinksStore(path=str(tmp_path / "hyperlinks.jsonl"),
+                      legacy_path=str(tmp_path / "hyperlinks.json"))
+
+
+def render_message(store, sender, message, url):
+    """What one render of a chat message does: parse it, then tag its links."""
+    store.record(url, sender, "[2024-01-01 10:00:00]", message)
+    store.ensure(url)
+
+
+def test_same_message_rendered_three_times_is_one_record(tmp_path):
+    store = open_store(tmp_path)
+    message = "look at https://example.com/a"
+    for _ in range(3):
+        render_message(store, "Bob", message, "https://example.com/a")
+    assert list(store.links) == ["https://example.com/a"]
+    record = store.links["https://example.com/a"]
+    assert record["count"] == 1
+    assert record["senders"] == ["Bob"]
+
+    store.flush()
+    reopened = open_store(tmp_path)
+    assert reopened.links == store.links
+
+
+def test_distinct_messages_are_counted(tmp_path):
+    store = open_store(tmp_path)
+    store.record("https://example.com/a", "Bob", "[2024-01-01 10:00:00]", "first https://example.com/a")
+    store.record("https://example.com/a", "Alice", "[2024-01-01 11:00:00]", "again https://example.com/a")
+    record = store.links["https://example.com/a"]
+    assert record["count"] == 2
+    assert record["senders"] == ["Bob", "Alice"]
+    assert record["first_seen"] == "[2024-01-01 10:00:00]"
+    assert record["last_seen"] == "[2024-01-01 11:00:00]"
+
+
+def test_pseudo_senders_are_not_kept(tmp_path):
+    store = open_store(tmp_path)
+    store.ensure("https://example.com/b")
+    store.record("https://example.com/c", "terminal_click")
+    store.record("https://example.com/c", "Unknown")
+    assert store.links["https://example.com/b"]["senders"] == []
+    assert store.links["https://example.com/c"]["senders"] == []
+
+
+def test_pseudo_senders_dropped_from_existing_journal(tmp_path):
+    with open(tmp_path / "hyperlinks.jsonl", "w") as file:
+        file.write(json.dumps({"url": "https://example.com/d", "first_seen": "", "last_seen": "",
+                               "count": 4, "senders": ["directed_message", "Bob", "mini_terminal"]}) + "\n")
+    store = open_store(tmp_path)
+    assert store.links["https://example.com/d"]["senders"] == ["Bob"]
+
+
+def test_recent_message_window_is_bounded(tmp_path):
+    store = LinksStore(path=str(tmp_path / "hyperlinks.jsonl"), legacy_path=None, recent_messages=2)
+    for i in range(3):
+        store.record("https://example.com/e", "Bob", None, f"message {i}")
+    assert len(store._recent_messages) == 2
+    # "message 0" has left the window, so seeing it again counts
+    store.record("https://example.com/e", "Bob", None, "message 0")
+    assert store.links["https://example.com/e"]["count"] == 4
+
+
+def test_recent_orders_by_last_sighting(tmp_path):
+    store = open_store(tmp_path)
+    store.record("https://example.com/old", "Bob", "[2024-01-01 10:00:00]", "old")
+    store.record("https://example.com/new", "Bob", "[2024-01-02 10:00:00]", "new")
+    store.record("https://example.com/old", "Alice", "[2024-01-03 10:00:00]", "old again")
+    assert [record["url"] for record in store.recent()] == [
+        "https://example.com/old", "https://example.com/new"]
+
+
+def test_page_walks_history_newest_first(tmp_path):
+    store = open_store(tmp_path)
+    for i in range(10):
+        store.record(f"https://example.com/{i}", "Bob", f"[2024-01-01 10:00:{i:02d}]", f"m{i}")
+    # Seeing an old link again moves it to the front
+    store.record("https://example.com/3", "Bob", "[2024-01-01 11:00:00]", "again")
+    urls = lambda records: [record["url"].rsplit("/", 1)[1] for record in records]
+    assert urls(store.page(0, 4)) == ["3", "9", "8", "7"]
+    assert urls(store.page(4, 4)) == ["6", "5", "4", "2"]
+    assert urls(store.page(8, 4)) == ["1", "0"]
+    assert store.page(10, 4) == []
+    assert store.recent() == store.page(0, 10)
+
+    store.flush()
+    assert urls(open_store(tmp_path).page(0, 3)) == ["3", "9", "8"]
+    store.clear()
+    assert store.page(0, 4) == []
@@ -0,0 +1,52 @@
+import pytest
+
+tk = pytest.importorskip("tkinter")
+# main needs the full Windows build environment (telnetlib3, winsound, ...)
+main = pytest.importorskip("main")
+
+from presence import PresenceIndex
+from state_store import StateStore
+
+BANNER = ["Topic: General Chat", "Alice, Bob and Carol are here with you."]
+
+
+@pytest.fixture
+def app(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    try:
+        root = tk.Tk()
+    except tk.TclError:
+        pytest.skip("no display")
+    app = main.BBSTerminalApp.__new__(main.BBSTerminalApp)
+    app.master = root
+    app.members_frame = tk.Frame(root)
+    app.panel_width = 130
+    app.chat_members = set()
+    app.member_buttons = {}
+    app.member_order = []
+    app.selected_member = None
+    app.auto_logon_enabled = tk.BooleanVar(root, value=False)
+    app.bannerless_mode = tk.BooleanVar(root, value=False)
+    app.keep_alive_enabled = tk.BooleanVar(root, value=False)
+    app.presence = PresenceIndex()
+    app.presence_save_pending = False
+    app.state_store = StateStore(flush_interval=0.01)
+    yield app
+    app.state_store.close()
+    root.destroy()
+
+
+def test_unparsed_banner_does_not_record_everyone_leaving(app):
+    app.update_chat_members(BANNER)
+    assert app.presence.get("Bob")["left"] is None
+
+    app.update_chat_members(["*** garbled banner ***"])
+    assert app.presence.get("Bob")["left"] is None
+
+
+def test_disconnect_records_everyone_leaving(app):
+    app.update_chat_members(BANNER)
+    app.clear_chat_members()
+    assert app.chat_members == {"Chatbot"}
+    assert app.presence.get("Bob")["left"] is not None
+    assert app.presence.get("Chatbot")["left"] is None
@@ -0,0 +1,59 @@
+import pytest
+
+tk = pytest.importorskip("tkinter")
+# main needs the full Windows build environment (telnetlib3, winsound, ...)
+main = pytest.importorskip("main")
+
+
+@pytest.fixture
+def app():
+    try:
+        root = tk.Tk()
+    except tk.TclError:
+        pytest.skip("no display")
+    outer = tk.Frame(root)
+    canvas = tk.Frame(outer)
+    app = main.BBSTerminalApp.__new__(main.BBSTerminalApp)
+    app.master = root
+    app.members_frame = tk.Frame(canvas)
+    app.panel_width = 130
+    app.chat_members = set()
+    app.member_buttons = {}
+    app.member_order = []
+    app.selected_member = None
+    yield app
+    root.destroy()
+
+
+def snapshot(app):
+    return {member: id(button) for member, button in app.member_buttons.items()}, \
+        [str(widget) for widget in app.members_frame.winfo_children()]
+
+
+def test_unchanged_refresh_causes_no_widget_churn(app):
+    app.chat_members = {"Bob", "alice", "Carol@Realm"}
+    app.update_members_display()
+    before = snapshot(app)
+    for _ in range(3):
+        app.chat_members = {"Bob", "alice", "Carol@Realm"}
+        app.update_members_display()
+    assert snapshot(app) == before
+
+
+def test_changed_member_only_touches_that_button(app):
+    app.chat_members = {"Bob", "alice", "Carol@Realm"}
+    app.update_members_display()
+    bob, alice = app.member_buttons["Bob"], app.member_buttons["alice"]
+
+    app.chat_members = {"Bob", "alice", "Dave"}
+    app.update_members_display()
+    assert app.member_buttons["Bob"] is bob
+    assert app.member_buttons["alice"] is alice
+    assert "Carol@Realm" not in app.member_buttons
+    assert app.member_order == ["alice", "Bob", "Dave"]
+    assert [w.cget("text") for w in app.members_frame.pack_slaves()] == ["alice", "Bob", "Dave"]
+
+
+def test_member_colour_is_stable(app):
+    assert app.member_style("Bob") == app.member_style("bob")
+    assert app.member_style("Bob", hover=True) == app.member_style("Bob").replace("Member", "MemberHover")
@@ -0,0 +1,112 @@
+import asyncio
+import time
+
+from outbound_queue import OutboundQueue
+
+
+class RecordingWriter:
+    """Stands in for the telnetlib3 writer; remembers each write and when it happened."""
+
+    def __init__(self):
+        self.writes = []
+
+    def write(self, data):
+        self.writes.append((time.monotonic(), data))
+
+    async def drain(self):
+        pass
+
+    def text(self):
+        return "".join(data for _, data in self.writes)
+
+
+def run(scenario, rate_limits=None):
+    loop = asyncio.new_event_loop()
+    try:
+        queue = OutboundQueue(loop, rate_limits)
+        return loop.run_until_complete(scenario(queue))
+    finally:
+        loop.close()
+
+
+def test_lines_are_sent_in_order():
+    async def scenario(queue):
+        writer = RecordingWriter()
+        queue.attach(writer)
+        for i in range(20):
+            queue.send(f"line {i}\r\n")
+        await asyncio.sleep(0.05)
+        await queue.detach()
+        return writer
+
+    writer = run(scenario)
+    assert writer.text() == "".join(f"line {i}\r\n" for i in range(20))
+    # Lines that queue up together go out in one write
+    assert len(writer.writes) < 20
+
+
+def test_rate_limited_command_is_spaced_and_holds_back_later_lines():
+    async def scenario(queue):
+        writer = RecordingWriter()
+        queue.attach(writer)
+        queue.send("/F Alice\r\n")
+        queue.send("/f Bob\r\n")
+        queue.send("hello\r\n")
+        await asyncio.sleep(0.05)
+        sent_early = writer.text()
+        await asyncio.sleep(0.3)
+        await queue.detach()
+        return writer, sent_early
+
+    writer, sent_early = run(scenario, {"/F": 0.2})
+    assert sent_early == "/F Alice\r\n"
+    assert writer.text() == "/F Alice\r\n/f Bob\r\nhello\r\n"
+    first, second = writer.writes[0][0], writer.writes[-1][0]
+    assert second - first >= 0.19
+
+
+def test_detach_flushes_queued_lines():
+    async def scenario(queue):
+        writer = RecordingWriter()
+        queue.attach(writer)
+        queue.send("/f Alice\r\n")
+        queue.send("/f Bob\r\n")
+        queue.send("bye\r\n")
+        await asyncio.sleep(0.05)
+        assert queue.depth() == 2
+        await queue.detach()
+        return writer
+
+    writer = run(scenario, {"/f": 60})
+    assert writer.text() == "/f Alice\r\n/f Bob\r\nbye\r\n"
+
+
+def test_detach_without_flush_discards_queued_lines():
+    async def scenario(queue):
+        writer = RecordingWriter()
+        queue.attach(writer)
+        queue.send("/f Alice\r\n")
+        queue.send("/f Bob\r\n")
+        await asyncio.sleep(0.05)
+        await queue.detach(flush=False)
+        assert queue.depth() == 0
+        return writer
+
+    writer = run(scenario, {"/f": 60})
+    assert writer.text() == "/f Alice\r\n"
+
+
+def test_send_while_disconnected_is_dropped():
+    async def scenario(queue):
+        queue.send("early\r\n")
+        await asyncio.sleep(0)
+        writer = RecordingWriter()
+        queue.attach(writer)
+        await queue.detach()
+        queue.send("late\r\n")
+        await asyncio.sleep(0)
+        assert queue.depth() == 0
+        return writer
+
+    writer = run(scenario)
+    assert writer.writes == []
@@ -0,0 +1,82 @@
+import time
+
+from presence import FIELDS, PresenceIndex
+
+
+def test_note_members_reports_joins_and_leaves():
+    index = PresenceIndex()
+    joined, left = index.note_members({"Chatbot", "Bob", "Alice"}, when=100.0)
+    assert joined == {"Chatbot", "Bob", "Alice"} and left == set()
+
+    joined, left = index.note_members(["Chatbot", "Bob", "Carol"], when=200.0)
+    assert joined == {"Carol"} and left == {"Alice"}
+    assert index.get("Alice")["left"] == 200.0
+    assert index.get("Alice")["last_seen"] == 100.0
+    assert index.get("Carol")["joined"] == 200.0
+    assert index.get("Bob")["joined"] == 100.0
+    assert index.get("Bob")["last_seen"] == 200.0
+
+    # An unchanged room is no transition
+    assert index.note_members({"Chatbot", "Bob", "Carol"}, when=300.0) == (set(), set())
+
+
+def test_disconnect_then_reconnect_records_leave_and_join():
+    index = PresenceIndex()
+    index.note_members({"Chatbot", "Bob"}, when=100.0)
+    # clear_chat_members on disconnect
+    assert index.note_members({"Chatbot"}, when=150.0) == (set(), {"Bob"})
+    assert index.get("Bob")["left"] == 150.0
+    assert index.note_members({"Chatbot", "Bob"}, when=200.0) == ({"Bob"}, set())
+    assert index.get("Bob")["joined"] == 200.0
+
+
+def test_messages_today_rolls_over_at_midnight():
+    index = PresenceIndex()
+    yesterday = time.time() - 86400
+    index.note_message("Bob", when=yesterday)
+    index.note_message("Bob", when=yesterday)
+    assert index.messages_today("Bob") == 0
+    assert index.get("Bob")["today"] == 2
+
+    index.note_message("Bob")
+    assert index.messages_today("Bob") == 1
+    assert index.get("Bob")["messages"] == 3
+    assert index.messages_today("Nobody") == 0
+
+
+def test_note_message_sets_last_spoke():
+    index = PresenceIndex()
+    index.note_message("Bob", when=123.0)
+    record = index.get("Bob")
+    assert record["last_spoke"] == 123.0
+    assert record["last_seen"] == 123.0
+    assert index.get("Alice") is None
+
+
+def test_to_json_load_round_trip():
+    index = PresenceIndex()
+    index.note_members({"Bob", "Alice"}, when=100.0)
+    index.note_message("Bob", when=150.0)
+    index.note_members({"Bob"}, when=200.0)
+    data = index.to_json()
+    assert all(len(values) == len(FIELDS) for values in data.values())
+
+    restored = PresenceIndex()
+    restored.load(data)
+    assert restored.records == index.records
+    assert restored.to_json() == data
+
+
+def test_load_skips_malformed_records():
+    index = PresenceIndex()
+    index.load({"Bob": [1, 2], "Alice": "x", "Carol": [None] * len(FIELDS)})
+    assert list(index.records) == ["Carol"]
+
+
+def test_merge_last_seen_keeps_later_time():
+    index = PresenceIndex()
+    index.note_members({"Bob"}, when=500.0)
+    index.merge_last_seen({"Bob": 100.0, "Alice": 300.0, "Carol": "bad"})
+    assert index.get("Bob")["last_seen"] == 500.0
+    assert index.get("Alice")["last_seen"] == 300.0
+    assert index.get("Carol") is None
@@ -0,0 +1,76 @@
+import json
+import os
+import threading
+import time
+
+from state_store import StateStore
+
+
+def read(path):
+    with open(path) as file:
+        return json.load(file)
+
+
+def test_update_coalesces_and_close_flushes(tmp_path):
+    path = str(tmp_path / "members.json")
+    store = StateStore(flush_interval=3600.0)
+    store.last_flush = time.monotonic()  # hold the writer back until close()
+    for i in range(5):
+        store.update(path, [i])
+    store.close()
+    assert read(path) == [4]
+    assert not os.path.exists(path + ".tmp")
+
+
+def test_update_after_close_writes_immediately(tmp_path):
+    path = str(tmp_path / "chat_members.json")
+    store = StateStore(flush_interval=0.01)
+    store.update(path, ["x", "y"])
+    store.close()
+    assert read(path) == ["x", "y"]
+
+    store.update(path, ["Chatbot"])
+    assert read(path) == ["Chatbot"]
+
+
+def test_update_snapshots_value(tmp_path):
+    path = str(tmp_path / "last_seen.json")
+    store = StateStore(flush_interval=0.01)
+    value = {"Bob": 1}
+    store.update(path, value)
+    value["Bob"] = 2
+    store.close()
+    assert read(path) == {"Bob": 1}
+
+
+def test_load_missing_or_corrupt_returns_default(tmp_path):
+    store = StateStore()
+    try:
+        assert store.load(str(tmp_path / "missing.json"), {}) == {}
+        corrupt = tmp_path / "corrupt.json"
+        corrupt.write_text("{not json")
+        assert store.load(str(corrupt), []) == []
+    finally:
+        store.close()
+
+
+def test_update_racing_close_is_not_overwritten_by_older_snapshot(tmp_path):
+    path = str(tmp_path / "chat_members.json")
+    store = StateStore(flush_interval=3600.0)
+    store.last_flush = time.monotonic()  # leave [1] pending for close()
+    store.update(path, [1])
+
+    # Hold the writes back so close() and the late update() contend for them
+    store.write_lock.acquire()
+    closer = threading.Thread(target=store.close)
+    closer.start()
+    while not store.closed:
+        time.sleep(0.001)
+    updater = threading.Thread(target=store.update, args=(path, [2]))
+    updater.start()
+    time.sleep(0.05)
+    store.write_lock.release()
+    closer.join(timeout=5)
+    updater.join(timeout=5)
+
+    assert read(path) == [2]
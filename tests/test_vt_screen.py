@@ -0,0 +1,152 @@
+from vt_screen import DEFAULT_ATTR, VTScreen, color_hex
+
+
+def row(screen, y):
+    return ''.join(screen.chars[y]).rstrip()
+
+
+def test_cup_moves_cursor_one_based_and_clamps():
+    screen = VTScreen(cols=20, rows=10)
+    screen.feed("\x1b[5;10HX")
+    assert screen.chars[4][9] == 'X'
+    screen.feed("\x1b[HY")
+    assert screen.chars[0][0] == 'Y'
+    screen.feed("\x1b[99;99HZ")
+    assert screen.chars[9][19] == 'Z'
+    screen.feed("\x1b[3;4f\x1b[2A\x1b[3C\x1b[1B\x1b[2DW")
+    assert screen.chars[1][4] == 'W'
+
+
+def test_text_wraps_at_right_margin():
+    screen = VTScreen(cols=10, rows=3)
+    screen.feed("0123456789AB")
+    assert row(screen, 0) == "0123456789"
+    assert row(screen, 1) == "AB"
+
+
+def test_full_row_then_crlf_does_not_leave_blank_line():
+    screen = VTScreen(cols=10, rows=3)
+    screen.feed("0123456789\r\nnext")
+    assert row(screen, 0) == "0123456789"
+    assert row(screen, 1) == "next"
+
+
+def test_linefeed_at_bottom_scrolls_screen():
+    screen = VTScreen(cols=10, rows=3)
+    screen.feed("a\r\nb\r\nc\r\nd")
+    assert screen.text() == "b\nc\nd"
+
+
+def test_scroll_region_only_scrolls_inside():
+    screen = VTScreen(cols=10, rows=5)
+    screen.feed("\x1b[1;1Htop\x1b[5;1Hbottom")
+    screen.feed("\x1b[2;4r")
+    assert (screen.x, screen.y) == (0, 0)
+    screen.feed("\x1b[2;1Hone\r\ntwo\r\nthree\r\nfour")
+    assert screen.text().split("\n") == ["top", "two", "three", "four", "bottom"]
+    # Reverse index at the top of the region scrolls it down
+    screen.feed("\x1b[2;1H\x1bMnew")
+    assert screen.text().split("\n") == ["top", "new", "two", "three", "bottom"]
+
+
+def test_invalid_scroll_region_ignored():
+    screen = VTScreen(cols=10, rows=5)
+    screen.feed("\x1b[4;2r")
+    assert (screen.top, screen.bottom) == (0, 4)
+
+
+def test_save_and_restore_cursor():
+    screen = VTScreen(cols=20, rows=5)
+    screen.feed("\x1b[2;3H\x1b[31m\x1b7\x1b[0m\x1b[5;5H\x1b8X")
+    assert screen.chars[1][2] == 'X'
+    assert screen.attrs[1][2][0] == 1
+    screen.feed("\x1b[3;6H\x1b[s\x1b[1;1H\x1b[uY")
+    assert screen.chars[2][5] == 'Y'
+
+
+def test_dsr_replies():
+    screen = VTScreen(cols=80, rows=25)
+    screen.feed("\x1b[12;40H\x1b[6n\x1b[5n")
+    assert screen.responses == ["\x1b[12;40R", "\x1b[0n"]
+
+
+def test_erase_display_and_line():
+    screen = VTScreen(cols=10, rows=3)
+    screen.feed("aaaaaaaaaa\r\nbbbbbbbbbb\r\ncccccccccc")
+    screen.feed("\x1b[2;5H\x1b[K")
+    assert row(screen, 1) == "bbbb"
+    screen.feed("\x1b[1K")
+    assert row(screen, 1) == ""
+    screen.feed("\x1b[2J")
+    assert screen.text() == "\n\n"
+    assert (screen.x, screen.y) == (0, 0)
+
+
+def test_erase_keeps_background_colour():
+    screen = VTScreen(cols=4, rows=1)
+    screen.feed("\x1b[44m\x1b[2J")
+    assert screen.attrs[0][0][1] == 4
+
+
+def test_sgr_colours():
+    screen = VTScreen(cols=20, rows=1)
+    screen.feed("\x1b[1;33;44mA\x1b[0mB\x1b[38;5;196mC\x1b[48;2;1;2;3mD\x1b[95mE")
+    attrs = screen.attrs[0]
+    assert attrs[0] == (3, 4, True, False, False, False)
+    assert attrs[1] == DEFAULT_ATTR
+    assert attrs[2][0] == 196
+    assert attrs[3][1] == "#010203"
+    assert attrs[4][0] == 13
+    assert color_hex(196) == "#ff0000"
+    assert color_hex(244) == "#808080"
+
+
+def test_malformed_sgr_does_not_break_the_stream():
+    screen = VTScreen(cols=20, rows=1)
+    screen.feed("\x1b[38;5mA")
+    assert screen.attrs[0][0] == DEFAULT_ATTR
+    screen.feed("\x1b[;1mB")
+    assert screen.attrs[0][1][2] is True
+    screen.feed("\x1b[0;999;31mC")
+    assert screen.attrs[0][2] == (1, None, False, False, False, False)
+    screen.feed("\x1b[38;2;300;0;999mD")
+    assert screen.attrs[0][3][0] == "#ff00ff"
+    screen.feed("\x1b[38:5:21mE\x1b[?25lF")
+    assert screen.attrs[0][4][0] == 21
+    assert row(screen, 0) == "ABCDEF"
+
+
+def test_escape_split_across_chunks():
+    screen = VTScreen(cols=20, rows=1)
+    screen.feed("x\x1b[3")
+    screen.feed("1my")
+    assert row(screen, 0) == "xy"
+    assert screen.attrs[0][1][0] == 1
+
+
+def test_dirty_rows_tracked():
+    screen = VTScreen(cols=10, rows=5)
+    screen.take_dirty()
+    screen.feed("\x1b[3;1Hhi")
+    assert screen.take_dirty() == [2]
+    assert screen.take_dirty() == []
+
+
+def test_bbs_menu_screen():
+    # A typical door/menu screen: clear, boxed title drawn with CUP, coloured
+    # options and a prompt parked with save/restore
+    screen = VTScreen(cols=40, rows=8)
+    screen.feed("\x1b[2J\x1b[1;1H\x1b[1;37;44m╔" + "═" * 38 + "╗"
+                "\x1b[2;1H║\x1b[2;15HMAIN MENU\x1b[2;40H║"
+                "\x1b[3;1H╚" + "═" * 38 + "╝\x1b[0m"
+                "\x1b[5;3H\x1b[33m[\x1b[1mC\x1b[0;33m]\x1b[0mhat"
+                "\x1b[6;3H\x1b[33m[\x1b[1mG\x1b[0;33m]\x1b[0moodbye"
+                "\x1b[8;1HChoice: \x1b[s\x1b[1;1H\x1b[u")
+    lines = screen.text().split("\n")
+    assert lines[0] == "╔" + "═" * 38 + "╗"
+    assert lines[1] == "║             MAIN MENU" + " " * 16 + "║"
+    assert lines[4] == "  [C]hat"
+    assert lines[5] == "  [G]oodbye"
+    assert lines[7] == "Choice:"
+    assert (screen.x, screen.y) == (8, 7)
+    assert screen.attrs[4][3] == (3, None, True, False, False, False)
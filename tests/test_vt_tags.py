@@ -0,0 +1,48 @@
+import pytest
+
+tk = pytest.importorskip("tkinter")
+# main needs the full Windows build environment (telnetlib3, winsound, ...)
+main = pytest.importorskip("main")
+
+from vt_screen import VTScreen
+
+
+@pytest.fixture
+def app():
+    try:
+        root = tk.Tk()
+    except tk.TclError:
+        pytest.skip("no display")
+    app = main.BBSTerminalApp.__new__(main.BBSTerminalApp)
+    app.master = root
+    app.terminal_display = tk.Text(root, bg="black", fg="white")
+    for tag in ("hyperlink", "blink"):
+        app.terminal_display.tag_configure(tag)
+    app.full_screen_ansi = tk.BooleanVar(root, value=True)
+    app.vt_screen = VTScreen(40, 10)
+    app.vt_tags = main.collections.OrderedDict()
+    app.vt_tag_counter = 0
+    app.render_scheduled = False
+    app.blink_timer_running = True
+    app.terminal_display.insert("1.0", "\n" * 9)
+    yield app
+    root.destroy()
+
+
+def test_truecolor_art_keeps_tag_count_bounded(app):
+    for i in range(3 * main.VT_TAG_LIMIT):
+        app.vt_screen.feed(f"\x1b[{i % 10 + 1};1H\x1b[38;2;{i % 256};{i // 256};0mX")
+        app.render_vt_screen()
+    vt_tags = [tag for tag in app.terminal_display.tag_names() if tag.startswith("vt_") and tag != "vt_cursor"]
+    assert len(vt_tags) <= main.VT_TAG_LIMIT
+    assert len(app.vt_tags) <= main.VT_TAG_LIMIT
+
+
+def test_reset_deletes_every_grid_tag(app):
+    app.vt_screen.feed("\x1b[31mA\x1b[32mB\x1b[33mC")
+    app.render_vt_screen()
+    assert app.vt_tags
+    app.reset_vt_tags()
+    assert not app.vt_tags
+    assert not [tag for tag in app.terminal_display.tag_names() if tag.startswith("vt_") and tag != "vt_cursor"]
+    assert app.vt_screen.dirty == set(range(10))
@@ -32,6 +32,19 @@ a = Analysis(
         ('TT/init_config.py', 'TT'),
         ('TT/ASCII_EXT.py', 'TT'),
         ('TT/image_patch.py', 'TT'),
+        ('TT/throughput.py', 'TT'),
+        ('TT/line_assembler.py', 'TT'),
+        ('TT/chat_classifier.py', 'TT'),
+        ('TT/chatlog_store.py', 'TT'),
+        ('TT/links_store.py', 'TT'),
+        ('TT/ansi_render.py', 'TT'),
+        ('TT/vt_screen.py', 'TT'),
+        ('TT/link_extract.py', 'TT'),
+        ('TT/outbound_queue.py', 'TT'),
+        ('TT/debug_log.py', 'TT'),
+        ('TT/state_store.py', 'TT'),
+        ('TT/banner_parser.py', 'TT'),
+        ('TT/presence.py', 'TT'),
     ] + vlc_data,  # Add VLC plugin data here
     hiddenimports=[
         'PIL', 'PIL._tkinter_finder', 'PIL._imaging', 'PIL.Image', 'PIL.ImageTk',